@@ -45,6 +45,9 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # Per-view query/latency metrics and Server-Timing (college_website/instrumentation.py);
+    # below AuthenticationMiddleware so the staff check happens inside the measurement
+    'college_website.instrumentation.RequestMetricsMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -53,7 +56,8 @@ ROOT_URLCONF = 'chaitanya_site.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates that also times renders and context processors
+        'BACKEND': 'college_website.instrumentation.InstrumentedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -62,17 +66,11 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
-                'college_website.context_processors.college_info',
-                'college_website.context_processors.menu_context',
-                'college_website.context_processors.menu_visibility_context',
+                # College info, navbar, header, menus, links, departments and
+                # menu visibility all come from one cached, versioned snapshot
+                'college_website.context_processors.site_chrome',
                 'college_website.context_processors.scrolling_notifications',
                 'college_website.context_processors.slider_images',
-                'college_website.context_processors.header_info',
-                'college_website.context_processors.departments_context',
-<<<<<<< HEAD
-                'college_website.context_processors.navbar_config_context',
-=======
->>>>>>> a11168e (Fix)
             ],
         },
     },
@@ -217,11 +215,18 @@ CKEDITOR_5_UPLOAD_PATH = "uploads/"
 CKEDITOR_5_UPLOAD_FILE_TYPES = ['jpeg', 'pdf', 'png']
 
 
-# Cache configuration
+# Cache configuration: one SQLite file shared by every worker on the host,
+# with a per-process LRU in front of it that picks up other workers' changes
+# within L1_SYNC_INTERVAL seconds. See college_website/cache_backends.py.
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+        'BACKEND': 'college_website.cache_backends.SQLiteCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / 'cache' / 'django_cache.sqlite3')),
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+            'L1_MAX_ENTRIES': 500,
+            'L1_SYNC_INTERVAL': float(os.getenv('CACHE_L1_SYNC_INTERVAL', '1')),  # seconds
+        },
     }
 }
 
@@ -437,6 +442,22 @@ FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 1000
 
+# Download offload to the front web server: '' (Django streams the file),
+# 'x-accel-redirect' (nginx, internal location below aliased to MEDIA_ROOT)
+# or 'x-sendfile' (Apache mod_xsendfile). See college_website/downloads.py.
+DOWNLOAD_OFFLOAD = os.getenv('DOWNLOAD_OFFLOAD', '').lower()
+DOWNLOAD_ACCEL_REDIRECT_PREFIX = os.getenv('DOWNLOAD_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+
+# Download and view counters are buffered per worker and written in batches;
+# 0 writes every increment immediately. A worker killed without a clean exit
+# loses at most this many seconds of increments. COUNTER_FLUSH_THRESHOLD may
+# also be set here to change the batch size. See college_website/counters.py.
+COUNTER_FLUSH_INTERVAL = int(os.getenv('COUNTER_FLUSH_INTERVAL', '10'))  # seconds
+
+# Anonymous full-page cache lifetime in seconds; pages are also invalidated
+# whenever a model they read changes. See college_website/page_cache.py.
+PAGE_CACHE_TIMEOUT = int(os.getenv('PAGE_CACHE_TIMEOUT', '300'))
+
 # Allowed file types for student document uploads
 STUDENT_ALLOWED_FILE_TYPES = {
     'image': ['jpg', 'jpeg', 'png', 'gif'],
@@ -5,22 +5,13 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib.sitemaps.views import sitemap
-from college_website.sitemaps import (
-    NoticeSitemap, EventSitemap, ProgramSitemap, PageSitemap
-)
-
-sitemaps = {
-    'notices': NoticeSitemap,
-    'events': EventSitemap,
-    'programs': ProgramSitemap,
-    'pages': PageSitemap,
-}
+from college_website.sitemaps import SECTION_URL_NAME, sitemap_index_view, sitemap_section_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('ckeditor5/', include('django_ckeditor_5.urls')),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
+    path('sitemap.xml', sitemap_index_view, name='sitemap_index'),
+    path('sitemap-<slug:section>.xml', sitemap_section_view, name=SECTION_URL_NAME),
     path('', include('college_website.urls')),
 ]
 
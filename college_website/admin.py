@@ -4,19 +4,16 @@ from django.http import HttpResponseRedirect, HttpResponse
 from django.contrib import messages
 from django.urls import path, reverse
 from django.shortcuts import render
+from django.db.models import Q
 from django import forms
 from adminsortable2.admin import SortableAdminMixin, SortableInlineAdminMixin
 from django_ckeditor_5.widgets import CKEditor5Widget
-<<<<<<< HEAD
-from .forms import TopUtilityBarForm, CustomLinkForm, NavbarInfoForm
-=======
 from .forms import (
-    TopUtilityBarForm, CustomLinkForm, InfrastructurePhotoForm, InfrastructurePhotoInlineForm, MultipleInfrastructurePhotoForm,
+    TopUtilityBarForm, CustomLinkForm, NavbarInfoForm, InfrastructurePhotoForm, InfrastructurePhotoInlineForm, MultipleInfrastructurePhotoForm,
     InfrastructureInfoForm, InfrastructureStatisticForm, AcademicFacilityForm, SportsFacilityForm, 
     TechnologyInfrastructureForm, StudentAmenityForm
 )
 from .academic_forms import AcademicCalendarForm, AcademicEventForm, AcademicEventInlineForm
->>>>>>> a11168e (Fix)
 from datetime import datetime, timezone, timedelta
 from .models import (
     ScrollingNotification, SliderImage, HeaderInfo, NavbarInfo, CollegeInfo, Program, Event, EventImage, Notice, SocialInitiative, 
@@ -29,7 +26,6 @@ from .models import (
     # IQAC Models
     IQACInfo, IQACReport, NAACInfo, NIRFInfo, QualityInitiative, 
     AccreditationInfo, IQACFeedback, SideMenu, SideMenuItem,
-<<<<<<< HEAD
     # Vision Mission Models
     VisionMissionContent, CoreValue,
     # History Models
@@ -55,13 +51,11 @@ from .models import (
     MenuSubmenu, MenuCategory, MenuVisibilitySettings,
     # NSS-NCC Models
     NSSNCCClub, NSSNCCNotice, NSSNCCGallery, NSSNCCAchievement,
-    HeroCarouselSlide, HeroCarouselSettings
-=======
+    HeroCarouselSlide, HeroCarouselSettings,
     # Infrastructure Models
     InfrastructureInfo, InfrastructureStatistic, AcademicFacility, SportsFacility, TechnologyInfrastructure, StudentAmenity, InfrastructurePhoto,
     # Academic Calendar Models
     AcademicCalendar, AcademicEvent
->>>>>>> a11168e (Fix)
 )
 
 
@@ -1713,11 +1707,11 @@ class MenuItemAdmin(admin.ModelAdmin):
     def make_top_level_action(self, request, queryset):
         """Make selected items top-level (remove parent)"""
         updated = 0
-        for item in queryset:
-            if item.parent:
-                item.parent = None
-                item.save()
-                updated += 1
+        # save() rewrites each moved item's subtree path in a single UPDATE
+        for item in queryset.filter(parent__isnull=False):
+            item.parent = None
+            item.save()
+            updated += 1
         
         if updated > 0:
             self.message_user(
@@ -1866,11 +1860,19 @@ class MenuItemAdmin(admin.ModelAdmin):
                 starting_order = form.cleaned_data['starting_order']
                 preserve_hierarchy = form.cleaned_data['preserve_hierarchy']
                 
+                if make_submenu_of and any(
+                    make_submenu_of.pk == item.pk or self._would_create_circular_reference(item, make_submenu_of)
+                    for item in selected_items
+                ):
+                    messages.error(request, "An item cannot be moved below itself or one of its submenus.")
+                    return HttpResponseRedirect(reverse('admin:college_website_menuitem_changelist'))
+                
                 # Perform the move operation
                 moved_count = 0
+                selected_pks = {item.pk for item in selected_items}
                 for i, item in enumerate(selected_items):
                     item.menu = target_menu
-                    if not preserve_hierarchy or not item.parent or item.parent not in selected_items:
+                    if not preserve_hierarchy or item.parent_id not in selected_pks:
                         item.parent = make_submenu_of
                     item.ordering = starting_order + i
                     item.save()
@@ -1904,7 +1906,12 @@ class MenuItemAdmin(admin.ModelAdmin):
         selected_items = MenuItem.objects.filter(id__in=selected_ids)
         
         # Get potential parent choices (exclude selected items and their descendants)
+        selected_subtrees = Q()
+        for tree_path in selected_items.values_list('tree_path', flat=True):
+            selected_subtrees |= Q(tree_path__startswith=tree_path)
         potential_parents = MenuItem.objects.filter(is_active=True).exclude(id__in=selected_ids)
+        if selected_subtrees:
+            potential_parents = potential_parents.exclude(selected_subtrees)
         
         if request.method == 'POST':
             parent_id = request.POST.get('parent')
@@ -1977,12 +1984,7 @@ class MenuItemAdmin(admin.ModelAdmin):
     
     def _would_create_circular_reference(self, item, potential_parent):
         """Check if making item a child of potential_parent would create a circular reference"""
-        current = potential_parent
-        while current:
-            if current == item:
-                return True
-            current = current.parent
-        return False
+        return potential_parent.pk == item.pk or potential_parent.is_descendant_of(item)
     
     class Media:
         css = {
@@ -0,0 +1,213 @@
+"""
+In-process prefix index for search autocomplete
+
+Titles of programs, departments, faculty, notices and pages are taken from the
+search index (see search.py) and stored as a sorted list of normalized keys,
+one per word start, so a prefix lookup is a bisect plus a short scan. Each
+worker keeps its own copy; saves patch the local copy in place and bump a
+shared version, once the transaction commits, so other workers rebuild theirs
+on their next lookup.
+"""
+
+import bisect
+import logging
+import re
+import threading
+import unicodedata
+import uuid
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import SearchDocument
+from .search import SEARCH_SOURCES
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_DOC_TYPES = ('program', 'department', 'faculty', 'notice', 'page')
+
+AUTOCOMPLETE_VERSION_KEY = 'autocomplete_version'
+
+# Lookups shorter than this return nothing; one letter matches half the site
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_LENGTH = 50
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+
+# Programs and departments are what people most often type into the navbar
+_TYPE_WEIGHT = {doc_type: weight for weight, doc_type in enumerate(AUTOCOMPLETE_DOC_TYPES)}
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def normalize_prefix(text):
+    """Lowercase, accent-free, single-spaced form used for keys and lookups"""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(_WORD_RE.findall(text.lower()))[:MAX_PREFIX_LENGTH]
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    doc_type: str
+    object_id: int
+    title: str
+    url: str
+
+    def as_dict(self):
+        source = SEARCH_SOURCES.get(self.doc_type)
+        return {
+            'title': self.title,
+            'url': self.url,
+            'type': self.doc_type,
+            'label': source.label if source else self.doc_type,
+        }
+
+
+class PrefixIndex:
+    """Sorted (key, suggestion) pairs; every word start of a title is a key"""
+
+    def __init__(self, suggestions=()):
+        self._by_object = {}
+        pairs = []
+        for suggestion in suggestions:
+            self._by_object[(suggestion.doc_type, suggestion.object_id)] = suggestion
+            pairs.extend(
+                (key, (suggestion, starts_title)) for key, starts_title in self._keys_for(suggestion.title)
+            )
+        pairs.sort(key=lambda pair: pair[0])
+        self._keys = [key for key, _ in pairs]
+        self._entries = [entry for _, entry in pairs]
+
+    @staticmethod
+    def _keys_for(title):
+        """(key, starts_title) pairs; "Department of Physics" is found by "dep", "of ph" and "phys" """
+        words = normalize_prefix(title).split(' ')
+        keys = {}
+        for position in range(len(words) - 1, -1, -1):
+            if words[position]:
+                keys[' '.join(words[position:])] = position == 0
+        return list(keys.items())
+
+    def __len__(self):
+        return len(self._by_object)
+
+    def add(self, suggestion):
+        self.remove(suggestion.doc_type, suggestion.object_id)
+        self._by_object[(suggestion.doc_type, suggestion.object_id)] = suggestion
+        for key, starts_title in self._keys_for(suggestion.title):
+            position = bisect.bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+            self._entries.insert(position, (suggestion, starts_title))
+
+    def remove(self, doc_type, object_id):
+        suggestion = self._by_object.pop((doc_type, object_id), None)
+        if suggestion is None:
+            return
+        for key, _ in self._keys_for(suggestion.title):
+            position = bisect.bisect_left(self._keys, key)
+            while position < len(self._keys) and self._keys[position] == key:
+                if self._entries[position][0] is suggestion:
+                    del self._keys[position]
+                    del self._entries[position]
+                    break
+                position += 1
+
+    def lookup(self, prefix, limit=DEFAULT_LIMIT):
+        """Best suggestions whose title has a word run starting with prefix"""
+        if len(prefix) < MIN_PREFIX_LENGTH:
+            return []
+        matches = {}
+        position = bisect.bisect_left(self._keys, prefix)
+        while position < len(self._keys) and self._keys[position].startswith(prefix):
+            suggestion, starts_title = self._entries[position]
+            # A match on the first word beats a match further into the title
+            rank = (not starts_title, _TYPE_WEIGHT.get(suggestion.doc_type, 99), len(suggestion.title))
+            key = (suggestion.doc_type, suggestion.object_id)
+            if key not in matches or rank < matches[key][0]:
+                matches[key] = (rank, suggestion)
+            position += 1
+        ranked = sorted(matches.values(), key=lambda match: (match[0], match[1].title))
+        return [suggestion for _, suggestion in ranked[:limit]]
+
+
+_lock = threading.Lock()
+_local_index = None
+_local_version = None
+
+
+def get_autocomplete_version():
+    """Get the shared autocomplete version, initialising it if missing"""
+    version = cache.get(AUTOCOMPLETE_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(AUTOCOMPLETE_VERSION_KEY, version, timeout=None):
+            version = cache.get(AUTOCOMPLETE_VERSION_KEY, version)
+    return version
+
+
+def build_prefix_index():
+    """Load titles for the autocomplete types from the search index in one query"""
+    rows = SearchDocument.objects.filter(
+        doc_type__in=AUTOCOMPLETE_DOC_TYPES
+    ).values_list('doc_type', 'object_id', 'title', 'url')
+    return PrefixIndex(Suggestion(*row) for row in rows)
+
+
+def get_prefix_index():
+    """This worker's index, rebuilt when another worker has changed the version"""
+    global _local_index, _local_version
+    version = get_autocomplete_version()
+    if _local_index is None or _local_version != version:
+        with _lock:
+            if _local_index is None or _local_version != version:
+                _local_index = build_prefix_index()
+                _local_version = version
+    return _local_index, version
+
+
+def _apply_change(change):
+    """Patch the local index and publish a new version once the change commits"""
+    # Before the commit, other workers would rebuild from the old rows and
+    # then keep them under the new version
+    transaction.on_commit(lambda: _publish_change(change))
+
+
+def _publish_change(change):
+    global _local_index, _local_version
+    with _lock:
+        # A copy that already missed another worker's change cannot be patched
+        if _local_index is not None and _local_version == cache.get(AUTOCOMPLETE_VERSION_KEY):
+            change(_local_index)
+        else:
+            _local_index = None
+        version = uuid.uuid4().hex
+        cache.set(AUTOCOMPLETE_VERSION_KEY, version, timeout=None)
+        _local_version = version
+
+
+def reset_prefix_index():
+    """Force every worker, this one included, to rebuild its index once committed"""
+    transaction.on_commit(_reset_prefix_index)
+
+
+def _reset_prefix_index():
+    global _local_index
+    with _lock:
+        _local_index = None
+        cache.set(AUTOCOMPLETE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def update_suggestion(document):
+    """Add or refresh one SearchDocument in the index"""
+    if document.doc_type in AUTOCOMPLETE_DOC_TYPES:
+        suggestion = Suggestion(document.doc_type, document.object_id, document.title, document.url)
+        _apply_change(lambda index: index.add(suggestion))
+
+
+def remove_suggestion(document):
+    """Drop one SearchDocument from the index"""
+    if document.doc_type in AUTOCOMPLETE_DOC_TYPES:
+        doc_type, object_id = document.doc_type, document.object_id
+        _apply_change(lambda index: index.remove(doc_type, object_id))
@@ -0,0 +1,11 @@
+"""
+Benchmarks for the hot public endpoints and template rendering
+
+Every scenario is timed at several dataset sizes (see load_dataset.py), with
+a cold and a warm cache, in a throwaway test database. Results give mean and
+percentile latency, queries and peak memory per scenario, and can be
+compared with a saved baseline. Run them with the run_benchmarks command.
+"""
+
+from .runner import compare, run_suite  # noqa: F401
+from .scenarios import SCENARIOS, BenchmarkError  # noqa: F401
@@ -0,0 +1,161 @@
+"""
+Timing, isolation and baseline comparison for the benchmark suite
+"""
+
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from ..instrumentation import PERCENTILES
+from ..load_dataset import clear_load_dataset, generate_load_dataset
+from .scenarios import SCENARIOS
+
+CACHE_MODES = ('cold', 'warm')
+
+# Timing differences below this are noise, whatever the relative change
+MIN_REGRESSION_MS = 1.0
+
+
+@contextmanager
+def isolated_environment():
+    """A throwaway test database, cache file and media root for the run"""
+    with tempfile.TemporaryDirectory(prefix='benchmarks-') as workdir:
+        caches = {'default': {
+            **settings.CACHES['default'],
+            'LOCATION': str(Path(workdir) / 'cache.sqlite3'),
+        }}
+        with override_settings(
+            CACHES=caches,
+            MEDIA_ROOT=workdir,
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+        ):
+            old_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            try:
+                yield
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def _percentile(ordered, percentile):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+def measure(run, iterations, warmup, cold):
+    """Time run(); a cold run starts every iteration from an empty cache"""
+    for _ in range(warmup):
+        if cold:
+            cache.clear()
+        run()
+
+    durations, queries = [], []
+    for _ in range(iterations):
+        if cold:
+            cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            run()
+            durations.append(time.perf_counter() - started)
+        queries.append(len(captured))
+
+    # Measured apart from the timings, which tracing would slow down
+    if cold:
+        cache.clear()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    ordered = sorted(durations)
+    result = {
+        'iterations': iterations,
+        'mean_ms': statistics.fmean(durations) * 1000,
+        'stdev_ms': statistics.pstdev(durations) * 1000,
+    }
+    for percentile in PERCENTILES:
+        result[f'p{percentile}_ms'] = _percentile(ordered, percentile) * 1000
+    result['queries'] = max(queries)
+    result['peak_memory_kb'] = peak / 1024
+    return result
+
+
+def result_key(scenario, scale, mode):
+    return f'{scenario}@{scale:g}/{mode}'
+
+
+def run_suite(scales, iterations=30, warmup=3, seed=0, scenario_names=None, log=None):
+    """Run the scenarios at every dataset scale; returns the JSON-ready report"""
+    log = log or (lambda message: None)
+    scenarios = [SCENARIOS[name] for name in scenario_names or SCENARIOS]
+    results = {}
+    with isolated_environment():
+        for scale in sorted(scales):
+            clear_load_dataset()
+            generate_load_dataset(scale=scale, seed=seed)
+            log(f'Dataset at scale {scale:g} ready')
+            for scenario in scenarios:
+                run = scenario.build()
+                for mode in CACHE_MODES:
+                    key = result_key(scenario.name, scale, mode)
+                    results[key] = measure(run, iterations, warmup, cold=mode == 'cold')
+                    log(format_result(key, results[key]))
+    return {
+        'meta': {
+            'created': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'platform': platform.platform(),
+            'scales': sorted(scales),
+            'seed': seed,
+            'iterations': iterations,
+            'warmup': warmup,
+        },
+        'results': results,
+    }
+
+
+def format_result(key, result):
+    percentiles = ' '.join(f"p{p} {result[f'p{p}_ms']:.1f}" for p in PERCENTILES)
+    return (
+        f"{key}: mean {result['mean_ms']:.1f}ms {percentiles}, "
+        f"{result['queries']} queries, peak {result['peak_memory_kb']:.0f} KiB"
+    )
+
+
+def compare(report, baseline, threshold):
+    """Regressions of report against baseline, as messages
+
+    Latency and memory regress when they grow by more than threshold (a
+    fraction), query counts on any increase. Results missing from either
+    side are skipped.
+    """
+    regressions = []
+    for key, result in sorted(report['results'].items()):
+        previous = baseline.get('results', {}).get(key)
+        if previous is None:
+            continue
+        for metric in ('mean_ms', 'p95_ms'):
+            if (result[metric] > previous[metric] * (1 + threshold)
+                    and result[metric] - previous[metric] >= MIN_REGRESSION_MS):
+                regressions.append(f'{key}: {metric} {previous[metric]:.1f} -> {result[metric]:.1f}')
+        if result['queries'] > previous['queries']:
+            regressions.append(f"{key}: queries {previous['queries']} -> {result['queries']}")
+        if result['peak_memory_kb'] > previous['peak_memory_kb'] * (1 + threshold):
+            regressions.append(
+                f"{key}: peak memory {previous['peak_memory_kb']:.0f} -> {result['peak_memory_kb']:.0f} KiB"
+            )
+    return regressions
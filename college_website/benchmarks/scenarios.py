@@ -0,0 +1,89 @@
+"""
+The benchmarked code paths
+
+Each scenario is built once per dataset size, after the dataset exists, and
+returns the callable timed on every iteration. Page scenarios fetch through
+the test client, so middleware and context processors are included; the
+template scenario renders base.html and the hybrid navbar directly.
+"""
+
+from dataclasses import dataclass
+from typing import Callable
+
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.base import SessionBase
+from django.template.loader import render_to_string
+from django.test import Client, RequestFactory
+from django.urls import reverse
+
+from ..models import Page
+from ..sitemaps import SECTION_URL_NAME, SITEMAPS
+
+
+class BenchmarkError(Exception):
+    """A scenario could not be run against the dataset"""
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    build: Callable[[], Callable[[], None]]
+
+
+def _fetch(path_factory):
+    def build():
+        client = Client()
+        path = path_factory()
+
+        def run():
+            response = client.get(path)
+            if response.status_code != 200:
+                raise BenchmarkError(f'GET {path} returned {response.status_code}')
+            if response.streaming:
+                b''.join(response.streaming_content)
+        return run
+    return build
+
+
+def _render_chrome():
+    factory = RequestFactory()
+
+    def run():
+        request = factory.get('/')
+        request.user = AnonymousUser()
+        request.session = SessionBase()
+        render_to_string('base.html', request=request)
+        render_to_string('includes/hybrid_navbar.html', request=request)
+    return run
+
+
+def _fetch_sitemaps():
+    client = Client()
+    paths = [reverse('sitemap_index')]
+    paths += [reverse(SECTION_URL_NAME, kwargs={'section': section}) for section in SITEMAPS]
+
+    def run():
+        for path in paths:
+            response = client.get(path)
+            if response.status_code != 200:
+                raise BenchmarkError(f'GET {path} returned {response.status_code}')
+    return run
+
+
+def _page_path():
+    slug = Page.objects.filter(is_active=True).order_by('pk').values_list('slug', flat=True).first()
+    if slug is None:
+        raise BenchmarkError('No active CMS page to render')
+    return reverse('college_website:page_detail', kwargs={'slug': slug})
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    Scenario('home', 'home_view', _fetch(lambda: reverse('college_website:home'))),
+    Scenario('chrome_templates', 'base.html and hybrid_navbar.html rendering', _render_chrome),
+    Scenario('search', 'search_view', _fetch(lambda: reverse('college_website:search') + '?q=science+research')),
+    Scenario('gallery', 'gallery_view', _fetch(lambda: reverse('college_website:gallery'))),
+    Scenario('page_detail', 'DynamicPageView', _fetch(_page_path)),
+    Scenario('publications', 'publications_view', _fetch(lambda: reverse('college_website:publications'))),
+    Scenario('sitemap', 'sitemap index and the first page of every section', _fetch_sitemaps),
+)}
@@ -0,0 +1,417 @@
+"""
+Shared SQLite cache backend with an in-process L1
+
+LocMemCache gives every worker its own cache, so an invalidation only reaches
+the worker that ran it. SQLiteCache keeps entries in one SQLite file that all
+workers on the host open (WAL mode, so readers never wait for a writer), with
+a small LRU of recently used entries in each process in front of it.
+
+Writes go straight to SQLite and drop the key from the local LRU. Each write
+also appends the key to an invalidation log in the same transaction. Before serving from its LRU, a worker reads the log entries
+added by other workers since it last looked, at most every
+L1_SYNC_INTERVAL seconds, and drops those keys. A change made in one worker
+is therefore seen by the others within that interval; 0 checks on every read.
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'college_website.cache_backends.SQLiteCache',
+            'LOCATION': BASE_DIR / 'cache' / 'django_cache.sqlite3',
+            'OPTIONS': {'MAX_ENTRIES': 20000, 'L1_MAX_ENTRIES': 500, 'L1_SYNC_INTERVAL': 1},
+        }
+    }
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS cache_entries ('
+    ' key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)',
+    'CREATE INDEX IF NOT EXISTS cache_entries_expires ON cache_entries (expires)',
+    'CREATE TABLE IF NOT EXISTS cache_invalidations ('
+    ' seq INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT, origin TEXT NOT NULL, created REAL NOT NULL)',
+)
+
+# Logged in place of a key when the whole cache is cleared
+CLEAR_ALL = None
+
+DEFAULT_L1_MAX_ENTRIES = 500
+DEFAULT_L1_SYNC_INTERVAL = 1
+DEFAULT_BUSY_TIMEOUT = 5
+# Culling and log pruning run once every this many writes per process
+MAINTENANCE_EVERY = 200
+# Invalidations older than this are pruned; a worker idle for longer clears its LRU
+INVALIDATION_RETENTION = 60 * 10
+
+SQLITE_MAX_VARIABLES = 900
+
+
+class SQLiteCache(BaseCache):
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._path = Path(location)
+        self._l1_max_entries = int(options.get('L1_MAX_ENTRIES', DEFAULT_L1_MAX_ENTRIES))
+        self._sync_interval = float(options.get('L1_SYNC_INTERVAL', DEFAULT_L1_SYNC_INTERVAL))
+        self._busy_timeout = float(options.get('BUSY_TIMEOUT', DEFAULT_BUSY_TIMEOUT))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._reset_process_state()
+
+    def _reset_process_state(self):
+        """Start afresh in a new process (also after a fork)"""
+        self._pid = os.getpid()
+        self._origin = uuid.uuid4().hex
+        self._l1 = OrderedDict()
+        # Bumped whenever entries are written or dropped, so a read that raced
+        # with a change does not put what it fetched into the LRU
+        self._l1_generation = 0
+        self._last_seq = None
+        self._synced_at = float('-inf')
+        self._writes = 0
+        self._local = threading.local()
+
+    # Connections
+
+    def _connection(self):
+        if os.getpid() != self._pid:
+            with self._lock:
+                if os.getpid() != self._pid:
+                    self._reset_process_state()
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, timeout=self._busy_timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            for statement in SCHEMA:
+                conn.execute(statement)
+            self._local.conn = conn
+        return conn
+
+    def _write(self, callback):
+        """Run callback(conn) in a write transaction; returns its result"""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            result = callback(conn)
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        self._writes += 1
+        if self._writes % MAINTENANCE_EVERY == 0:
+            self._maintain()
+        return result
+
+    def _log(self, conn, keys):
+        conn.executemany(
+            'INSERT INTO cache_invalidations (key, origin, created) VALUES (?, ?, ?)',
+            [(key, self._origin, time.time()) for key in keys],
+        )
+
+    # L1
+
+    def _sync(self):
+        """Drop LRU entries that other workers have written since the last check"""
+        now = time.monotonic()
+        if now - self._synced_at < self._sync_interval:
+            return
+        conn = self._connection()
+        with self._lock:
+            last_seq = self._last_seq
+        if last_seq is None:
+            row = conn.execute('SELECT MAX(seq) FROM cache_invalidations').fetchone()
+            with self._lock:
+                self._last_seq = row[0] or 0
+                self._synced_at = now
+            return
+        rows = conn.execute(
+            'SELECT seq, key, origin FROM cache_invalidations WHERE seq > ? ORDER BY seq',
+            (last_seq,),
+        ).fetchall()
+        with self._lock:
+            if self._last_seq != last_seq:
+                # Another thread synced meanwhile
+                return
+            if rows:
+                self._l1_generation += 1
+            if rows and rows[0][0] != last_seq + 1:
+                # Entries we never saw were pruned; nothing in the LRU can be trusted
+                self._l1.clear()
+            for seq, key, origin in rows:
+                if origin == self._origin:
+                    continue
+                if key is CLEAR_ALL:
+                    self._l1.clear()
+                else:
+                    self._l1.pop(key, None)
+            if rows:
+                self._last_seq = rows[-1][0]
+            self._synced_at = now
+
+    def _l1_get(self, key):
+        """Pickled value from the LRU, or None"""
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return None
+            expires, pickled = entry
+            if expires is not None and expires <= time.time():
+                del self._l1[key]
+                return None
+            self._l1.move_to_end(key)
+            return pickled
+
+    def _l1_set(self, entries, generation):
+        """Store {key: (pickled, expires)} unless the LRU changed since generation"""
+        if not self._l1_max_entries:
+            return
+        with self._lock:
+            if generation != self._l1_generation:
+                return
+            for key, (pickled, expires) in entries.items():
+                self._l1[key] = (expires, pickled)
+                self._l1.move_to_end(key)
+            while len(self._l1) > self._l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def _l1_delete(self, keys):
+        with self._lock:
+            self._l1_generation += 1
+            for key in keys:
+                self._l1.pop(key, None)
+
+    # Reads
+
+    def _fetch(self, keys):
+        """{key: (pickled, expires)} for the live entries among keys"""
+        conn = self._connection()
+        now = time.time()
+        found = {}
+        for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+            chunk = keys[start:start + SQLITE_MAX_VARIABLES]
+            rows = conn.execute(
+                f"SELECT key, value, expires FROM cache_entries WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for key, pickled, expires in rows:
+                if expires is None or expires > now:
+                    found[key] = (pickled, expires)
+        return found
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        result = self._get_many_pickled([key])
+        if key not in result:
+            return default
+        return pickle.loads(result[key])
+
+    def get_many(self, keys, version=None):
+        key_map = {self.make_and_validate_key(key, version=version): key for key in keys}
+        result = self._get_many_pickled(list(key_map))
+        return {key_map[key]: pickle.loads(pickled) for key, pickled in result.items()}
+
+    def _get_many_pickled(self, keys):
+        self._sync()
+        result, missing = {}, []
+        for key in keys:
+            pickled = self._l1_get(key)
+            if pickled is None:
+                missing.append(key)
+            else:
+                result[key] = pickled
+        if missing:
+            with self._lock:
+                generation = self._l1_generation
+            found = self._fetch(missing)
+            self._l1_set(found, generation)
+            result.update((key, pickled) for key, (pickled, _) in found.items())
+        return result
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return bool(self._get_many_pickled([key]))
+
+    # Writes
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._set_many_pickled({key: pickle.dumps(value, self.pickle_protocol)}, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        pickled = {
+            self.make_and_validate_key(key, version=version): pickle.dumps(value, self.pickle_protocol)
+            for key, value in data.items()
+        }
+        self._set_many_pickled(pickled, timeout)
+        return []
+
+    def _set_many_pickled(self, pickled, timeout):
+        expires = self.get_backend_timeout(timeout)
+        if expires is not None and expires <= time.time():
+            self._delete_many(list(pickled))
+            return
+
+        def write(conn):
+            conn.executemany(
+                'INSERT OR REPLACE INTO cache_entries (key, value, expires) VALUES (?, ?, ?)',
+                [(key, value, expires) for key, value in pickled.items()],
+            )
+            self._log(conn, pickled)
+
+        self._write(write)
+        self._l1_delete(pickled)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        expires = self.get_backend_timeout(timeout)
+
+        def write(conn):
+            conn.execute(
+                'DELETE FROM cache_entries WHERE key = ? AND expires IS NOT NULL AND expires <= ?',
+                (key, time.time()),
+            )
+            added = conn.execute(
+                'INSERT OR IGNORE INTO cache_entries (key, value, expires) VALUES (?, ?, ?)',
+                (key, pickled, expires),
+            ).rowcount == 1
+            if added:
+                self._log(conn, [key])
+            return added
+
+        added = self._write(write)
+        if added:
+            self._l1_delete([key])
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        expires = self.get_backend_timeout(timeout)
+
+        def write(conn):
+            touched = conn.execute(
+                'UPDATE cache_entries SET expires = ? WHERE key = ? AND (expires IS NULL OR expires > ?)',
+                (expires, key, time.time()),
+            ).rowcount == 1
+            if touched:
+                self._log(conn, [key])
+            return touched
+
+        touched = self._write(write)
+        self._l1_delete([key])
+        return touched
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+
+        def write(conn):
+            row = conn.execute(
+                'SELECT value FROM cache_entries WHERE key = ? AND (expires IS NULL OR expires > ?)',
+                (key, time.time()),
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Key '{key}' not found")
+            new_value = pickle.loads(row[0]) + delta
+            pickled = pickle.dumps(new_value, self.pickle_protocol)
+            conn.execute('UPDATE cache_entries SET value = ? WHERE key = ?', (pickled, key))
+            self._log(conn, [key])
+            return new_value
+
+        new_value = self._write(write)
+        self._l1_delete([key])
+        return new_value
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._delete_many([key])
+
+    def delete_many(self, keys, version=None):
+        self._delete_many([self.make_and_validate_key(key, version=version) for key in keys])
+
+    def _delete_many(self, keys):
+        if not keys:
+            return False
+
+        def write(conn):
+            deleted = 0
+            for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                chunk = keys[start:start + SQLITE_MAX_VARIABLES]
+                deleted += conn.execute(
+                    f"DELETE FROM cache_entries WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).rowcount
+            self._log(conn, keys)
+            return deleted > 0
+
+        deleted = self._write(write)
+        self._l1_delete(keys)
+        return deleted
+
+    def clear(self):
+        def write(conn):
+            conn.execute('DELETE FROM cache_entries')
+            self._log(conn, [CLEAR_ALL])
+
+        self._write(write)
+        with self._lock:
+            self._l1_generation += 1
+            self._l1.clear()
+
+    # Housekeeping
+
+    def _maintain(self):
+        """Remove expired entries, cull past MAX_ENTRIES and prune the invalidation log"""
+        conn = self._connection()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('DELETE FROM cache_entries WHERE expires IS NOT NULL AND expires <= ?', (now,))
+            count = conn.execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0]
+            culled = []
+            if count > self._max_entries:
+                if self._cull_frequency == 0:
+                    conn.execute('DELETE FROM cache_entries')
+                    culled = [CLEAR_ALL]
+                else:
+                    # Entries closest to expiry go first, then the oldest rows
+                    culled = [row[0] for row in conn.execute(
+                        'DELETE FROM cache_entries WHERE rowid IN ('
+                        ' SELECT rowid FROM cache_entries'
+                        ' ORDER BY expires IS NULL, expires, rowid LIMIT ?)'
+                        ' RETURNING key',
+                        (count // self._cull_frequency,),
+                    ).fetchall()]
+                # Other workers would otherwise keep serving culled keys from their LRU
+                self._log(conn, culled)
+            # The newest row stays so workers can tell they missed pruned ones
+            conn.execute(
+                'DELETE FROM cache_invalidations WHERE created < ?'
+                ' AND seq < (SELECT MAX(seq) FROM cache_invalidations)',
+                (now - INVALIDATION_RETENTION,),
+            )
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        if culled == [CLEAR_ALL]:
+            with self._lock:
+                self._l1_generation += 1
+                self._l1.clear()
+        elif culled:
+            self._l1_delete(culled)
+
+    def close(self, **kwargs):
+        # Connections are per thread and reused across requests
+        pass
@@ -0,0 +1,128 @@
+"""
+Stampede-protected cached values
+
+When a popular cached value expires, every request that misses rebuilds it at
+once. cached_value() stores the value with its soft expiry and the time the
+last build took, and avoids that in three ways:
+
+* single flight: only the request holding a short cache lock rebuilds; the
+  others wait for its result instead of running the same queries,
+* early expiration: shortly before the soft expiry each reader may decide
+  to rebuild, with a probability that rises as expiry nears and with the
+  cost of the build (the "XFetch" rule), so one request usually refreshes
+  the value before anyone misses,
+* stale-while-revalidate: with stale_timeout, an expired value is kept that
+  much longer and served while the lock holder rebuilds it.
+
+Deleting the key (e.g. from a signal handler) still invalidates immediately;
+the next read takes the single-flight path.
+"""
+
+import functools
+import logging
+import math
+import random
+import time
+import uuid
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = '{key}:rebuild_lock'
+
+DEFAULT_LOCK_TIMEOUT = 30
+DEFAULT_BETA = 1.0
+# How often a request waiting for another's rebuild checks for the result
+WAIT_INTERVAL = 0.05
+
+
+def _is_fresh(expires, delta, beta):
+    """XFetch: fresh until a random point before expiry, earlier for slow builds"""
+    return time.time() - delta * beta * math.log(1.0 - random.random()) < expires
+
+
+def _rebuild(key, build, timeout, stale_timeout):
+    started = time.monotonic()
+    value = build()
+    delta = time.monotonic() - started
+    cache.set(key, (value, time.time() + timeout, delta), timeout + (stale_timeout or 0))
+    return value
+
+
+def _acquire(lock_key, lock_timeout):
+    token = uuid.uuid4().hex
+    return token if cache.add(lock_key, token, lock_timeout) else None
+
+
+def _release(lock_key, token):
+    if cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
+def cached_value(key, build, timeout, stale_timeout=None, beta=DEFAULT_BETA, lock_timeout=DEFAULT_LOCK_TIMEOUT):
+    """Cached result of build(), rebuilt by one request at a time
+
+    timeout is the soft lifetime of the value. With stale_timeout, the value
+    may be served for that many seconds past it while it is being rebuilt.
+    beta > 1 favours earlier refreshes, 0 turns early expiration off.
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        value, expires, delta = entry
+        if _is_fresh(expires, delta, beta):
+            return value
+        token = _acquire(LOCK_KEY.format(key=key), lock_timeout)
+        if token is None:
+            if time.time() < expires or stale_timeout:
+                # Still valid, or stale but allowed: someone else is refreshing
+                return value
+        else:
+            try:
+                return _rebuild(key, build, timeout, stale_timeout)
+            finally:
+                _release(LOCK_KEY.format(key=key), token)
+
+    lock_key = LOCK_KEY.format(key=key)
+    deadline = time.monotonic() + lock_timeout
+    while True:
+        token = _acquire(lock_key, lock_timeout)
+        if token is not None:
+            try:
+                return _rebuild(key, build, timeout, stale_timeout)
+            finally:
+                _release(lock_key, token)
+        if time.monotonic() >= deadline:
+            logger.warning(f"Gave up waiting for another rebuild of {key}, building it here")
+            return build()
+        time.sleep(WAIT_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None and time.time() < entry[1]:
+            return entry[0]
+
+
+def cache_single_flight(key, timeout, stale_timeout=None, beta=DEFAULT_BETA, lock_timeout=DEFAULT_LOCK_TIMEOUT):
+    """Decorator caching a function's result under key with cached_value()
+
+    Positional arguments are appended to the key. The wrapper's invalidate()
+    deletes the cached value for the given arguments:
+
+        @cache_single_flight('active_utility_bar', timeout=3600, stale_timeout=300)
+        def get_active_utility_bar(): ...
+
+        get_active_utility_bar.invalidate()
+    """
+    def decorator(func):
+        def make_key(args):
+            return ':'.join([key, *map(str, args)])
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            return cached_value(
+                make_key(args), lambda: func(*args), timeout,
+                stale_timeout=stale_timeout, beta=beta, lock_timeout=lock_timeout,
+            )
+
+        wrapper.invalidate = lambda *args: cache.delete(make_key(args))
+        return wrapper
+    return decorator
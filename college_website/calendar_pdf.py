@@ -0,0 +1,249 @@
+"""
+Generated academic calendar PDFs
+
+Calendars without an uploaded PDF get one rendered from their events with
+ReportLab. Rendering is slow, so the result is stored as a file whose name is
+stamped with everything the document depends on: the calendar, the newest
+updated_at of the calendar and its events, the number of events (so deletions
+count) and the college info shown in the header. Downloads serve that file
+through downloads.serve_file, and saving a calendar or event re-renders it on
+a background thread once the transaction commits.
+"""
+
+import hashlib
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections
+from django.db.models import Count, Max
+
+from .site_chrome import get_site_chrome
+
+logger = logging.getLogger(__name__)
+
+GENERATED_PDF_DIR = 'academic_calendars/generated'
+
+SEMESTER_SECTIONS = (
+    ('First Semester (July - December)', ('first', 'both')),
+    ('Second Semester (January - June)', ('second', 'both')),
+)
+
+
+@dataclass(frozen=True)
+class CalendarPDF:
+    """A stored, generated PDF for one calendar version"""
+    name: str
+    etag: str
+
+
+def get_calendar_pdf_stamp(calendar):
+    """Hash of everything the generated document depends on, in one query"""
+    events = calendar.events.aggregate(latest=Max('updated_at'), total=Count('id'))
+    latest = max(filter(None, (calendar.updated_at, events['latest'])))
+    college_info = get_site_chrome().college_info
+    parts = (
+        calendar.pk,
+        latest.isoformat(),
+        events['total'],
+        college_info.updated_at.isoformat() if getattr(college_info, 'updated_at', None) else '',
+    )
+    return hashlib.sha1(':'.join(map(str, parts)).encode()).hexdigest()[:16]
+
+
+def _pdf_prefix(calendar_id):
+    return f"calendar-{calendar_id}-"
+
+
+def _pdf_name(calendar_id, stamp):
+    return f"{GENERATED_PDF_DIR}/{_pdf_prefix(calendar_id)}{stamp}.pdf"
+
+
+def _remove_stale_pdfs(calendar_id, keep=None):
+    """Delete older generated files for a calendar"""
+    try:
+        _, files = default_storage.listdir(GENERATED_PDF_DIR)
+    except (FileNotFoundError, NotImplementedError):
+        return
+    for filename in files:
+        name = f"{GENERATED_PDF_DIR}/{filename}"
+        if filename.startswith(_pdf_prefix(calendar_id)) and name != keep:
+            default_storage.delete(name)
+
+
+def render_academic_calendar_pdf(calendar):
+    """Render the calendar and its published events to PDF bytes"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+
+    college_info = get_site_chrome().college_info
+
+    # One query, grouped by semester and month in a single pass; dicts keep
+    # the start_date ordering of the queryset
+    sections = [{} for _ in SEMESTER_SECTIONS]
+    events = calendar.events.filter(is_published=True).order_by('start_date', 'ordering')
+    for event in events:
+        month_key = event.start_date.strftime('%B %Y')
+        for months, (_, semesters) in zip(sections, SEMESTER_SECTIONS):
+            if event.semester in semesters:
+                months.setdefault(month_key, []).append(event)
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.darkblue
+    )
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=colors.darkblue
+    )
+    subheading_style = ParagraphStyle(
+        'CustomSubHeading',
+        parent=styles['Heading3'],
+        fontSize=14,
+        spaceAfter=8,
+        textColor=colors.darkgreen
+    )
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6
+    )
+    table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+    story = []
+    story.append(Paragraph(calendar.title, title_style))
+    story.append(Paragraph(f"{college_info.name}", styles['Heading2']))
+    story.append(Paragraph(f"Academic Year: {calendar.academic_year}", styles['Heading3']))
+    if calendar.description:
+        story.append(Paragraph(calendar.description, normal_style))
+    story.append(Spacer(1, 20))
+
+    for months, (heading, _) in zip(sections, SEMESTER_SECTIONS):
+        if months:
+            story.append(Paragraph(heading, heading_style))
+            story.append(Spacer(1, 10))
+
+            for month, month_events in months.items():
+                story.append(Paragraph(month, subheading_style))
+
+                table_data = [['Date', 'Event', 'Type']]
+                for event in month_events:
+                    date_str = event.start_date.strftime('%d %b')
+                    if event.end_date and event.end_date != event.start_date:
+                        date_str += f" - {event.end_date.strftime('%d %b')}"
+                    table_data.append([date_str, event.title, event.get_event_type_display()])
+
+                table = Table(table_data, colWidths=[1*inch, 3.5*inch, 1*inch])
+                table.setStyle(table_style)
+                story.append(table)
+                story.append(Spacer(1, 10))
+
+        story.append(PageBreak())
+
+    # Important Notes
+    story.append(Paragraph("Important Notes", heading_style))
+    story.append(Spacer(1, 10))
+
+    notes = [
+        "• All dates are subject to change. Please check with the administration for updates.",
+        "• Examination schedules will be published separately before each semester.",
+        "• Holiday dates may vary based on government notifications.",
+        "• For any queries regarding the academic calendar, contact the academic office.",
+        f"• Contact: {college_info.phone} | Email: {college_info.email}"
+    ]
+    for note in notes:
+        story.append(Paragraph(note, normal_style))
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
+_generate_lock = threading.Lock()
+
+
+def get_calendar_pdf(calendar, generate=True):
+    """The stored PDF for the calendar's current version
+
+    Renders and stores it when missing, unless generate is False, in which
+    case None is returned.
+    """
+    stamp = get_calendar_pdf_stamp(calendar)
+    name = _pdf_name(calendar.pk, stamp)
+    if not default_storage.exists(name):
+        if not generate:
+            return None
+        with _generate_lock:
+            # The background worker may have finished while we waited
+            if not default_storage.exists(name):
+                content = render_academic_calendar_pdf(calendar)
+                saved_name = default_storage.save(name, ContentFile(content))
+                if saved_name != name:
+                    # Lost a race with another process; keep the first copy
+                    default_storage.delete(saved_name)
+                _remove_stale_pdfs(calendar.pk, keep=name)
+    return CalendarPDF(name=name, etag=f'"{stamp}"')
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='calendar-pdf')
+    return _executor
+
+
+def _regenerate(calendar_id):
+    from .models import AcademicCalendar
+
+    close_old_connections()
+    try:
+        calendar = AcademicCalendar.objects.filter(pk=calendar_id).first()
+        if calendar is None:
+            _remove_stale_pdfs(calendar_id)
+        elif calendar.pdf_file:
+            # Uploaded files are served instead; generated copies are unused
+            _remove_stale_pdfs(calendar_id)
+        else:
+            get_calendar_pdf(calendar)
+    except Exception as e:
+        logger.error(f"Error generating PDF for academic calendar {calendar_id}: {e}")
+    finally:
+        close_old_connections()
+
+
+def schedule_calendar_pdf(calendar_id):
+    """Re-render a calendar's PDF on the background worker"""
+    _get_executor().submit(_regenerate, calendar_id)
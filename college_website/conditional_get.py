@@ -0,0 +1,106 @@
+"""
+Conditional GET for detail pages
+
+@conditional_detail answers If-None-Match / If-Modified-Since with a 304
+before the view runs, for anonymous GET/HEAD requests (the same ones the
+page cache serves). The validator takes a single query: the object's
+updated_at, plus the latest updated_at and the row count of each related
+path rendered with it, such as a gallery's photos or a page's blocks. Row
+counts catch deletions. The site chrome and side menu versions, the
+fragment generations of the models the context processors put on every page
+(scrolling notifications, slider images) and of any models the page also
+lists are folded into the ETag, as is the next schedule boundary of the
+scrolling notifications and slides, so the ETag changes when they do.
+
+Last-Modified is the later of the content's updated_at and the first time
+this ETag was served. That way a chrome change also moves the date for
+clients that only send If-Modified-Since.
+
+A 304 never reaches the view, so views that count visits pass
+count_views=True to keep counting them.
+"""
+
+import functools
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .counters import increment
+from .fragment_cache import get_generations
+from .models import ScrollingNotification, SliderImage
+from .page_cache import is_cacheable_request, is_cacheable_response, shared_versions
+from .scheduled_content import get_schedule_boundaries
+
+ETAG_SEEN_KEY = 'etag_seen:{etag}'
+ETAG_SEEN_TIMEOUT = 60 * 60 * 24 * 30
+
+# Read by context processors outside the site chrome, so on every page
+CONTEXT_PROCESSOR_MODELS = (ScrollingNotification, SliderImage)
+
+
+def _validator_row(queryset, lookups, related, kwargs):
+    queryset = queryset.filter(**{lookup: kwargs[kwarg] for kwarg, lookup in lookups.items()})
+    annotations = {}
+    for index, path in enumerate(related):
+        outer = queryset.model._default_manager.filter(pk=OuterRef('pk')).values('pk')
+        annotations[f'related_{index}_lastmod'] = Subquery(
+            outer.annotate(value=Max(f'{path}__updated_at')).values('value')
+        )
+        annotations[f'related_{index}_count'] = Subquery(outer.annotate(value=Count(path)).values('value'))
+    return queryset.annotate(**annotations).values('pk', 'updated_at', *annotations).first()
+
+
+def _first_seen(etag):
+    key = ETAG_SEEN_KEY.format(etag=etag)
+    now = timezone.now()
+    if cache.add(key, now, ETAG_SEEN_TIMEOUT):
+        return now
+    return cache.get(key, now)
+
+
+def conditional_detail(queryset, lookups, related=(), models=(), count_views=False):
+    """Serve 304s for a detail view of one object of queryset
+
+    lookups maps URL kwargs to field lookups on queryset; related lists the
+    relation paths whose rows the page renders, and models the models of any
+    other lists it shows (related galleries, other departments).
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not is_cacheable_request(request):
+                return view(request, *args, **kwargs)
+            row = _validator_row(queryset.all(), lookups, related, kwargs)
+            if row is None:
+                # Let the view answer with its own 404
+                return view(request, *args, **kwargs)
+
+            parts = [value.isoformat() if hasattr(value, 'isoformat') else str(value) for value in row.values()]
+            parts += [*shared_versions(), *get_generations([*CONTEXT_PROCESSOR_MODELS, *models])]
+            parts += [str(boundary) for boundary in get_schedule_boundaries()]
+            etag = quote_etag(hashlib.sha1(':'.join(parts).encode()).hexdigest())
+            timestamps = [value for key, value in row.items() if key.endswith('lastmod') and value]
+            last_modified = max([row['updated_at'], *timestamps, _first_seen(etag)])
+            last_modified = int(last_modified.timestamp())
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is not None:
+                response.headers.setdefault('ETag', etag)
+                response.headers.setdefault('Last-Modified', http_date(last_modified))
+                if count_views:
+                    increment(queryset.model(pk=row['pk']), 'view_count')
+                return response
+
+            response = view(request, *args, **kwargs)
+            if hasattr(response, 'render') and not response.is_rendered:
+                response.render()
+            if is_cacheable_response(request, response):
+                response.headers.setdefault('ETag', etag)
+                response.headers.setdefault('Last-Modified', http_date(last_modified))
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,156 @@
+"""
+Write-behind download and view counters
+
+Incrementing a counter with a read-modify-write save() serialises writers on
+SQLite, loses increments when two requests race and fires every post_save
+handler (search indexing, cache invalidation) for a number nobody edits.
+Instead, increments are added to an in-process buffer and flushed in batches
+as F() updates, one UPDATE per (model, field, delta) group. A flush runs
+COUNTER_FLUSH_INTERVAL seconds after the first buffered increment, as soon as
+COUNTER_FLUSH_THRESHOLD increments are waiting, and at interpreter exit.
+With an interval of 0 every increment is written immediately.
+
+get_total() returns the stored value plus this worker's unflushed increments,
+read under the flush lock so a total never goes backwards or counts twice.
+Increments buffered by other workers show up once they flush.
+
+The buffer is deliberately not kept in the shared cache (cache_backends.py),
+even though its incr is atomic: that cache culls entries once MAX_ENTRIES is
+reached and may be cleared as a whole, so buffered counts would be dropped
+silently whenever pages crowd them out.
+
+Loss window: a worker that exits normally (including a graceful SIGTERM)
+flushes at exit, but one killed outright (SIGKILL, OOM killer, power loss)
+loses what it had buffered, at most COUNTER_FLUSH_INTERVAL seconds or
+COUNTER_FLUSH_THRESHOLD increments. These are popularity counts, so that is
+accepted; set COUNTER_FLUSH_INTERVAL to 0 where every increment must be kept.
+"""
+
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+# Counter fields that may be incremented, as (model label, field name)
+COUNTER_FIELDS = (
+    ('college_website.QuestionPaper', 'download_count'),
+    ('college_website.AcademicCalendar', 'download_count'),
+    ('college_website.IQACReport', 'download_count'),
+    ('college_website.Notice', 'view_count'),
+    ('college_website.Event', 'view_count'),
+    ('college_website.Program', 'view_count'),
+    ('college_website.Gallery', 'view_count'),
+)
+
+DEFAULT_FLUSH_INTERVAL = 10
+DEFAULT_FLUSH_THRESHOLD = 200
+
+_lock = threading.Lock()
+# Held for the whole of a flush, and by readers, so totals stay consistent
+_flush_lock = threading.RLock()
+_pending = Counter()
+_timer = None
+
+
+def _flush_interval():
+    return getattr(settings, 'COUNTER_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)
+
+
+def _flush_threshold():
+    return getattr(settings, 'COUNTER_FLUSH_THRESHOLD', DEFAULT_FLUSH_THRESHOLD)
+
+
+def _counter_key(instance, field):
+    label = instance._meta.label
+    if (label, field) not in COUNTER_FIELDS:
+        raise ValueError(f"{label}.{field} is not a registered counter")
+    return label, field, instance.pk
+
+
+def _schedule_flush():
+    """Start the flush timer if none is running; call with _lock held"""
+    global _timer
+    if _timer is None:
+        _timer = threading.Timer(_flush_interval(), _flush_in_background)
+        _timer.daemon = True
+        _timer.start()
+
+
+def increment(instance, field, amount=1):
+    """Buffer an increment of a counter field on a saved instance"""
+    key = _counter_key(instance, field)
+    with _lock:
+        _pending[key] += amount
+        flush_now = not _flush_interval() or sum(_pending.values()) >= _flush_threshold()
+        if not flush_now:
+            _schedule_flush()
+    if flush_now:
+        flush_counters()
+
+
+def pending_count(instance, field):
+    """Increments of a counter buffered in this worker and not yet written"""
+    with _lock:
+        return _pending.get(_counter_key(instance, field), 0)
+
+
+def get_total(instance, field):
+    """Stored value of a counter plus this worker's unflushed increments"""
+    key = _counter_key(instance, field)
+    with _flush_lock:
+        stored = type(instance)._default_manager.filter(pk=instance.pk).values_list(field, flat=True).first()
+        with _lock:
+            return (stored or 0) + _pending.get(key, 0)
+
+
+def flush_counters():
+    """Write buffered increments to the database; returns the number of rows touched"""
+    global _timer
+    with _flush_lock:
+        with _lock:
+            batch = dict(_pending)
+            _pending.clear()
+            if _timer is not None:
+                _timer.cancel()
+                _timer = None
+        if not batch:
+            return 0
+
+        groups = defaultdict(list)
+        for (label, field, pk), delta in batch.items():
+            groups[(label, field, delta)].append(pk)
+        try:
+            with transaction.atomic():
+                for (label, field, delta), pks in groups.items():
+                    apps.get_model(label)._default_manager.filter(pk__in=pks).update(
+                        **{field: F(field) + delta}
+                    )
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} counters, keeping them for the next flush: {e}")
+            with _lock:
+                _pending.update(batch)
+                if _flush_interval():
+                    _schedule_flush()
+            return 0
+        return len(batch)
+
+
+def _flush_in_background():
+    global _timer
+    with _lock:
+        _timer = None
+    try:
+        flush_counters()
+    finally:
+        # Timer threads are not request threads; don't leave connections open
+        connections.close_all()
+
+
+atexit.register(flush_counters)
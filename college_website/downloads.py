@@ -0,0 +1,190 @@
+"""
+Serving stored files for download
+
+Question papers, IQAC reports, academic calendars, notice attachments and
+page download blocks all go through serve_file, which adds what a plain
+FileResponse lacks:
+
+* ETag and Last-Modified, with If-None-Match / If-Modified-Since answered by
+  a 304 (and If-Match / If-Unmodified-Since by a 412)
+* single byte ranges (206 Partial Content), honouring If-Range, so
+  interrupted downloads can resume
+* optional offload to the front web server: with DOWNLOAD_OFFLOAD set to
+  'x-accel-redirect' the response carries an X-Accel-Redirect header under
+  DOWNLOAD_ACCEL_REDIRECT_PREFIX (an nginx internal location aliased to
+  MEDIA_ROOT); with 'x-sendfile' it carries the file's path in X-Sendfile
+  (Apache mod_xsendfile). The web server then streams the file and handles
+  ranges itself.
+"""
+
+import hashlib
+import logging
+import mimetypes
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _file_etag(name, size, modified):
+    stamp = f"{name}:{size}:{modified or ''}"
+    return f'"{hashlib.sha1(stamp.encode()).hexdigest()[:16]}"'
+
+
+def _modified_timestamp(storage, name):
+    try:
+        return int(storage.get_modified_time(name).timestamp())
+    except (NotImplementedError, OSError, AttributeError):
+        return None
+
+
+def parse_range(header, size):
+    """(start, end) for a single byte range, 'unsatisfiable', or None to send everything
+
+    Multiple ranges and malformed headers are ignored, which the HTTP spec
+    allows; the client then simply gets the whole file.
+    """
+    match = _RANGE_RE.match(header.replace(' ', ''))
+    if not match:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0 or size == 0:
+            return 'unsatisfiable'
+        return max(0, size - length), size - 1
+    start = int(start)
+    end = int(end) if end else size - 1
+    if start >= size:
+        return 'unsatisfiable'
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _if_range_matches(request, etag, modified):
+    """Whether a Range request may be honoured given its If-Range validator"""
+    validator = request.headers.get('If-Range')
+    if not validator:
+        return True
+    if validator.startswith(('"', 'W/')):
+        return validator == etag
+    return modified is not None and parse_http_date_safe(validator) == modified
+
+
+def _range_iterator(file, start, length):
+    with file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def _offload_header(storage, name):
+    """(header, value) handing the file to the web server, if configured"""
+    mode = getattr(settings, 'DOWNLOAD_OFFLOAD', None)
+    if mode == 'x-accel-redirect':
+        prefix = getattr(settings, 'DOWNLOAD_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+        return 'X-Accel-Redirect', prefix.rstrip('/') + '/' + quote(name)
+    if mode == 'x-sendfile':
+        try:
+            return 'X-Sendfile', storage.path(name)
+        except NotImplementedError:
+            # Remote storage has no local path; stream it ourselves
+            return None
+    return None
+
+
+def serve_file(request, name, storage=default_storage, *, filename=None, as_attachment=True,
+               content_type=None, etag=None, on_download=None):
+    """Response serving a stored file with validators, ranges and optional offload
+
+    on_download is called once per download actually started, i.e. not for
+    HEAD requests, 304s or ranges resuming part way through the file.
+    """
+    try:
+        size = storage.size(name)
+    except (FileNotFoundError, OSError):
+        logger.warning(f"Download requested for missing file {name}")
+        raise Http404("File not found")
+
+    modified = _modified_timestamp(storage, name)
+    etag = etag or _file_etag(name, size, modified)
+    filename = filename or name.rsplit('/', 1)[-1]
+    content_type = content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    def add_validators(response):
+        response['ETag'] = etag
+        if modified is not None:
+            response['Last-Modified'] = http_date(modified)
+        response['Accept-Ranges'] = 'bytes'
+        return response
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=modified)
+    if conditional is not None:
+        return add_validators(conditional)
+
+    byte_range = None
+    range_header = request.headers.get('Range')
+    if range_header and request.method in ('GET', 'HEAD') and _if_range_matches(request, etag, modified):
+        byte_range = parse_range(range_header, size)
+    if byte_range == 'unsatisfiable':
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return add_validators(response)
+
+    if on_download is not None and request.method == 'GET' and (byte_range is None or byte_range[0] == 0):
+        on_download()
+
+    offload = _offload_header(storage, name)
+    if offload is not None:
+        # The web server re-reads the Range header and answers it itself
+        response = HttpResponse(content_type=content_type)
+        response[offload[0]] = offload[1]
+        response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+        return add_validators(response)
+
+    if byte_range is None:
+        response = FileResponse(
+            storage.open(name, 'rb'),
+            content_type=content_type,
+            as_attachment=as_attachment,
+            filename=filename,
+        )
+        response['Content-Length'] = size
+        return add_validators(response)
+
+    start, end = byte_range
+    length = end - start + 1
+    response = StreamingHttpResponse(
+        _range_iterator(storage.open(name, 'rb'), start, length),
+        status=206,
+        content_type=content_type,
+    )
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Content-Length'] = length
+    response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+    return add_validators(response)
+
+
+def serve_field_file(request, field_file, **kwargs):
+    """serve_file for a model FileField value"""
+    if not field_file or not field_file.name:
+        raise Http404("File not found")
+    return serve_file(request, field_file.name, field_file.storage, **kwargs)
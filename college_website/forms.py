@@ -14,20 +14,16 @@ from .models import (
     BlockVideoEmbed, BlockDownloadList, BlockTableHTML, BlockForm,
     GalleryImage, DownloadFile, TopUtilityBar, CustomLink,
     IQACInfo, IQACReport, NAACInfo, NIRFInfo, AccreditationInfo, IQACFeedback, 
-<<<<<<< HEAD
     QualityInitiative, SideMenu, SideMenuItem, VisionMissionContent, CoreValue, HeroBanner,
     ExamTimetable, ExamTimetableWeek, ExamTimetableTimeSlot, ExamTimetableExam, QuestionPaper, RevaluationInfo, ExamRulesInfo, ResearchCenterInfo,
     PublicationInfo, Publication, PatentsProjectsInfo, Patent, ResearchProject, IndustryCollaboration,
     ConsultancyInfo, ConsultancyService, ConsultancyExpertise, ConsultancySuccessStory,
     Student, StudentDocument, StudentLoginLog,
     NSSNCCClub, NSSNCCNotice, NSSNCCGallery, NSSNCCAchievement,
-    HeroCarouselSlide, HeroCarouselSettings
-=======
-    QualityInitiative, SideMenu, SideMenuItem,
+    HeroCarouselSlide, HeroCarouselSettings,
     InfrastructureInfo, InfrastructureStatistic, AcademicFacility, SportsFacility, TechnologyInfrastructure, StudentAmenity, InfrastructurePhoto,
-    AcademicCalendar, AcademicEvent
->>>>>>> a11168e (Fix)
 )
+from .search import get_search_categories
 
 
 class TopUtilityBarForm(forms.ModelForm):
@@ -2609,13 +2605,7 @@ class SearchForm(forms.Form):
     )
     
     category = forms.ChoiceField(
-        choices=[
-            ('all', 'All'),
-            ('notice', 'Notices'),
-            ('event', 'Events'),
-            ('program', 'Programs'),
-            ('page', 'Pages'),
-        ],
+        choices=[('all', 'All')] + get_search_categories(),
         required=False,
         widget=forms.Select(attrs={'class': 'form-select'}),
         initial='all'
@@ -3479,7 +3469,6 @@ class SideMenuItemForm(forms.ModelForm):
         }
 
 
-<<<<<<< HEAD
 class VisionMissionContentForm(forms.ModelForm):
     """Form for managing Vision & Mission page content dynamically"""
     
@@ -5016,501 +5005,312 @@ class ResearchCenterInfoForm(forms.ModelForm):
             'cta_title': forms.TextInput(attrs={
                 'class': 'form-control',
                 'placeholder': 'e.g., Join Our Research Community'
-=======
-class MultipleFileInput(forms.FileInput):
-    """Custom widget that supports multiple file uploads"""
-    allow_multiple_selected = True
+            }),
+            'cta_description': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 3,
+                'placeholder': 'Call to action description'
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Add Bootstrap classes to all fields
+        for field_name, field in self.fields.items():
+            if field_name not in ['is_active']:
+                if not hasattr(field.widget, 'attrs'):
+                    field.widget.attrs = {}
+                if 'class' not in field.widget.attrs:
+                    field.widget.attrs['class'] = 'form-control'
+    
+    def clean_grants_amount(self):
+        """Validate grants amount"""
+        grants_amount = self.cleaned_data.get('grants_amount')
+        if grants_amount is not None and grants_amount < 0:
+            raise ValidationError("Grants amount cannot be negative.")
+        return grants_amount
+    
+    def clean_publications_count(self):
+        """Validate publications count"""
+        count = self.cleaned_data.get('publications_count')
+        if count is not None and count < 0:
+            raise ValidationError("Publications count cannot be negative.")
+        return count
+    
+    def clean_patents_count(self):
+        """Validate patents count"""
+        count = self.cleaned_data.get('patents_count')
+        if count is not None and count < 0:
+            raise ValidationError("Patents count cannot be negative.")
+        return count
 
-    def __init__(self, attrs=None):
-        super().__init__(attrs)
-        if attrs is not None:
-            self.attrs.update(attrs)
-        self.attrs['multiple'] = True
 
-    def value_from_datadict(self, data, files, name):
-        if hasattr(files, 'getlist'):
-            return files.getlist(name)
-        return files.get(name)
+class ResearchCenterInfoUpdateForm(ResearchCenterInfoForm):
+    """Update form for research center information (excludes timestamps)"""
+    
+    class Meta(ResearchCenterInfoForm.Meta):
+        exclude = ['created_at', 'updated_at']
 
 
-class MultipleInfrastructurePhotoForm(forms.Form):
-    """Form for uploading multiple infrastructure photos at once"""
+class ResearchCenterInfoQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential research center information"""
     
-    # Multiple file upload field
-    images = forms.FileField(
-        widget=MultipleFileInput(attrs={
-            'class': 'form-control',
-            'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp',
-            'data-max-size': '5120',  # 5MB in KB
-            'data-allowed-types': 'jpeg,jpg,png,gif,webp'
-        }),
-        help_text='Select multiple image files (JPEG, PNG, GIF, WebP). Maximum size: 5MB per file. You can select multiple files at once.',
-        label='Photo Files'
-    )
+    class Meta:
+        model = ResearchCenterInfo
+        fields = [
+            'title', 'subtitle', 'director_name', 'director_phone', 
+            'director_email', 'office_phone', 'office_email', 'is_active'
+        ]
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Research Centers'
+            }),
+            'subtitle': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Advancing knowledge through cutting-edge research and innovation'
+            }),
+            'director_name': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Dr. [Research Director Name]'
+            }),
+            'director_phone': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., +91-XXX-XXXX-XXX'
+            }),
+            'director_email': forms.EmailInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., research@college.edu'
+            }),
+            'office_phone': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., +91-XXX-XXXX-XXX'
+            }),
+            'office_email': forms.EmailInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., research.office@college.edu'
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+        }
+
+
+class PublicationInfoForm(forms.ModelForm):
+    """Form for managing publication information"""
     
-    # Common settings for all photos
-    section_type = forms.ChoiceField(
-        choices=InfrastructurePhoto.PHOTO_SECTIONS,
-        widget=forms.Select(attrs={
-            'class': 'form-select',
-            'required': True
-        }),
-        help_text='Select the infrastructure section for all photos',
-        label='Section Type'
-    )
+    class Meta:
+        model = PublicationInfo
+        fields = '__all__'
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Research Publications'
+            }),
+            'subtitle': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 3,
+                'placeholder': 'Page subtitle description'
+            }),
+            'total_publications': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'book_chapters': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'total_citations': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'awards_received': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'international_journals_count': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'international_citations': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'national_journals_count': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'national_citations': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'conference_papers_count': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'conference_citations': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'best_paper_awards': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'average_impact_factor': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0,
+                'step': 0.01
+            }),
+            'international_collaborations': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'research_students': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'cta_title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Interested in Collaborating?'
+            }),
+            'cta_description': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 3,
+                'placeholder': 'Call to action description'
+            }),
+            'contact_email': forms.EmailInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., research@college.edu'
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+        }
     
-    academic_facility = forms.ModelChoiceField(
-        queryset=AcademicFacility.objects.filter(is_active=True),
-        required=False,
-        empty_label="Select Academic Facility (Optional)",
-        widget=forms.Select(attrs={
-            'class': 'form-select'
-        }),
-        help_text='Associate all photos with a specific academic facility (optional)',
-        label='Academic Facility'
-    )
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Add Bootstrap classes to all fields
+        for field_name, field in self.fields.items():
+            if field_name not in ['is_active']:
+                if not hasattr(field.widget, 'attrs'):
+                    field.widget.attrs = {}
+                if 'class' not in field.widget.attrs:
+                    field.widget.attrs['class'] = 'form-control'
     
-    sports_facility = forms.ModelChoiceField(
-        queryset=SportsFacility.objects.filter(is_active=True),
-        required=False,
-        empty_label="Select Sports Facility (Optional)",
-        widget=forms.Select(attrs={
-            'class': 'form-select'
-        }),
-        help_text='Associate all photos with a specific sports facility (optional)',
-        label='Sports Facility'
-    )
+    def clean_average_impact_factor(self):
+        """Validate impact factor"""
+        impact_factor = self.cleaned_data.get('average_impact_factor')
+        if impact_factor is not None and impact_factor < 0:
+            raise ValidationError("Impact factor cannot be negative.")
+        return impact_factor
+
+
+class PublicationInfoUpdateForm(PublicationInfoForm):
+    """Update form for publication information (excludes timestamps)"""
     
-    technology_infrastructure = forms.ModelChoiceField(
-        queryset=TechnologyInfrastructure.objects.filter(is_active=True),
-        required=False,
-        empty_label="Select Technology Infrastructure (Optional)",
-        widget=forms.Select(attrs={
-            'class': 'form-select'
-        }),
-        help_text='Associate all photos with specific technology infrastructure (optional)',
-        label='Technology Infrastructure'
-    )
-    
-    student_amenity = forms.ModelChoiceField(
-        queryset=StudentAmenity.objects.filter(is_active=True),
-        required=False,
-        empty_label="Select Student Amenity (Optional)",
-        widget=forms.Select(attrs={
-            'class': 'form-select'
-        }),
-        help_text='Associate all photos with a specific student amenity (optional)',
-        label='Student Amenity'
-    )
-    
-    # Common display settings
-    is_featured = forms.BooleanField(
-        required=False,
-        initial=False,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'form-check-input'
-        }),
-        help_text='Feature all photos prominently in the gallery',
-        label='Featured Photos'
-    )
-    
-    is_active = forms.BooleanField(
-        required=False,
-        initial=True,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'form-check-input'
-        }),
-        help_text='Make all photos visible on the website',
-        label='Active Photos'
-    )
-    
-    # Auto-generate titles option
-    auto_generate_titles = forms.BooleanField(
-        required=False,
-        initial=True,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'form-check-input'
-        }),
-        help_text='Automatically generate titles from filenames (uncheck to set custom titles)',
-        label='Auto-generate Titles'
-    )
-    
-    def clean_images(self):
-        """Validate uploaded images"""
-        images = self.files.getlist('images')
-        
-        if not images:
-            raise forms.ValidationError('Please select at least one image file.')
-        
-        if len(images) > 20:
-            raise forms.ValidationError('You can upload a maximum of 20 images at once.')
-        
-        for image in images:
-            # Check file size (max 5MB)
-            if hasattr(image, 'size') and image.size > 5 * 1024 * 1024:
-                raise forms.ValidationError(
-                    f'Image "{image.name}" is too large. Maximum size allowed is 5MB. '
-                    f'Your file is {image.size / (1024 * 1024):.1f}MB.'
-                )
-            
-            # Check file type
-            if hasattr(image, 'content_type'):
-                allowed_types = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp']
-                if image.content_type not in allowed_types:
-                    raise forms.ValidationError(
-                        f'Invalid file type for "{image.name}". Please upload a JPEG, PNG, GIF, or WebP image.'
-                    )
-            
-            # Check file name extension
-            if hasattr(image, 'name'):
-                allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-                file_extension = os.path.splitext(image.name)[1].lower()
-                if file_extension not in allowed_extensions:
-                    raise forms.ValidationError(
-                        f'Invalid file extension for "{image.name}". Allowed extensions: .jpg, .jpeg, .png, .gif, .webp'
-                    )
-        
-        return images
-    
-    def clean(self):
-        """Comprehensive form validation"""
-        cleaned_data = super().clean()
-        
-        # Get facility selections
-        academic_facility = cleaned_data.get('academic_facility')
-        sports_facility = cleaned_data.get('sports_facility')
-        technology_infrastructure = cleaned_data.get('technology_infrastructure')
-        student_amenity = cleaned_data.get('student_amenity')
-        
-        # Validate that only one facility type is selected
-        facility_count = sum([
-            bool(academic_facility),
-            bool(sports_facility),
-            bool(technology_infrastructure),
-            bool(student_amenity)
-        ])
-        
-        if facility_count > 1:
-            raise forms.ValidationError(
-                'Please select only one facility type. All photos can only be associated with one specific facility.'
-            )
-        
-        return cleaned_data
-    
-    def save(self):
-        """Save multiple photos with the provided settings"""
-        images = self.cleaned_data['images']
-        section_type = self.cleaned_data['section_type']
-        academic_facility = self.cleaned_data.get('academic_facility')
-        sports_facility = self.cleaned_data.get('sports_facility')
-        technology_infrastructure = self.cleaned_data.get('technology_infrastructure')
-        student_amenity = self.cleaned_data.get('student_amenity')
-        is_featured = self.cleaned_data.get('is_featured', False)
-        is_active = self.cleaned_data.get('is_active', True)
-        auto_generate_titles = self.cleaned_data.get('auto_generate_titles', True)
-        
-        created_photos = []
-        
-        for i, image in enumerate(images):
-            # Generate title from filename if auto-generate is enabled
-            if auto_generate_titles:
-                title = os.path.splitext(image.name)[0].replace('_', ' ').replace('-', ' ').title()
-            else:
-                title = f"Photo {i + 1}"
-            
-            # Create InfrastructurePhoto instance
-            photo = InfrastructurePhoto(
-                title=title,
-                image=image,
-                section_type=section_type,
-                academic_facility=academic_facility,
-                sports_facility=sports_facility,
-                technology_infrastructure=technology_infrastructure,
-                student_amenity=student_amenity,
-                is_featured=is_featured,
-                is_active=is_active,
-                display_order=i  # Set display order based on upload order
-            )
-            
-            # Validate the photo instance
-            photo.full_clean()
-            photo.save()
-            created_photos.append(photo)
-        
-        return created_photos
+    class Meta(PublicationInfoForm.Meta):
+        exclude = ['created_at', 'updated_at']
 
 
-class InfrastructurePhotoForm(forms.ModelForm):
-    """Enhanced form for managing individual infrastructure photos with better validation and UI"""
+class PublicationInfoQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential publication information"""
     
     class Meta:
-        model = InfrastructurePhoto
-        fields = '__all__'
+        model = PublicationInfo
+        fields = [
+            'title', 'subtitle', 'total_publications', 'total_citations', 
+            'contact_email', 'is_active'
+        ]
         widgets = {
             'title': forms.TextInput(attrs={
-                'class': 'form-control tw-rounded-lg',
-                'placeholder': 'Enter photo title/caption',
-                'maxlength': '200',
-                'required': True
+                'class': 'form-control',
+                'placeholder': 'e.g., Research Publications'
             }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control tw-rounded-lg',
-                'rows': 3,
-                'placeholder': 'Enter photo description (optional)',
-                'maxlength': '1000'
+            'subtitle': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 2,
+                'placeholder': 'Page subtitle description'
             }),
-            'image': forms.ClearableFileInput(attrs={
-                'class': 'form-control tw-rounded-lg',
-                'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp',
-                'data-max-size': '5120',  # 5MB in KB
-                'data-allowed-types': 'jpeg,jpg,png,gif,webp'
+            'total_publications': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
             }),
-            'section_type': forms.Select(attrs={
-                'class': 'form-select tw-rounded-lg',
-                'required': True
+            'total_citations': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
             }),
-            'academic_facility': forms.Select(attrs={
-                'class': 'form-select tw-rounded-lg'
+            'contact_email': forms.EmailInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., research@college.edu'
             }),
-            'sports_facility': forms.Select(attrs={
-                'class': 'form-select tw-rounded-lg'
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
             }),
-            'technology_infrastructure': forms.Select(attrs={
-                'class': 'form-select tw-rounded-lg'
+        }
+
+
+class PublicationForm(forms.ModelForm):
+    """Form for creating and editing publications"""
+    
+    class Meta:
+        model = Publication
+        fields = '__all__'
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Publication title'
             }),
-            'student_amenity': forms.Select(attrs={
-                'class': 'form-select tw-rounded-lg'
+            'authors': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Author names (comma separated)'
             }),
-            'display_order': forms.NumberInput(attrs={
-                'class': 'form-control tw-rounded-lg',
-                'min': '0',
-                'max': '999',
-                'placeholder': '0'
+            'abstract': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 4,
+                'placeholder': 'Publication abstract'
             }),
-            'is_featured': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
+            'journal_name': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Journal or conference name'
             }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
+            'journal_type': forms.Select(attrs={
+                'class': 'form-select'
             }),
-        }
-        
-        help_texts = {
-            'title': 'A descriptive title for the photo (required)',
-            'description': 'Optional detailed description of the photo content',
-            'image': 'Upload an image file (JPEG, PNG, GIF, WebP). Maximum size: 5MB. Recommended dimensions: 800x600px or larger.',
-            'section_type': 'Select the infrastructure section this photo belongs to',
-            'academic_facility': 'Associate this photo with a specific academic facility (optional)',
-            'sports_facility': 'Associate this photo with a specific sports facility (optional)',
-            'technology_infrastructure': 'Associate this photo with specific technology infrastructure (optional)',
-            'student_amenity': 'Associate this photo with a specific student amenity (optional)',
-            'display_order': 'Display order within the section (lower numbers appear first)',
-            'is_featured': 'Feature this photo prominently in the gallery',
-            'is_active': 'Make this photo visible on the website'
-        }
-        
-        labels = {
-            'title': 'Photo Title',
-            'description': 'Description',
-            'image': 'Photo File',
-            'section_type': 'Section Type',
-            'academic_facility': 'Academic Facility',
-            'sports_facility': 'Sports Facility',
-            'technology_infrastructure': 'Technology Infrastructure',
-            'student_amenity': 'Student Amenity',
-            'display_order': 'Display Order',
-            'is_featured': 'Featured Photo',
-            'is_active': 'Active'
-        }
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Add empty option for foreign key fields
-        self.fields['academic_facility'].empty_label = "Select Academic Facility (Optional)"
-        self.fields['sports_facility'].empty_label = "Select Sports Facility (Optional)"
-        self.fields['technology_infrastructure'].empty_label = "Select Technology Infrastructure (Optional)"
-        self.fields['student_amenity'].empty_label = "Select Student Amenity (Optional)"
-        
-        # Filter to only show active facilities
-        self.fields['academic_facility'].queryset = AcademicFacility.objects.filter(is_active=True)
-        self.fields['sports_facility'].queryset = SportsFacility.objects.filter(is_active=True)
-        self.fields['technology_infrastructure'].queryset = TechnologyInfrastructure.objects.filter(is_active=True)
-        self.fields['student_amenity'].queryset = StudentAmenity.objects.filter(is_active=True)
-        
-        # Add CSS classes for better styling
-        for field_name, field in self.fields.items():
-            if field_name not in ['image']:  # Image field already has custom styling
-                if 'class' not in field.widget.attrs:
-                    field.widget.attrs.update({'class': 'form-control tw-rounded-lg'})
-    
-    def clean_image(self):
-        """Validate uploaded image"""
-        image = self.cleaned_data.get('image')
-        if image:
-            # Check file size (max 5MB)
-            if hasattr(image, 'size') and image.size > 5 * 1024 * 1024:
-                raise forms.ValidationError(
-                    'Image file is too large. Maximum size allowed is 5MB. '
-                    f'Your file is {image.size / (1024 * 1024):.1f}MB.'
-                )
-            
-            # Check file type
-            if hasattr(image, 'content_type'):
-                allowed_types = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp']
-                if image.content_type not in allowed_types:
-                    raise forms.ValidationError(
-                        'Invalid file type. Please upload a JPEG, PNG, GIF, or WebP image.'
-                    )
-            
-            # Check file name extension
-            if hasattr(image, 'name'):
-                allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-                file_extension = os.path.splitext(image.name)[1].lower()
-                if file_extension not in allowed_extensions:
-                    raise forms.ValidationError(
-                        'Invalid file extension. Allowed extensions: .jpg, .jpeg, .png, .gif, .webp'
-                    )
-        
-        return image
-    
-    def clean_title(self):
-        """Validate title"""
-        title = self.cleaned_data.get('title')
-        if title:
-            title = title.strip()
-            if len(title) < 3:
-                raise forms.ValidationError('Title must be at least 3 characters long.')
-        return title
-    
-    def clean_display_order(self):
-        """Validate display order"""
-        display_order = self.cleaned_data.get('display_order')
-        if display_order is not None and display_order < 0:
-            raise forms.ValidationError('Display order must be a non-negative number.')
-        return display_order
-    
-    def clean(self):
-        """Comprehensive form validation"""
-        cleaned_data = super().clean()
-        
-        # Get facility selections
-        academic_facility = cleaned_data.get('academic_facility')
-        sports_facility = cleaned_data.get('sports_facility')
-        technology_infrastructure = cleaned_data.get('technology_infrastructure')
-        student_amenity = cleaned_data.get('student_amenity')
-        
-        # Validate that only one facility type is selected
-        facility_count = sum([
-            bool(academic_facility),
-            bool(sports_facility),
-            bool(technology_infrastructure),
-            bool(student_amenity)
-        ])
-        
-        if facility_count > 1:
-            raise forms.ValidationError(
-                'Please select only one facility type. A photo can only be associated with one specific facility.'
-            )
-        
-        # Note: It's okay to have no facility selected - photos can be general infrastructure
-        
-        return cleaned_data
-
-
-class InfrastructurePhotoInlineForm(forms.ModelForm):
-    """Simplified form for inline usage in admin"""
-    
-    class Meta:
-        model = InfrastructurePhoto
-        fields = ['title', 'image', 'is_featured', 'is_active', 'display_order']
-        widgets = {
-            'title': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Enter photo title/caption',
-                'maxlength': '200',
-                'required': True
-            }),
-            'image': forms.ClearableFileInput(attrs={
-                'class': 'form-control',
-                'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp'
-            }),
-            'display_order': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': '0',
-                'max': '999',
-                'placeholder': '0'
-            }),
-            'is_featured': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-        }
-
-
-# Enhanced Infrastructure Model Forms
-
-class InfrastructureInfoForm(forms.ModelForm):
-    """Enhanced form for Infrastructure Information management with rich text editing"""
-    
-    class Meta:
-        model = InfrastructureInfo
-        fields = '__all__'
-        widgets = {
-            'title': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Infrastructure & Facilities',
-                'maxlength': '200'
-            }),
-            'subtitle': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Brief description of infrastructure',
-                'maxlength': '300'
-            }),
-            'hero_title': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Hero section title',
-                'maxlength': '200'
+            'department': forms.Select(attrs={
+                'class': 'form-select'
             }),
-            'hero_subtitle': forms.Textarea(attrs={
+            'publication_year': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Hero section subtitle/description',
-                'maxlength': '500'
+                'min': 1900,
+                'max': 2030
             }),
-            'hero_image': forms.ClearableFileInput(attrs={
+            'citations': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp'
+                'min': 0
             }),
-            'hero_badge_text': forms.TextInput(attrs={
+            'impact_factor': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Modern Facilities',
-                'maxlength': '100'
+                'min': 0,
+                'step': 0.01
             }),
-            'overview_title': forms.TextInput(attrs={
+            'doi': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Overview section title',
-                'maxlength': '200'
+                'placeholder': 'Digital Object Identifier'
             }),
-            'overview_description': forms.Textarea(attrs={
+            'url': forms.URLInput(attrs={
                 'class': 'form-control',
-                'rows': 4,
-                'placeholder': 'Detailed overview of infrastructure'
+                'placeholder': 'Publication URL'
             }),
-            'cta_title': forms.TextInput(attrs={
+            'pdf_file': forms.ClearableFileInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Call to action title',
-                'maxlength': '200'
->>>>>>> a11168e (Fix)
+                'accept': '.pdf'
             }),
-            'cta_description': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Call to action description'
+            'is_featured': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
             }),
-<<<<<<< HEAD
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
@@ -5520,166 +5320,186 @@ class InfrastructureInfoForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         # Add Bootstrap classes to all fields
         for field_name, field in self.fields.items():
-            if field_name not in ['is_active']:
+            if field_name not in ['is_featured', 'is_active']:
                 if not hasattr(field.widget, 'attrs'):
                     field.widget.attrs = {}
                 if 'class' not in field.widget.attrs:
                     field.widget.attrs['class'] = 'form-control'
     
-    def clean_grants_amount(self):
-        """Validate grants amount"""
-        grants_amount = self.cleaned_data.get('grants_amount')
-        if grants_amount is not None and grants_amount < 0:
-            raise ValidationError("Grants amount cannot be negative.")
-        return grants_amount
+    def clean_publication_year(self):
+        """Validate publication year"""
+        year = self.cleaned_data.get('publication_year')
+        current_year = datetime.now().year
+        if year and (year < 1900 or year > current_year + 1):
+            raise ValidationError(f"Publication year must be between 1900 and {current_year + 1}.")
+        return year
     
-    def clean_publications_count(self):
-        """Validate publications count"""
-        count = self.cleaned_data.get('publications_count')
-        if count is not None and count < 0:
-            raise ValidationError("Publications count cannot be negative.")
-        return count
+    def clean_citations(self):
+        """Validate citations count"""
+        citations = self.cleaned_data.get('citations')
+        if citations is not None and citations < 0:
+            raise ValidationError("Citations count cannot be negative.")
+        return citations
     
-    def clean_patents_count(self):
-        """Validate patents count"""
-        count = self.cleaned_data.get('patents_count')
-        if count is not None and count < 0:
-            raise ValidationError("Patents count cannot be negative.")
-        return count
+    def clean_impact_factor(self):
+        """Validate impact factor"""
+        impact_factor = self.cleaned_data.get('impact_factor')
+        if impact_factor is not None and impact_factor < 0:
+            raise ValidationError("Impact factor cannot be negative.")
+        return impact_factor
 
 
-class ResearchCenterInfoUpdateForm(ResearchCenterInfoForm):
-    """Update form for research center information (excludes timestamps)"""
+class PublicationUpdateForm(PublicationForm):
+    """Update form for publications (excludes timestamps)"""
     
-    class Meta(ResearchCenterInfoForm.Meta):
+    class Meta(PublicationForm.Meta):
         exclude = ['created_at', 'updated_at']
 
 
-class ResearchCenterInfoQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential research center information"""
-    
+class PublicationQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential publication fields"""
+    
     class Meta:
-        model = ResearchCenterInfo
+        model = Publication
         fields = [
-            'title', 'subtitle', 'director_name', 'director_phone', 
-            'director_email', 'office_phone', 'office_email', 'is_active'
+            'title', 'authors', 'journal_name', 'department', 
+            'publication_year', 'citations', 'is_featured', 'is_active'
         ]
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Research Centers'
-            }),
-            'subtitle': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Advancing knowledge through cutting-edge research and innovation'
+                'placeholder': 'Publication title'
             }),
-            'director_name': forms.TextInput(attrs={
+            'authors': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Dr. [Research Director Name]'
+                'placeholder': 'Author names (comma separated)'
             }),
-            'director_phone': forms.TextInput(attrs={
+            'journal_name': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., +91-XXX-XXXX-XXX'
+                'placeholder': 'Journal or conference name'
             }),
-            'director_email': forms.EmailInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., research@college.edu'
+            'department': forms.Select(attrs={
+                'class': 'form-select'
             }),
-            'office_phone': forms.TextInput(attrs={
+            'publication_year': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., +91-XXX-XXXX-XXX'
+                'min': 1900,
+                'max': 2030
             }),
-            'office_email': forms.EmailInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., research.office@college.edu'
-=======
-            'cta_button_text': forms.TextInput(attrs={
+            'citations': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Schedule a Visit',
-                'maxlength': '100'
+                'min': 0
             }),
-            'cta_button_url': forms.URLInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., /contact/ or https://example.com'
->>>>>>> a11168e (Fix)
+            'is_featured': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
             }),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
         }
-<<<<<<< HEAD
 
 
-class PublicationInfoForm(forms.ModelForm):
-    """Form for managing publication information"""
+class PublicationSearchForm(forms.Form):
+    """Search form for publications"""
+    
+    search = forms.CharField(
+        required=False,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'Search by title, author, or keywords...'
+        })
+    )
+    
+    department = forms.ChoiceField(
+        required=False,
+        choices=[('', 'All Departments')] + Publication.DEPARTMENT_CHOICES,
+        widget=forms.Select(attrs={
+            'class': 'form-select'
+        })
+    )
+    
+    journal_type = forms.ChoiceField(
+        required=False,
+        choices=[('', 'All Types')] + Publication.JOURNAL_TYPE_CHOICES,
+        widget=forms.Select(attrs={
+            'class': 'form-select'
+        })
+    )
+    
+    year = forms.IntegerField(
+        required=False,
+        widget=forms.NumberInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'Year',
+            'min': 1900,
+            'max': 2030
+        })
+    )
+    
+    sort_by = forms.ChoiceField(
+        required=False,
+        choices=[
+            ('-publication_year', 'Date (Newest)'),
+            ('publication_year', 'Date (Oldest)'),
+            ('-citations', 'Citations (High)'),
+            ('citations', 'Citations (Low)'),
+            ('title', 'Title (A-Z)'),
+            ('-title', 'Title (Z-A)'),
+        ],
+        initial='-publication_year',
+        widget=forms.Select(attrs={
+            'class': 'form-select'
+        })
+    )
+
+
+# Patents & Projects Forms
+class PatentsProjectsInfoForm(forms.ModelForm):
+    """Form for managing patents & projects information"""
     
     class Meta:
-        model = PublicationInfo
+        model = PatentsProjectsInfo
         fields = '__all__'
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Research Publications'
+                'placeholder': 'e.g., Patents & Projects'
             }),
             'subtitle': forms.Textarea(attrs={
                 'class': 'form-control',
                 'rows': 3,
                 'placeholder': 'Page subtitle description'
             }),
-            'total_publications': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'book_chapters': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'total_citations': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'awards_received': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'international_journals_count': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'international_citations': forms.NumberInput(attrs={
+            'total_patents': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
-            'national_journals_count': forms.NumberInput(attrs={
+            'total_projects': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
-            'national_citations': forms.NumberInput(attrs={
+            'industry_collaborations': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
-            'conference_papers_count': forms.NumberInput(attrs={
+            'research_funding': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'min': 0,
+                'step': 0.01
             }),
-            'conference_citations': forms.NumberInput(attrs={
+            'innovation_awards': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
-            'best_paper_awards': forms.NumberInput(attrs={
+            'international_recognition': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
-            'average_impact_factor': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0,
-                'step': 0.01
-            }),
-            'international_collaborations': forms.NumberInput(attrs={
+            'active_partnerships': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
-            'research_students': forms.NumberInput(attrs={
+            'students_involved': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
@@ -5710,46 +5530,39 @@ class PublicationInfoForm(forms.ModelForm):
                     field.widget.attrs = {}
                 if 'class' not in field.widget.attrs:
                     field.widget.attrs['class'] = 'form-control'
-    
-    def clean_average_impact_factor(self):
-        """Validate impact factor"""
-        impact_factor = self.cleaned_data.get('average_impact_factor')
-        if impact_factor is not None and impact_factor < 0:
-            raise ValidationError("Impact factor cannot be negative.")
-        return impact_factor
 
 
-class PublicationInfoUpdateForm(PublicationInfoForm):
-    """Update form for publication information (excludes timestamps)"""
+class PatentsProjectsInfoUpdateForm(PatentsProjectsInfoForm):
+    """Update form for patents & projects information (excludes timestamps)"""
     
-    class Meta(PublicationInfoForm.Meta):
+    class Meta(PatentsProjectsInfoForm.Meta):
         exclude = ['created_at', 'updated_at']
 
 
-class PublicationInfoQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential publication information"""
+class PatentsProjectsInfoQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential patents & projects information"""
     
     class Meta:
-        model = PublicationInfo
+        model = PatentsProjectsInfo
         fields = [
-            'title', 'subtitle', 'total_publications', 'total_citations', 
+            'title', 'subtitle', 'total_patents', 'total_projects', 
             'contact_email', 'is_active'
         ]
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Research Publications'
+                'placeholder': 'e.g., Patents & Projects'
             }),
             'subtitle': forms.Textarea(attrs={
                 'class': 'form-control',
                 'rows': 2,
                 'placeholder': 'Page subtitle description'
             }),
-            'total_publications': forms.NumberInput(attrs={
+            'total_patents': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
-            'total_citations': forms.NumberInput(attrs={
+            'total_projects': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0
             }),
@@ -5763,57 +5576,56 @@ class PublicationInfoQuickEditForm(forms.ModelForm):
         }
 
 
-class PublicationForm(forms.ModelForm):
-    """Form for creating and editing publications"""
+class PatentForm(forms.ModelForm):
+    """Form for creating and editing patents"""
     
     class Meta:
-        model = Publication
+        model = Patent
         fields = '__all__'
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Publication title'
+                'placeholder': 'Patent title'
             }),
-            'authors': forms.TextInput(attrs={
+            'inventors': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Author names (comma separated)'
+                'placeholder': 'Inventor names (comma separated)'
             }),
-            'abstract': forms.Textarea(attrs={
+            'description': forms.Textarea(attrs={
                 'class': 'form-control',
                 'rows': 4,
-                'placeholder': 'Publication abstract'
+                'placeholder': 'Patent description'
             }),
-            'journal_name': forms.TextInput(attrs={
+            'patent_number': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Journal or conference name'
+                'placeholder': 'Patent number'
             }),
-            'journal_type': forms.Select(attrs={
+            'status': forms.Select(attrs={
                 'class': 'form-select'
             }),
             'department': forms.Select(attrs={
                 'class': 'form-select'
             }),
-            'publication_year': forms.NumberInput(attrs={
+            'filing_year': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 1900,
                 'max': 2030
             }),
-            'citations': forms.NumberInput(attrs={
+            'application_number': forms.TextInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'placeholder': 'Application number'
             }),
-            'impact_factor': forms.NumberInput(attrs={
+            'publication_date': forms.DateInput(attrs={
                 'class': 'form-control',
-                'min': 0,
-                'step': 0.01
+                'type': 'date'
             }),
-            'doi': forms.TextInput(attrs={
+            'grant_date': forms.DateInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Digital Object Identifier'
+                'type': 'date'
             }),
-            'url': forms.URLInput(attrs={
+            'patent_url': forms.URLInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Publication URL'
+                'placeholder': 'Patent URL'
             }),
             'pdf_file': forms.ClearableFileInput(attrs={
                 'class': 'form-control',
@@ -5837,69 +5649,54 @@ class PublicationForm(forms.ModelForm):
                 if 'class' not in field.widget.attrs:
                     field.widget.attrs['class'] = 'form-control'
     
-    def clean_publication_year(self):
-        """Validate publication year"""
-        year = self.cleaned_data.get('publication_year')
+    def clean_filing_year(self):
+        """Validate filing year"""
+        year = self.cleaned_data.get('filing_year')
         current_year = datetime.now().year
         if year and (year < 1900 or year > current_year + 1):
-            raise ValidationError(f"Publication year must be between 1900 and {current_year + 1}.")
+            raise ValidationError(f"Filing year must be between 1900 and {current_year + 1}.")
         return year
-    
-    def clean_citations(self):
-        """Validate citations count"""
-        citations = self.cleaned_data.get('citations')
-        if citations is not None and citations < 0:
-            raise ValidationError("Citations count cannot be negative.")
-        return citations
-    
-    def clean_impact_factor(self):
-        """Validate impact factor"""
-        impact_factor = self.cleaned_data.get('impact_factor')
-        if impact_factor is not None and impact_factor < 0:
-            raise ValidationError("Impact factor cannot be negative.")
-        return impact_factor
 
 
-class PublicationUpdateForm(PublicationForm):
-    """Update form for publications (excludes timestamps)"""
+class PatentUpdateForm(PatentForm):
+    """Update form for patents (excludes timestamps)"""
     
-    class Meta(PublicationForm.Meta):
+    class Meta(PatentForm.Meta):
         exclude = ['created_at', 'updated_at']
 
 
-class PublicationQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential publication fields"""
+class PatentQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential patent fields"""
     
     class Meta:
-        model = Publication
+        model = Patent
         fields = [
-            'title', 'authors', 'journal_name', 'department', 
-            'publication_year', 'citations', 'is_featured', 'is_active'
+            'title', 'inventors', 'patent_number', 'department', 
+            'filing_year', 'status', 'is_featured', 'is_active'
         ]
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Publication title'
+                'placeholder': 'Patent title'
             }),
-            'authors': forms.TextInput(attrs={
+            'inventors': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Author names (comma separated)'
+                'placeholder': 'Inventor names (comma separated)'
             }),
-            'journal_name': forms.TextInput(attrs={
+            'patent_number': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Journal or conference name'
+                'placeholder': 'Patent number'
             }),
             'department': forms.Select(attrs={
                 'class': 'form-select'
             }),
-            'publication_year': forms.NumberInput(attrs={
+            'filing_year': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 1900,
                 'max': 2030
             }),
-            'citations': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
+            'status': forms.Select(attrs={
+                'class': 'form-select'
             }),
             'is_featured': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -5910,122 +5707,70 @@ class PublicationQuickEditForm(forms.ModelForm):
         }
 
 
-class PublicationSearchForm(forms.Form):
-    """Search form for publications"""
-    
-    search = forms.CharField(
-        required=False,
-        widget=forms.TextInput(attrs={
-            'class': 'form-control',
-            'placeholder': 'Search by title, author, or keywords...'
-        })
-    )
-    
-    department = forms.ChoiceField(
-        required=False,
-        choices=[('', 'All Departments')] + Publication.DEPARTMENT_CHOICES,
-        widget=forms.Select(attrs={
-            'class': 'form-select'
-        })
-    )
-    
-    journal_type = forms.ChoiceField(
-        required=False,
-        choices=[('', 'All Types')] + Publication.JOURNAL_TYPE_CHOICES,
-        widget=forms.Select(attrs={
-            'class': 'form-select'
-        })
-    )
-    
-    year = forms.IntegerField(
-        required=False,
-        widget=forms.NumberInput(attrs={
-            'class': 'form-control',
-            'placeholder': 'Year',
-            'min': 1900,
-            'max': 2030
-        })
-    )
-    
-    sort_by = forms.ChoiceField(
-        required=False,
-        choices=[
-            ('-publication_year', 'Date (Newest)'),
-            ('publication_year', 'Date (Oldest)'),
-            ('-citations', 'Citations (High)'),
-            ('citations', 'Citations (Low)'),
-            ('title', 'Title (A-Z)'),
-            ('-title', 'Title (Z-A)'),
-        ],
-        initial='-publication_year',
-        widget=forms.Select(attrs={
-            'class': 'form-select'
-        })
-    )
-
-
-# Patents & Projects Forms
-class PatentsProjectsInfoForm(forms.ModelForm):
-    """Form for managing patents & projects information"""
+class ResearchProjectForm(forms.ModelForm):
+    """Form for creating and editing research projects"""
     
     class Meta:
-        model = PatentsProjectsInfo
+        model = ResearchProject
         fields = '__all__'
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Patents & Projects'
+                'placeholder': 'Project title'
             }),
-            'subtitle': forms.Textarea(attrs={
+            'principal_investigator': forms.TextInput(attrs={
                 'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Page subtitle description'
+                'placeholder': 'Principal investigator name'
             }),
-            'total_patents': forms.NumberInput(attrs={
+            'description': forms.Textarea(attrs={
                 'class': 'form-control',
-                'min': 0
+                'rows': 4,
+                'placeholder': 'Project description'
             }),
-            'total_projects': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
+            'department': forms.Select(attrs={
+                'class': 'form-select'
             }),
-            'industry_collaborations': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
+            'status': forms.Select(attrs={
+                'class': 'form-select'
             }),
-            'research_funding': forms.NumberInput(attrs={
+            'start_year': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 0,
-                'step': 0.01
+                'min': 1900,
+                'max': 2030
             }),
-            'innovation_awards': forms.NumberInput(attrs={
+            'end_year': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'min': 1900,
+                'max': 2030
             }),
-            'international_recognition': forms.NumberInput(attrs={
+            'funding_agency': forms.TextInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'placeholder': 'Funding agency'
             }),
-            'active_partnerships': forms.NumberInput(attrs={
+            'funding_amount': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'min': 0,
+                'step': 0.01
             }),
-            'students_involved': forms.NumberInput(attrs={
+            'project_duration': forms.TextInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'placeholder': 'Project duration'
             }),
-            'cta_title': forms.TextInput(attrs={
+            'team_members': forms.Textarea(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Interested in Collaborating?'
+                'rows': 3,
+                'placeholder': 'Team members'
             }),
-            'cta_description': forms.Textarea(attrs={
+            'project_url': forms.URLInput(attrs={
                 'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Call to action description'
+                'placeholder': 'Project URL'
             }),
-            'contact_email': forms.EmailInput(attrs={
+            'report_file': forms.ClearableFileInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., research@college.edu'
+                'accept': '.pdf,.doc,.docx'
+            }),
+            'is_featured': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
             }),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -6036,50 +5781,82 @@ class PatentsProjectsInfoForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         # Add Bootstrap classes to all fields
         for field_name, field in self.fields.items():
-            if field_name not in ['is_active']:
+            if field_name not in ['is_featured', 'is_active']:
                 if not hasattr(field.widget, 'attrs'):
                     field.widget.attrs = {}
                 if 'class' not in field.widget.attrs:
                     field.widget.attrs['class'] = 'form-control'
+    
+    def clean_start_year(self):
+        """Validate start year"""
+        year = self.cleaned_data.get('start_year')
+        current_year = datetime.now().year
+        if year and (year < 1900 or year > current_year + 1):
+            raise ValidationError(f"Start year must be between 1900 and {current_year + 1}.")
+        return year
+    
+    def clean_end_year(self):
+        """Validate end year"""
+        end_year = self.cleaned_data.get('end_year')
+        start_year = self.cleaned_data.get('start_year')
+        current_year = datetime.now().year
+        
+        if end_year and (end_year < 1900 or end_year > current_year + 1):
+            raise ValidationError(f"End year must be between 1900 and {current_year + 1}.")
+        
+        if end_year and start_year and end_year < start_year:
+            raise ValidationError("End year cannot be before start year.")
+        
+        return end_year
 
 
-class PatentsProjectsInfoUpdateForm(PatentsProjectsInfoForm):
-    """Update form for patents & projects information (excludes timestamps)"""
+class ResearchProjectUpdateForm(ResearchProjectForm):
+    """Update form for research projects (excludes timestamps)"""
     
-    class Meta(PatentsProjectsInfoForm.Meta):
+    class Meta(ResearchProjectForm.Meta):
         exclude = ['created_at', 'updated_at']
 
 
-class PatentsProjectsInfoQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential patents & projects information"""
+class ResearchProjectQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential research project fields"""
     
     class Meta:
-        model = PatentsProjectsInfo
+        model = ResearchProject
         fields = [
-            'title', 'subtitle', 'total_patents', 'total_projects', 
-            'contact_email', 'is_active'
+            'title', 'principal_investigator', 'department', 'status',
+            'start_year', 'funding_agency', 'funding_amount', 'is_featured', 'is_active'
         ]
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Patents & Projects'
+                'placeholder': 'Project title'
             }),
-            'subtitle': forms.Textarea(attrs={
+            'principal_investigator': forms.TextInput(attrs={
                 'class': 'form-control',
-                'rows': 2,
-                'placeholder': 'Page subtitle description'
+                'placeholder': 'Principal investigator name'
             }),
-            'total_patents': forms.NumberInput(attrs={
+            'department': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'status': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'start_year': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'min': 1900,
+                'max': 2030
             }),
-            'total_projects': forms.NumberInput(attrs={
+            'funding_agency': forms.TextInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'placeholder': 'Funding agency'
             }),
-            'contact_email': forms.EmailInput(attrs={
+            'funding_amount': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., research@college.edu'
+                'min': 0,
+                'step': 0.01
+            }),
+            'is_featured': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
             }),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -6087,60 +5864,42 @@ class PatentsProjectsInfoQuickEditForm(forms.ModelForm):
         }
 
 
-class PatentForm(forms.ModelForm):
-    """Form for creating and editing patents"""
+class IndustryCollaborationForm(forms.ModelForm):
+    """Form for creating and editing industry collaborations"""
     
     class Meta:
-        model = Patent
+        model = IndustryCollaboration
         fields = '__all__'
         widgets = {
-            'title': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Patent title'
-            }),
-            'inventors': forms.TextInput(attrs={
+            'company_name': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Inventor names (comma separated)'
+                'placeholder': 'Company name'
             }),
             'description': forms.Textarea(attrs={
                 'class': 'form-control',
                 'rows': 4,
-                'placeholder': 'Patent description'
+                'placeholder': 'Collaboration description'
             }),
-            'patent_number': forms.TextInput(attrs={
+            'collaboration_type': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Patent number'
-            }),
-            'status': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'department': forms.Select(attrs={
-                'class': 'form-select'
+                'placeholder': 'Type of collaboration'
             }),
-            'filing_year': forms.NumberInput(attrs={
+            'duration_years': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 1900,
-                'max': 2030
+                'min': 1
             }),
-            'application_number': forms.TextInput(attrs={
+            'funding_amount': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Application number'
+                'min': 0,
+                'step': 0.01
             }),
-            'publication_date': forms.DateInput(attrs={
+            'contact_person': forms.TextInput(attrs={
                 'class': 'form-control',
-                'type': 'date'
+                'placeholder': 'Contact person'
             }),
-            'grant_date': forms.DateInput(attrs={
+            'company_website': forms.URLInput(attrs={
                 'class': 'form-control',
-                'type': 'date'
-            }),
-            'patent_url': forms.URLInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Patent URL'
-            }),
-            'pdf_file': forms.ClearableFileInput(attrs={
-                'class': 'form-control',
-                'accept': '.pdf'
+                'placeholder': 'Company website'
             }),
             'is_featured': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -6159,55 +5918,41 @@ class PatentForm(forms.ModelForm):
                     field.widget.attrs = {}
                 if 'class' not in field.widget.attrs:
                     field.widget.attrs['class'] = 'form-control'
-    
-    def clean_filing_year(self):
-        """Validate filing year"""
-        year = self.cleaned_data.get('filing_year')
-        current_year = datetime.now().year
-        if year and (year < 1900 or year > current_year + 1):
-            raise ValidationError(f"Filing year must be between 1900 and {current_year + 1}.")
-        return year
 
 
-class PatentUpdateForm(PatentForm):
-    """Update form for patents (excludes timestamps)"""
+class IndustryCollaborationUpdateForm(IndustryCollaborationForm):
+    """Update form for industry collaborations (excludes timestamps)"""
     
-    class Meta(PatentForm.Meta):
+    class Meta(IndustryCollaborationForm.Meta):
         exclude = ['created_at', 'updated_at']
 
 
-class PatentQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential patent fields"""
+class IndustryCollaborationQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential industry collaboration fields"""
     
     class Meta:
-        model = Patent
+        model = IndustryCollaboration
         fields = [
-            'title', 'inventors', 'patent_number', 'department', 
-            'filing_year', 'status', 'is_featured', 'is_active'
+            'company_name', 'collaboration_type', 'duration_years', 
+            'funding_amount', 'is_featured', 'is_active'
         ]
         widgets = {
-            'title': forms.TextInput(attrs={
+            'company_name': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Patent title'
+                'placeholder': 'Company name'
             }),
-            'inventors': forms.TextInput(attrs={
+            'collaboration_type': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Inventor names (comma separated)'
+                'placeholder': 'Type of collaboration'
             }),
-            'patent_number': forms.TextInput(attrs={
+            'duration_years': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Patent number'
-            }),
-            'department': forms.Select(attrs={
-                'class': 'form-select'
+                'min': 1
             }),
-            'filing_year': forms.NumberInput(attrs={
+            'funding_amount': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 1900,
-                'max': 2030
-            }),
-            'status': forms.Select(attrs={
-                'class': 'form-select'
+                'min': 0,
+                'step': 0.01
             }),
             'is_featured': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -6218,156 +5963,105 @@ class PatentQuickEditForm(forms.ModelForm):
         }
 
 
-class ResearchProjectForm(forms.ModelForm):
-    """Form for creating and editing research projects"""
+# Consultancy Forms
+class ConsultancyInfoForm(forms.ModelForm):
+    """Form for managing consultancy information"""
     
     class Meta:
-        model = ResearchProject
+        model = ConsultancyInfo
         fields = '__all__'
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Project title'
-            }),
-            'principal_investigator': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Principal investigator name'
-            }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 4,
-                'placeholder': 'Project description'
-            }),
-            'department': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'status': forms.Select(attrs={
-                'class': 'form-select'
+                'placeholder': 'Page title'
             }),
-            'start_year': forms.NumberInput(attrs={
+            'subtitle': forms.Textarea(attrs={
                 'class': 'form-control',
-                'min': 1900,
-                'max': 2030
+                'rows': 3,
+                'placeholder': 'Page subtitle'
             }),
-            'end_year': forms.NumberInput(attrs={
+            'total_projects': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 1900,
-                'max': 2030
+                'min': 0
             }),
-            'funding_agency': forms.TextInput(attrs={
+            'industry_partners': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Funding agency'
+                'min': 0
             }),
-            'funding_amount': forms.NumberInput(attrs={
+            'revenue_generated': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0,
                 'step': 0.01
             }),
-            'project_duration': forms.TextInput(attrs={
+            'client_satisfaction': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Project duration'
+                'min': 0,
+                'max': 100
             }),
-            'team_members': forms.Textarea(attrs={
+            'cta_title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Team members'
+                'placeholder': 'Call to action title'
             }),
-            'project_url': forms.URLInput(attrs={
+            'cta_description': forms.Textarea(attrs={
                 'class': 'form-control',
-                'placeholder': 'Project URL'
+                'rows': 4,
+                'placeholder': 'Call to action description'
             }),
-            'report_file': forms.ClearableFileInput(attrs={
+            'contact_email': forms.EmailInput(attrs={
                 'class': 'form-control',
-                'accept': '.pdf,.doc,.docx'
-            }),
-            'is_featured': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
+                'placeholder': 'Contact email'
             }),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
         }
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Add Bootstrap classes to all fields
-        for field_name, field in self.fields.items():
-            if field_name not in ['is_featured', 'is_active']:
-                if not hasattr(field.widget, 'attrs'):
-                    field.widget.attrs = {}
-                if 'class' not in field.widget.attrs:
-                    field.widget.attrs['class'] = 'form-control'
-    
-    def clean_start_year(self):
-        """Validate start year"""
-        year = self.cleaned_data.get('start_year')
-        current_year = datetime.now().year
-        if year and (year < 1900 or year > current_year + 1):
-            raise ValidationError(f"Start year must be between 1900 and {current_year + 1}.")
-        return year
-    
-    def clean_end_year(self):
-        """Validate end year"""
-        end_year = self.cleaned_data.get('end_year')
-        start_year = self.cleaned_data.get('start_year')
-        current_year = datetime.now().year
-        
-        if end_year and (end_year < 1900 or end_year > current_year + 1):
-            raise ValidationError(f"End year must be between 1900 and {current_year + 1}.")
-        
-        if end_year and start_year and end_year < start_year:
-            raise ValidationError("End year cannot be before start year.")
-        
-        return end_year
+    def clean_client_satisfaction(self):
+        """Validate client satisfaction percentage"""
+        satisfaction = self.cleaned_data.get('client_satisfaction')
+        if satisfaction and (satisfaction < 0 or satisfaction > 100):
+            raise ValidationError("Client satisfaction must be between 0 and 100.")
+        return satisfaction
 
 
-class ResearchProjectUpdateForm(ResearchProjectForm):
-    """Update form for research projects (excludes timestamps)"""
+class ConsultancyInfoUpdateForm(ConsultancyInfoForm):
+    """Update form for consultancy information (excludes timestamps)"""
     
-    class Meta(ResearchProjectForm.Meta):
+    class Meta(ConsultancyInfoForm.Meta):
         exclude = ['created_at', 'updated_at']
 
 
-class ResearchProjectQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential research project fields"""
+class ConsultancyInfoQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential consultancy information fields"""
     
     class Meta:
-        model = ResearchProject
+        model = ConsultancyInfo
         fields = [
-            'title', 'principal_investigator', 'department', 'status',
-            'start_year', 'funding_agency', 'funding_amount', 'is_featured', 'is_active'
+            'title', 'total_projects', 'industry_partners', 
+            'revenue_generated', 'client_satisfaction', 'is_active'
         ]
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Project title'
-            }),
-            'principal_investigator': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Principal investigator name'
-            }),
-            'department': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'status': forms.Select(attrs={
-                'class': 'form-select'
+                'placeholder': 'Page title'
             }),
-            'start_year': forms.NumberInput(attrs={
+            'total_projects': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 1900,
-                'max': 2030
+                'min': 0
             }),
-            'funding_agency': forms.TextInput(attrs={
+            'industry_partners': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Funding agency'
+                'min': 0
             }),
-            'funding_amount': forms.NumberInput(attrs={
+            'revenue_generated': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': 0,
                 'step': 0.01
             }),
-            'is_featured': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
+            'client_satisfaction': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0,
+                'max': 100
             }),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -6375,42 +6069,40 @@ class ResearchProjectQuickEditForm(forms.ModelForm):
         }
 
 
-class IndustryCollaborationForm(forms.ModelForm):
-    """Form for creating and editing industry collaborations"""
+class ConsultancyServiceForm(forms.ModelForm):
+    """Form for managing consultancy services"""
     
     class Meta:
-        model = IndustryCollaboration
+        model = ConsultancyService
         fields = '__all__'
         widgets = {
-            'company_name': forms.TextInput(attrs={
+            'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Company name'
+                'placeholder': 'Service title'
             }),
             'description': forms.Textarea(attrs={
                 'class': 'form-control',
-                'rows': 4,
-                'placeholder': 'Collaboration description'
+                'rows': 3,
+                'placeholder': 'Service description'
             }),
-            'collaboration_type': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Type of collaboration'
+            'service_type': forms.Select(attrs={
+                'class': 'form-select'
             }),
-            'duration_years': forms.NumberInput(attrs={
+            'features': forms.Textarea(attrs={
                 'class': 'form-control',
-                'min': 1
+                'rows': 4,
+                'placeholder': 'Service features (one per line)'
             }),
-            'funding_amount': forms.NumberInput(attrs={
+            'icon_class': forms.TextInput(attrs={
                 'class': 'form-control',
-                'min': 0,
-                'step': 0.01
+                'placeholder': 'FontAwesome icon class (e.g., fas fa-laptop-code)'
             }),
-            'contact_person': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Contact person'
+            'color_class': forms.Select(attrs={
+                'class': 'form-select'
             }),
-            'company_website': forms.URLInput(attrs={
+            'display_order': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Company website'
+                'min': 0
             }),
             'is_featured': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -6420,280 +6112,6 @@ class IndustryCollaborationForm(forms.ModelForm):
             }),
         }
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Add Bootstrap classes to all fields
-        for field_name, field in self.fields.items():
-            if field_name not in ['is_featured', 'is_active']:
-                if not hasattr(field.widget, 'attrs'):
-                    field.widget.attrs = {}
-                if 'class' not in field.widget.attrs:
-                    field.widget.attrs['class'] = 'form-control'
-
-
-class IndustryCollaborationUpdateForm(IndustryCollaborationForm):
-    """Update form for industry collaborations (excludes timestamps)"""
-    
-    class Meta(IndustryCollaborationForm.Meta):
-        exclude = ['created_at', 'updated_at']
-
-
-class IndustryCollaborationQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential industry collaboration fields"""
-    
-    class Meta:
-        model = IndustryCollaboration
-        fields = [
-            'company_name', 'collaboration_type', 'duration_years', 
-            'funding_amount', 'is_featured', 'is_active'
-        ]
-        widgets = {
-            'company_name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Company name'
-            }),
-            'collaboration_type': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Type of collaboration'
-            }),
-            'duration_years': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 1
-            }),
-            'funding_amount': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0,
-                'step': 0.01
-            }),
-            'is_featured': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-        }
-
-
-# Consultancy Forms
-class ConsultancyInfoForm(forms.ModelForm):
-    """Form for managing consultancy information"""
-    
-    class Meta:
-        model = ConsultancyInfo
-=======
-        
-        help_texts = {
-            'title': 'Main title displayed on the infrastructure page',
-            'subtitle': 'Brief subtitle or tagline for the page',
-            'hero_title': 'Title for the hero/banner section',
-            'hero_subtitle': 'Description text for the hero section',
-            'hero_image': 'Background image for the hero section (recommended: 1920x600px)',
-            'hero_badge_text': 'Small badge text displayed on the hero section',
-            'overview_title': 'Title for the overview section',
-            'overview_description': 'Detailed description of your infrastructure',
-            'cta_title': 'Title for the call-to-action section',
-            'cta_description': 'Description for the call-to-action section',
-            'cta_button_text': 'Text for the call-to-action button',
-            'cta_button_url': 'URL where the call-to-action button should link',
-            'is_active': 'Make this infrastructure information visible on the website'
-        }
-    
-    def clean_title(self):
-        """Validate title"""
-        title = self.cleaned_data.get('title')
-        if title:
-            title = title.strip()
-            if len(title) < 3:
-                raise forms.ValidationError('Title must be at least 3 characters long.')
-        return title
-    
-    def clean_cta_button_url(self):
-        """Validate CTA button URL"""
-        url = self.cleaned_data.get('cta_button_url')
-        if url and not url.startswith(('/', 'http://', 'https://')):
-            raise forms.ValidationError('URL must start with /, http://, or https://')
-        return url
-
-
-class InfrastructureStatisticForm(forms.ModelForm):
-    """Enhanced form for Infrastructure Statistics with icon and color selection"""
-    
-    class Meta:
-        model = InfrastructureStatistic
->>>>>>> a11168e (Fix)
-        fields = '__all__'
-        widgets = {
-            'title': forms.TextInput(attrs={
-                'class': 'form-control',
-<<<<<<< HEAD
-                'placeholder': 'Page title'
-            }),
-            'subtitle': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Page subtitle'
-            }),
-            'total_projects': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'industry_partners': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'revenue_generated': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0,
-                'step': 0.01
-            }),
-            'client_satisfaction': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0,
-                'max': 100
-            }),
-            'cta_title': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Call to action title'
-            }),
-            'cta_description': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 4,
-                'placeholder': 'Call to action description'
-            }),
-            'contact_email': forms.EmailInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Contact email'
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-        }
-    
-    def clean_client_satisfaction(self):
-        """Validate client satisfaction percentage"""
-        satisfaction = self.cleaned_data.get('client_satisfaction')
-        if satisfaction and (satisfaction < 0 or satisfaction > 100):
-            raise ValidationError("Client satisfaction must be between 0 and 100.")
-        return satisfaction
-
-
-class ConsultancyInfoUpdateForm(ConsultancyInfoForm):
-    """Update form for consultancy information (excludes timestamps)"""
-    
-    class Meta(ConsultancyInfoForm.Meta):
-        exclude = ['created_at', 'updated_at']
-
-
-class ConsultancyInfoQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential consultancy information fields"""
-    
-    class Meta:
-        model = ConsultancyInfo
-        fields = [
-            'title', 'total_projects', 'industry_partners', 
-            'revenue_generated', 'client_satisfaction', 'is_active'
-        ]
-        widgets = {
-            'title': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Page title'
-            }),
-            'total_projects': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'industry_partners': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0
-            }),
-            'revenue_generated': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0,
-                'step': 0.01
-            }),
-            'client_satisfaction': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0,
-                'max': 100
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-        }
-
-
-class ConsultancyServiceForm(forms.ModelForm):
-    """Form for managing consultancy services"""
-    
-    class Meta:
-        model = ConsultancyService
-        fields = '__all__'
-        widgets = {
-            'title': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Service title'
-            }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Service description'
-            }),
-            'service_type': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'features': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 4,
-                'placeholder': 'Service features (one per line)'
-            }),
-            'icon_class': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'FontAwesome icon class (e.g., fas fa-laptop-code)'
-=======
-                'placeholder': 'e.g., Classrooms, Laboratories, WiFi Coverage',
-                'maxlength': '100'
-            }),
-            'value': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., 25+, 100%, 5000+',
-                'maxlength': '50'
-            }),
-            'description': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Optional description of the statistic',
-                'maxlength': '200'
-            }),
-            'icon_class': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., fas fa-building, fas fa-wifi, fas fa-book',
-                'maxlength': '100'
-            }),
-            'statistic_type': forms.Select(attrs={
-                'class': 'form-select'
->>>>>>> a11168e (Fix)
-            }),
-            'color_class': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'display_order': forms.NumberInput(attrs={
-                'class': 'form-control',
-<<<<<<< HEAD
-                'min': 0
-            }),
-            'is_featured': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-=======
-                'min': '0',
-                'max': '999',
-                'placeholder': '0'
->>>>>>> a11168e (Fix)
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-        }
-<<<<<<< HEAD
-    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Add color choices
@@ -7079,14 +6497,717 @@ class NSSNCCNoticeQuickEditForm(forms.ModelForm):
             'title': forms.TextInput(attrs={
                 'class': 'form-control'
             }),
-            'category': forms.Select(attrs={
-                'class': 'form-select'
+            'category': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'priority': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'related_club': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'is_featured': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['related_club'].queryset = NSSNCCClub.objects.filter(is_active=True)
+
+
+class NSSNCCGalleryForm(forms.ModelForm):
+    """Form for managing NSS-NCC Gallery Images"""
+    
+    class Meta:
+        model = NSSNCCGallery
+        fields = '__all__'
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Image title'
+            }),
+            'description': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 3,
+                'placeholder': 'Image description'
+            }),
+            'category': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'related_club': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'image': forms.FileInput(attrs={
+                'class': 'form-control',
+                'accept': 'image/*'
+            }),
+            'display_order': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'is_featured': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['related_club'].queryset = NSSNCCClub.objects.filter(is_active=True)
+
+
+class NSSNCCAchievementForm(forms.ModelForm):
+    """Form for managing NSS-NCC Achievements"""
+    
+    class Meta:
+        model = NSSNCCAchievement
+        fields = '__all__'
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Achievement title'
+            }),
+            'description': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 4,
+                'placeholder': 'Achievement description'
+            }),
+            'achievement_type': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'related_club': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'achieved_by': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Individual or team name'
+            }),
+            'achievement_date': forms.DateInput(attrs={
+                'class': 'form-control',
+                'type': 'date'
+            }),
+            'organization': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Organization name'
+            }),
+            'certificate_image': forms.FileInput(attrs={
+                'class': 'form-control',
+                'accept': 'image/*'
+            }),
+            'display_order': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': 0
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'is_featured': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['related_club'].queryset = NSSNCCClub.objects.filter(is_active=True)
+    
+    def clean_achievement_date(self):
+        """Validate achievement date"""
+        achievement_date = self.cleaned_data.get('achievement_date')
+        if achievement_date and achievement_date > datetime.now().date():
+            raise ValidationError("Achievement date cannot be in the future.")
+        return achievement_date
+
+
+class NSSNCCAchievementQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential achievement fields"""
+    
+    class Meta:
+        model = NSSNCCAchievement
+        fields = [
+            'title', 'achievement_type', 'related_club',
+            'achievement_date', 'is_featured', 'is_active'
+        ]
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control'
+            }),
+            'achievement_type': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'related_club': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'achievement_date': forms.DateInput(attrs={
+                'class': 'form-control',
+                'type': 'date'
+            }),
+            'is_featured': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['related_club'].queryset = NSSNCCClub.objects.filter(is_active=True)
+
+class HeroCarouselSlideForm(forms.ModelForm):
+    """Comprehensive form for managing hero carousel slides"""
+    
+    class Meta:
+        model = HeroCarouselSlide
+        fields = '__all__'
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Enter slide title...'
+            }),
+            'subtitle': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 3,
+                'placeholder': 'Enter slide subtitle/description...'
+            }),
+            'slide_type': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'display_order': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': '0'
+            }),
+            'badge_text': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Welcome to Excellence'
+            }),
+            'badge_icon': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., fas fa-star'
+            }),
+            'primary_button_text': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Explore Programs'
+            }),
+            'primary_button_url': forms.URLInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'https://example.com'
+            }),
+            'primary_button_icon': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., fas fa-arrow-right'
+            }),
+            'secondary_button_text': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Learn More'
+            }),
+            'secondary_button_url': forms.URLInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'https://example.com'
+            }),
+            'secondary_button_icon': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., fas fa-info-circle'
+            }),
+            'gradient_type': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'show_statistics': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'stat_1_number': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., 18+'
+            }),
+            'stat_1_label': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Courses'
+            }),
+            'stat_1_icon': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., fas fa-graduation-cap'
+            }),
+            'stat_2_number': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., 5000+'
+            }),
+            'stat_2_label': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Students'
+            }),
+            'stat_2_icon': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., fas fa-users'
+            }),
+            'stat_3_number': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., 150+'
+            }),
+            'stat_3_label': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Faculty'
+            }),
+            'stat_3_icon': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., fas fa-chalkboard-teacher'
+            }),
+            'stat_4_number': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., 25+'
+            }),
+            'stat_4_label': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Years'
+            }),
+            'stat_4_icon': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., fas fa-award'
+            }),
+            'show_content_cards': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'content_title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Why Choose Us?'
+            }),
+            'content_icon': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., fas fa-university'
+            }),
+            'content_items': CKEditor5Widget(attrs={
+                'class': 'form-control'
+            }),
+            'auto_play_interval': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': '1000',
+                'step': '500'
+            }),
+            'show_indicators': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'show_controls': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Add help text for better user experience
+        self.fields['title'].help_text = "Main heading that appears prominently on the slide"
+        self.fields['subtitle'].help_text = "Descriptive text that appears below the title"
+        self.fields['slide_type'].help_text = "Choose the type of slide to apply appropriate styling"
+        self.fields['display_order'].help_text = "Lower numbers appear first (0 = first slide)"
+        self.fields['badge_text'].help_text = "Optional badge text that appears above the title"
+        self.fields['badge_icon'].help_text = "FontAwesome icon class (e.g., fas fa-star, fas fa-heart)"
+        self.fields['primary_button_text'].help_text = "Text for the main call-to-action button"
+        self.fields['primary_button_url'].help_text = "URL where the primary button should link"
+        self.fields['secondary_button_text'].help_text = "Text for the secondary button (optional)"
+        self.fields['secondary_button_url'].help_text = "URL where the secondary button should link"
+        self.fields['gradient_type'].help_text = "Choose a predefined gradient or create custom"
+        self.fields['show_statistics'].help_text = "Display statistics cards on the right side"
+        self.fields['auto_play_interval'].help_text = "Time in milliseconds between automatic slide changes"
+        self.fields['content_items'].help_text = "HTML content for custom slides (use CKEditor for rich formatting)"
+
+
+class HeroCarouselSlideQuickEditForm(forms.ModelForm):
+    """Quick edit form for essential hero carousel slide fields"""
+    
+    class Meta:
+        model = HeroCarouselSlide
+        fields = [
+            'title', 'subtitle', 'slide_type', 'is_active', 'display_order',
+            'badge_text', 'primary_button_text', 'primary_button_url',
+            'secondary_button_text', 'secondary_button_url', 'gradient_type'
+        ]
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control form-control-sm'
+            }),
+            'subtitle': forms.Textarea(attrs={
+                'class': 'form-control form-control-sm',
+                'rows': 2
+            }),
+            'slide_type': forms.Select(attrs={
+                'class': 'form-select form-select-sm'
+            }),
+            'is_active': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'display_order': forms.NumberInput(attrs={
+                'class': 'form-control form-control-sm',
+                'min': '0'
+            }),
+            'badge_text': forms.TextInput(attrs={
+                'class': 'form-control form-control-sm'
+            }),
+            'primary_button_text': forms.TextInput(attrs={
+                'class': 'form-control form-control-sm'
+            }),
+            'primary_button_url': forms.URLInput(attrs={
+                'class': 'form-control form-control-sm'
+            }),
+            'secondary_button_text': forms.TextInput(attrs={
+                'class': 'form-control form-control-sm'
+            }),
+            'secondary_button_url': forms.URLInput(attrs={
+                'class': 'form-control form-control-sm'
+            }),
+            'gradient_type': forms.Select(attrs={
+                'class': 'form-select form-select-sm'
+            }),
+        }
+
+
+class HeroCarouselSettingsForm(forms.ModelForm):
+    """Form for managing global hero carousel settings"""
+    
+    class Meta:
+        model = HeroCarouselSettings
+        fields = '__all__'
+        widgets = {
+            'is_enabled': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'auto_play': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'default_interval': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': '1000',
+                'step': '500'
+            }),
+            'show_indicators': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'show_controls': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'pause_on_hover': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'enable_keyboard': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'enable_touch': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'transition_duration': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': '100',
+                'step': '50'
+            }),
+            'fade_effect': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'mobile_height': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., 24rem, 70vh'
+            }),
+            'tablet_height': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., 28rem, 80vh'
+            }),
+            'desktop_height': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., 24rem, 100vh'
+            }),
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Add help text for better user experience
+        self.fields['is_enabled'].help_text = "Enable or disable the entire hero carousel"
+        self.fields['auto_play'].help_text = "Automatically advance slides"
+        self.fields['default_interval'].help_text = "Default time between slide changes (milliseconds)"
+        self.fields['show_indicators'].help_text = "Show dots at the bottom for slide navigation"
+        self.fields['show_controls'].help_text = "Show left/right arrow navigation buttons"
+        self.fields['pause_on_hover'].help_text = "Pause auto-play when user hovers over carousel"
+        self.fields['enable_keyboard'].help_text = "Allow keyboard navigation (arrow keys)"
+        self.fields['enable_touch'].help_text = "Allow touch/swipe navigation on mobile devices"
+        self.fields['transition_duration'].help_text = "Duration of slide transition animation (milliseconds)"
+        self.fields['fade_effect'].help_text = "Use fade transition instead of slide transition"
+        self.fields['mobile_height'].help_text = "Carousel height on mobile devices (CSS units)"
+        self.fields['tablet_height'].help_text = "Carousel height on tablet devices (CSS units)"
+        self.fields['desktop_height'].help_text = "Carousel height on desktop devices (CSS units)"
+
+
+class MultipleFileInput(forms.FileInput):
+    """Custom widget that supports multiple file uploads"""
+    allow_multiple_selected = True
+
+    def __init__(self, attrs=None):
+        super().__init__(attrs)
+        if attrs is not None:
+            self.attrs.update(attrs)
+        self.attrs['multiple'] = True
+
+    def value_from_datadict(self, data, files, name):
+        if hasattr(files, 'getlist'):
+            return files.getlist(name)
+        return files.get(name)
+
+
+class MultipleInfrastructurePhotoForm(forms.Form):
+    """Form for uploading multiple infrastructure photos at once"""
+    
+    # Multiple file upload field
+    images = forms.FileField(
+        widget=MultipleFileInput(attrs={
+            'class': 'form-control',
+            'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp',
+            'data-max-size': '5120',  # 5MB in KB
+            'data-allowed-types': 'jpeg,jpg,png,gif,webp'
+        }),
+        help_text='Select multiple image files (JPEG, PNG, GIF, WebP). Maximum size: 5MB per file. You can select multiple files at once.',
+        label='Photo Files'
+    )
+    
+    # Common settings for all photos
+    section_type = forms.ChoiceField(
+        choices=InfrastructurePhoto.PHOTO_SECTIONS,
+        widget=forms.Select(attrs={
+            'class': 'form-select',
+            'required': True
+        }),
+        help_text='Select the infrastructure section for all photos',
+        label='Section Type'
+    )
+    
+    academic_facility = forms.ModelChoiceField(
+        queryset=AcademicFacility.objects.filter(is_active=True),
+        required=False,
+        empty_label="Select Academic Facility (Optional)",
+        widget=forms.Select(attrs={
+            'class': 'form-select'
+        }),
+        help_text='Associate all photos with a specific academic facility (optional)',
+        label='Academic Facility'
+    )
+    
+    sports_facility = forms.ModelChoiceField(
+        queryset=SportsFacility.objects.filter(is_active=True),
+        required=False,
+        empty_label="Select Sports Facility (Optional)",
+        widget=forms.Select(attrs={
+            'class': 'form-select'
+        }),
+        help_text='Associate all photos with a specific sports facility (optional)',
+        label='Sports Facility'
+    )
+    
+    technology_infrastructure = forms.ModelChoiceField(
+        queryset=TechnologyInfrastructure.objects.filter(is_active=True),
+        required=False,
+        empty_label="Select Technology Infrastructure (Optional)",
+        widget=forms.Select(attrs={
+            'class': 'form-select'
+        }),
+        help_text='Associate all photos with specific technology infrastructure (optional)',
+        label='Technology Infrastructure'
+    )
+    
+    student_amenity = forms.ModelChoiceField(
+        queryset=StudentAmenity.objects.filter(is_active=True),
+        required=False,
+        empty_label="Select Student Amenity (Optional)",
+        widget=forms.Select(attrs={
+            'class': 'form-select'
+        }),
+        help_text='Associate all photos with a specific student amenity (optional)',
+        label='Student Amenity'
+    )
+    
+    # Common display settings
+    is_featured = forms.BooleanField(
+        required=False,
+        initial=False,
+        widget=forms.CheckboxInput(attrs={
+            'class': 'form-check-input'
+        }),
+        help_text='Feature all photos prominently in the gallery',
+        label='Featured Photos'
+    )
+    
+    is_active = forms.BooleanField(
+        required=False,
+        initial=True,
+        widget=forms.CheckboxInput(attrs={
+            'class': 'form-check-input'
+        }),
+        help_text='Make all photos visible on the website',
+        label='Active Photos'
+    )
+    
+    # Auto-generate titles option
+    auto_generate_titles = forms.BooleanField(
+        required=False,
+        initial=True,
+        widget=forms.CheckboxInput(attrs={
+            'class': 'form-check-input'
+        }),
+        help_text='Automatically generate titles from filenames (uncheck to set custom titles)',
+        label='Auto-generate Titles'
+    )
+    
+    def clean_images(self):
+        """Validate uploaded images"""
+        images = self.files.getlist('images')
+        
+        if not images:
+            raise forms.ValidationError('Please select at least one image file.')
+        
+        if len(images) > 20:
+            raise forms.ValidationError('You can upload a maximum of 20 images at once.')
+        
+        for image in images:
+            # Check file size (max 5MB)
+            if hasattr(image, 'size') and image.size > 5 * 1024 * 1024:
+                raise forms.ValidationError(
+                    f'Image "{image.name}" is too large. Maximum size allowed is 5MB. '
+                    f'Your file is {image.size / (1024 * 1024):.1f}MB.'
+                )
+            
+            # Check file type
+            if hasattr(image, 'content_type'):
+                allowed_types = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp']
+                if image.content_type not in allowed_types:
+                    raise forms.ValidationError(
+                        f'Invalid file type for "{image.name}". Please upload a JPEG, PNG, GIF, or WebP image.'
+                    )
+            
+            # Check file name extension
+            if hasattr(image, 'name'):
+                allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+                file_extension = os.path.splitext(image.name)[1].lower()
+                if file_extension not in allowed_extensions:
+                    raise forms.ValidationError(
+                        f'Invalid file extension for "{image.name}". Allowed extensions: .jpg, .jpeg, .png, .gif, .webp'
+                    )
+        
+        return images
+    
+    def clean(self):
+        """Comprehensive form validation"""
+        cleaned_data = super().clean()
+        
+        # Get facility selections
+        academic_facility = cleaned_data.get('academic_facility')
+        sports_facility = cleaned_data.get('sports_facility')
+        technology_infrastructure = cleaned_data.get('technology_infrastructure')
+        student_amenity = cleaned_data.get('student_amenity')
+        
+        # Validate that only one facility type is selected
+        facility_count = sum([
+            bool(academic_facility),
+            bool(sports_facility),
+            bool(technology_infrastructure),
+            bool(student_amenity)
+        ])
+        
+        if facility_count > 1:
+            raise forms.ValidationError(
+                'Please select only one facility type. All photos can only be associated with one specific facility.'
+            )
+        
+        return cleaned_data
+    
+    def save(self):
+        """Save multiple photos with the provided settings"""
+        images = self.cleaned_data['images']
+        section_type = self.cleaned_data['section_type']
+        academic_facility = self.cleaned_data.get('academic_facility')
+        sports_facility = self.cleaned_data.get('sports_facility')
+        technology_infrastructure = self.cleaned_data.get('technology_infrastructure')
+        student_amenity = self.cleaned_data.get('student_amenity')
+        is_featured = self.cleaned_data.get('is_featured', False)
+        is_active = self.cleaned_data.get('is_active', True)
+        auto_generate_titles = self.cleaned_data.get('auto_generate_titles', True)
+        
+        created_photos = []
+        
+        for i, image in enumerate(images):
+            # Generate title from filename if auto-generate is enabled
+            if auto_generate_titles:
+                title = os.path.splitext(image.name)[0].replace('_', ' ').replace('-', ' ').title()
+            else:
+                title = f"Photo {i + 1}"
+            
+            # Create InfrastructurePhoto instance
+            photo = InfrastructurePhoto(
+                title=title,
+                image=image,
+                section_type=section_type,
+                academic_facility=academic_facility,
+                sports_facility=sports_facility,
+                technology_infrastructure=technology_infrastructure,
+                student_amenity=student_amenity,
+                is_featured=is_featured,
+                is_active=is_active,
+                display_order=i  # Set display order based on upload order
+            )
+            
+            # Validate the photo instance
+            photo.full_clean()
+            photo.save()
+            created_photos.append(photo)
+        
+        return created_photos
+
+
+class InfrastructurePhotoForm(forms.ModelForm):
+    """Enhanced form for managing individual infrastructure photos with better validation and UI"""
+    
+    class Meta:
+        model = InfrastructurePhoto
+        fields = '__all__'
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control tw-rounded-lg',
+                'placeholder': 'Enter photo title/caption',
+                'maxlength': '200',
+                'required': True
+            }),
+            'description': forms.Textarea(attrs={
+                'class': 'form-control tw-rounded-lg',
+                'rows': 3,
+                'placeholder': 'Enter photo description (optional)',
+                'maxlength': '1000'
+            }),
+            'image': forms.ClearableFileInput(attrs={
+                'class': 'form-control tw-rounded-lg',
+                'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp',
+                'data-max-size': '5120',  # 5MB in KB
+                'data-allowed-types': 'jpeg,jpg,png,gif,webp'
+            }),
+            'section_type': forms.Select(attrs={
+                'class': 'form-select tw-rounded-lg',
+                'required': True
             }),
-            'priority': forms.Select(attrs={
-                'class': 'form-select'
+            'academic_facility': forms.Select(attrs={
+                'class': 'form-select tw-rounded-lg'
             }),
-            'related_club': forms.Select(attrs={
-                'class': 'form-select'
+            'sports_facility': forms.Select(attrs={
+                'class': 'form-select tw-rounded-lg'
+            }),
+            'technology_infrastructure': forms.Select(attrs={
+                'class': 'form-select tw-rounded-lg'
+            }),
+            'student_amenity': forms.Select(attrs={
+                'class': 'form-select tw-rounded-lg'
+            }),
+            'display_order': forms.NumberInput(attrs={
+                'class': 'form-control tw-rounded-lg',
+                'min': '0',
+                'max': '999',
+                'placeholder': '0'
             }),
             'is_featured': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -7095,259 +7216,321 @@ class NSSNCCNoticeQuickEditForm(forms.ModelForm):
                 'class': 'form-check-input'
             }),
         }
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['related_club'].queryset = NSSNCCClub.objects.filter(is_active=True)
-
-
-class NSSNCCGalleryForm(forms.ModelForm):
-    """Form for managing NSS-NCC Gallery Images"""
-    
-    class Meta:
-        model = NSSNCCGallery
-=======
         
         help_texts = {
-            'title': 'Name of the statistic (e.g., "Classrooms", "Laboratories")',
-            'value': 'The statistic value (e.g., "25+", "100%", "5000+")',
-            'description': 'Optional additional description for the statistic',
-            'icon_class': 'Font Awesome icon class (e.g., fas fa-building, fas fa-wifi)',
-            'statistic_type': 'Category of the statistic for better organization',
-            'color_class': 'Color theme for the statistic display (blue, emerald, purple, orange)',
-            'display_order': 'Order in which statistics appear (lower numbers first)',
-            'is_active': 'Make this statistic visible on the website'
+            'title': 'A descriptive title for the photo (required)',
+            'description': 'Optional detailed description of the photo content',
+            'image': 'Upload an image file (JPEG, PNG, GIF, WebP). Maximum size: 5MB. Recommended dimensions: 800x600px or larger.',
+            'section_type': 'Select the infrastructure section this photo belongs to',
+            'academic_facility': 'Associate this photo with a specific academic facility (optional)',
+            'sports_facility': 'Associate this photo with a specific sports facility (optional)',
+            'technology_infrastructure': 'Associate this photo with specific technology infrastructure (optional)',
+            'student_amenity': 'Associate this photo with a specific student amenity (optional)',
+            'display_order': 'Display order within the section (lower numbers appear first)',
+            'is_featured': 'Feature this photo prominently in the gallery',
+            'is_active': 'Make this photo visible on the website'
+        }
+        
+        labels = {
+            'title': 'Photo Title',
+            'description': 'Description',
+            'image': 'Photo File',
+            'section_type': 'Section Type',
+            'academic_facility': 'Academic Facility',
+            'sports_facility': 'Sports Facility',
+            'technology_infrastructure': 'Technology Infrastructure',
+            'student_amenity': 'Student Amenity',
+            'display_order': 'Display Order',
+            'is_featured': 'Featured Photo',
+            'is_active': 'Active'
         }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        # Add custom choices for color_class
-        self.fields['color_class'].widget = forms.Select(choices=[
-            ('blue', 'Blue'),
-            ('emerald', 'Emerald'),
-            ('purple', 'Purple'),
-            ('orange', 'Orange'),
-            ('red', 'Red'),
-            ('green', 'Green'),
-            ('indigo', 'Indigo'),
-            ('pink', 'Pink'),
-        ])
+        # Add empty option for foreign key fields
+        self.fields['academic_facility'].empty_label = "Select Academic Facility (Optional)"
+        self.fields['sports_facility'].empty_label = "Select Sports Facility (Optional)"
+        self.fields['technology_infrastructure'].empty_label = "Select Technology Infrastructure (Optional)"
+        self.fields['student_amenity'].empty_label = "Select Student Amenity (Optional)"
+        
+        # Filter to only show active facilities
+        self.fields['academic_facility'].queryset = AcademicFacility.objects.filter(is_active=True)
+        self.fields['sports_facility'].queryset = SportsFacility.objects.filter(is_active=True)
+        self.fields['technology_infrastructure'].queryset = TechnologyInfrastructure.objects.filter(is_active=True)
+        self.fields['student_amenity'].queryset = StudentAmenity.objects.filter(is_active=True)
+        
+        # Add CSS classes for better styling
+        for field_name, field in self.fields.items():
+            if field_name not in ['image']:  # Image field already has custom styling
+                if 'class' not in field.widget.attrs:
+                    field.widget.attrs.update({'class': 'form-control tw-rounded-lg'})
+    
+    def clean_image(self):
+        """Validate uploaded image"""
+        image = self.cleaned_data.get('image')
+        if image:
+            # Check file size (max 5MB)
+            if hasattr(image, 'size') and image.size > 5 * 1024 * 1024:
+                raise forms.ValidationError(
+                    'Image file is too large. Maximum size allowed is 5MB. '
+                    f'Your file is {image.size / (1024 * 1024):.1f}MB.'
+                )
+            
+            # Check file type
+            if hasattr(image, 'content_type'):
+                allowed_types = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp']
+                if image.content_type not in allowed_types:
+                    raise forms.ValidationError(
+                        'Invalid file type. Please upload a JPEG, PNG, GIF, or WebP image.'
+                    )
+            
+            # Check file name extension
+            if hasattr(image, 'name'):
+                allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+                file_extension = os.path.splitext(image.name)[1].lower()
+                if file_extension not in allowed_extensions:
+                    raise forms.ValidationError(
+                        'Invalid file extension. Allowed extensions: .jpg, .jpeg, .png, .gif, .webp'
+                    )
+        
+        return image
     
     def clean_title(self):
         """Validate title"""
         title = self.cleaned_data.get('title')
         if title:
             title = title.strip()
-            if len(title) < 2:
-                raise forms.ValidationError('Title must be at least 2 characters long.')
+            if len(title) < 3:
+                raise forms.ValidationError('Title must be at least 3 characters long.')
         return title
     
-    def clean_value(self):
-        """Validate value"""
-        value = self.cleaned_data.get('value')
-        if value:
-            value = value.strip()
-            if len(value) < 1:
-                raise forms.ValidationError('Value cannot be empty.')
-        return value
+    def clean_display_order(self):
+        """Validate display order"""
+        display_order = self.cleaned_data.get('display_order')
+        if display_order is not None and display_order < 0:
+            raise forms.ValidationError('Display order must be a non-negative number.')
+        return display_order
+    
+    def clean(self):
+        """Comprehensive form validation"""
+        cleaned_data = super().clean()
+        
+        # Get facility selections
+        academic_facility = cleaned_data.get('academic_facility')
+        sports_facility = cleaned_data.get('sports_facility')
+        technology_infrastructure = cleaned_data.get('technology_infrastructure')
+        student_amenity = cleaned_data.get('student_amenity')
+        
+        # Validate that only one facility type is selected
+        facility_count = sum([
+            bool(academic_facility),
+            bool(sports_facility),
+            bool(technology_infrastructure),
+            bool(student_amenity)
+        ])
+        
+        if facility_count > 1:
+            raise forms.ValidationError(
+                'Please select only one facility type. A photo can only be associated with one specific facility.'
+            )
+        
+        # Note: It's okay to have no facility selected - photos can be general infrastructure
+        
+        return cleaned_data
 
 
-class AcademicFacilityForm(forms.ModelForm):
-    """Enhanced form for Academic Facilities with features management"""
+class InfrastructurePhotoInlineForm(forms.ModelForm):
+    """Simplified form for inline usage in admin"""
     
     class Meta:
-        model = AcademicFacility
->>>>>>> a11168e (Fix)
-        fields = '__all__'
+        model = InfrastructurePhoto
+        fields = ['title', 'image', 'is_featured', 'is_active', 'display_order']
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-<<<<<<< HEAD
-                'placeholder': 'Image title'
-            }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Image description'
-            }),
-            'category': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'related_club': forms.Select(attrs={
-                'class': 'form-select'
+                'placeholder': 'Enter photo title/caption',
+                'maxlength': '200',
+                'required': True
             }),
-            'image': forms.FileInput(attrs={
+            'image': forms.ClearableFileInput(attrs={
                 'class': 'form-control',
-                'accept': 'image/*'
+                'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp'
             }),
             'display_order': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'min': '0',
+                'max': '999',
+                'placeholder': '0'
             }),
-            'is_active': forms.CheckboxInput(attrs={
+            'is_featured': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
-            'is_featured': forms.CheckboxInput(attrs={
+            'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
         }
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['related_club'].queryset = NSSNCCClub.objects.filter(is_active=True)
 
 
-class NSSNCCAchievementForm(forms.ModelForm):
-    """Form for managing NSS-NCC Achievements"""
+# Enhanced Infrastructure Model Forms
+
+class InfrastructureInfoForm(forms.ModelForm):
+    """Enhanced form for Infrastructure Information management with rich text editing"""
     
     class Meta:
-        model = NSSNCCAchievement
+        model = InfrastructureInfo
         fields = '__all__'
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Achievement title'
-=======
-                'placeholder': 'e.g., Smart Classrooms, Modern Laboratories',
+                'placeholder': 'e.g., Infrastructure & Facilities',
                 'maxlength': '200'
->>>>>>> a11168e (Fix)
             }),
-            'description': forms.Textarea(attrs={
+            'subtitle': forms.TextInput(attrs={
                 'class': 'form-control',
-                'rows': 4,
-<<<<<<< HEAD
-                'placeholder': 'Achievement description'
+                'placeholder': 'Brief description of infrastructure',
+                'maxlength': '300'
             }),
-            'achievement_type': forms.Select(attrs={
-                'class': 'form-select'
+            'hero_title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Hero section title',
+                'maxlength': '200'
             }),
-            'related_club': forms.Select(attrs={
-                'class': 'form-select'
+            'hero_subtitle': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 3,
+                'placeholder': 'Hero section subtitle/description',
+                'maxlength': '500'
             }),
-            'achieved_by': forms.TextInput(attrs={
+            'hero_image': forms.ClearableFileInput(attrs={
+                'class': 'form-control',
+                'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp'
+            }),
+            'hero_badge_text': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Modern Facilities',
+                'maxlength': '100'
+            }),
+            'overview_title': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Overview section title',
+                'maxlength': '200'
+            }),
+            'overview_description': forms.Textarea(attrs={
                 'class': 'form-control',
-                'placeholder': 'Individual or team name'
+                'rows': 4,
+                'placeholder': 'Detailed overview of infrastructure'
             }),
-            'achievement_date': forms.DateInput(attrs={
+            'cta_title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'type': 'date'
+                'placeholder': 'Call to action title',
+                'maxlength': '200'
             }),
-            'organization': forms.TextInput(attrs={
+            'cta_description': forms.Textarea(attrs={
                 'class': 'form-control',
-                'placeholder': 'Organization name'
+                'rows': 3,
+                'placeholder': 'Call to action description'
             }),
-            'certificate_image': forms.FileInput(attrs={
+            'cta_button_text': forms.TextInput(attrs={
                 'class': 'form-control',
-                'accept': 'image/*'
+                'placeholder': 'e.g., Schedule a Visit',
+                'maxlength': '100'
             }),
-            'display_order': forms.NumberInput(attrs={
+            'cta_button_url': forms.URLInput(attrs={
                 'class': 'form-control',
-                'min': 0
+                'placeholder': 'e.g., /contact/ or https://example.com'
             }),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
-            'is_featured': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
+        }
+        
+        help_texts = {
+            'title': 'Main title displayed on the infrastructure page',
+            'subtitle': 'Brief subtitle or tagline for the page',
+            'hero_title': 'Title for the hero/banner section',
+            'hero_subtitle': 'Description text for the hero section',
+            'hero_image': 'Background image for the hero section (recommended: 1920x600px)',
+            'hero_badge_text': 'Small badge text displayed on the hero section',
+            'overview_title': 'Title for the overview section',
+            'overview_description': 'Detailed description of your infrastructure',
+            'cta_title': 'Title for the call-to-action section',
+            'cta_description': 'Description for the call-to-action section',
+            'cta_button_text': 'Text for the call-to-action button',
+            'cta_button_url': 'URL where the call-to-action button should link',
+            'is_active': 'Make this infrastructure information visible on the website'
         }
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['related_club'].queryset = NSSNCCClub.objects.filter(is_active=True)
+    def clean_title(self):
+        """Validate title"""
+        title = self.cleaned_data.get('title')
+        if title:
+            title = title.strip()
+            if len(title) < 3:
+                raise forms.ValidationError('Title must be at least 3 characters long.')
+        return title
     
-    def clean_achievement_date(self):
-        """Validate achievement date"""
-        achievement_date = self.cleaned_data.get('achievement_date')
-        if achievement_date and achievement_date > datetime.now().date():
-            raise ValidationError("Achievement date cannot be in the future.")
-        return achievement_date
+    def clean_cta_button_url(self):
+        """Validate CTA button URL"""
+        url = self.cleaned_data.get('cta_button_url')
+        if url and not url.startswith(('/', 'http://', 'https://')):
+            raise forms.ValidationError('URL must start with /, http://, or https://')
+        return url
 
 
-class NSSNCCAchievementQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential achievement fields"""
+class InfrastructureStatisticForm(forms.ModelForm):
+    """Enhanced form for Infrastructure Statistics with icon and color selection"""
     
     class Meta:
-        model = NSSNCCAchievement
-        fields = [
-            'title', 'achievement_type', 'related_club',
-            'achievement_date', 'is_featured', 'is_active'
-        ]
+        model = InfrastructureStatistic
+        fields = '__all__'
         widgets = {
             'title': forms.TextInput(attrs={
-                'class': 'form-control'
-            }),
-            'achievement_type': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'related_club': forms.Select(attrs={
-                'class': 'form-select'
+                'class': 'form-control',
+                'placeholder': 'e.g., Classrooms, Laboratories, WiFi Coverage',
+                'maxlength': '100'
             }),
-            'achievement_date': forms.DateInput(attrs={
+            'value': forms.TextInput(attrs={
                 'class': 'form-control',
-                'type': 'date'
-=======
-                'placeholder': 'Detailed description of the facility'
+                'placeholder': 'e.g., 25+, 100%, 5000+',
+                'maxlength': '50'
             }),
-            'facility_type': forms.Select(attrs={
-                'class': 'form-select'
+            'description': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Optional description of the statistic',
+                'maxlength': '200'
             }),
             'icon_class': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., fas fa-chalkboard-teacher, fas fa-flask',
+                'placeholder': 'e.g., fas fa-building, fas fa-wifi, fas fa-book',
                 'maxlength': '100'
             }),
-            'color_class': forms.Select(attrs={
+            'statistic_type': forms.Select(attrs={
                 'class': 'form-select'
             }),
-            'image': forms.ClearableFileInput(attrs={
-                'class': 'form-control',
-                'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp'
-            }),
-            'features': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 6,
-                'placeholder': 'List features one per line:\n• Feature 1\n• Feature 2\n• Feature 3'
+            'color_class': forms.Select(attrs={
+                'class': 'form-select'
             }),
             'display_order': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': '0',
                 'max': '999',
                 'placeholder': '0'
->>>>>>> a11168e (Fix)
-            }),
-            'is_featured': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
             }),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
         }
-<<<<<<< HEAD
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['related_club'].queryset = NSSNCCClub.objects.filter(is_active=True)
-
-class HeroCarouselSlideForm(forms.ModelForm):
-    """Comprehensive form for managing hero carousel slides"""
-    
-    class Meta:
-        model = HeroCarouselSlide
-=======
         
         help_texts = {
-            'title': 'Name of the academic facility',
-            'description': 'Detailed description of the facility and its capabilities',
-            'facility_type': 'Category of the academic facility',
-            'icon_class': 'Font Awesome icon class for the facility',
-            'color_class': 'Color theme for the facility display',
-            'image': 'Representative image of the facility (recommended: 800x600px)',
-            'features': 'List key features of the facility (one per line, use • for bullet points)',
-            'display_order': 'Order in which facilities appear (lower numbers first)',
-            'is_featured': 'Feature this facility prominently on the website',
-            'is_active': 'Make this facility visible on the website'
+            'title': 'Name of the statistic (e.g., "Classrooms", "Laboratories")',
+            'value': 'The statistic value (e.g., "25+", "100%", "5000+")',
+            'description': 'Optional additional description for the statistic',
+            'icon_class': 'Font Awesome icon class (e.g., fas fa-building, fas fa-wifi)',
+            'statistic_type': 'Category of the statistic for better organization',
+            'color_class': 'Color theme for the statistic display (blue, emerald, purple, orange)',
+            'display_order': 'Order in which statistics appear (lower numbers first)',
+            'is_active': 'Make this statistic visible on the website'
         }
     
     def __init__(self, *args, **kwargs):
@@ -7370,162 +7553,129 @@ class HeroCarouselSlideForm(forms.ModelForm):
         title = self.cleaned_data.get('title')
         if title:
             title = title.strip()
-            if len(title) < 3:
-                raise forms.ValidationError('Title must be at least 3 characters long.')
+            if len(title) < 2:
+                raise forms.ValidationError('Title must be at least 2 characters long.')
         return title
     
-    def clean_features(self):
-        """Clean and format features"""
-        features = self.cleaned_data.get('features')
-        if features:
-            # Clean up the features text
-            features = features.strip()
-            # Remove empty lines and clean up formatting
-            feature_lines = [line.strip() for line in features.split('\n') if line.strip()]
-            features = '\n'.join(feature_lines)
-        return features
-
-
-class SportsFacilityForm(forms.ModelForm):
-    """Enhanced form for Sports Facilities"""
-    
-    class Meta:
-        model = SportsFacility
->>>>>>> a11168e (Fix)
-        fields = '__all__'
-        widgets = {
-            'title': forms.TextInput(attrs={
-                'class': 'form-control',
-<<<<<<< HEAD
-                'placeholder': 'Enter slide title...'
-            }),
-            'subtitle': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Enter slide subtitle/description...'
-            }),
-            'slide_type': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'display_order': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': '0'
-            }),
-            'badge_text': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Welcome to Excellence'
-            }),
-            'badge_icon': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., fas fa-star'
-            }),
-            'primary_button_text': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Explore Programs'
-            }),
-            'primary_button_url': forms.URLInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'https://example.com'
-            }),
-            'primary_button_icon': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., fas fa-arrow-right'
-            }),
-            'secondary_button_text': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Learn More'
-            }),
-            'secondary_button_url': forms.URLInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'https://example.com'
-            }),
-            'secondary_button_icon': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., fas fa-info-circle'
-            }),
-            'gradient_type': forms.Select(attrs={
-                'class': 'form-select'
-            }),
-            'show_statistics': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'stat_1_number': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., 18+'
-            }),
-            'stat_1_label': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Courses'
-            }),
-            'stat_1_icon': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., fas fa-graduation-cap'
-            }),
-            'stat_2_number': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., 5000+'
-            }),
-            'stat_2_label': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Students'
-            }),
-            'stat_2_icon': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., fas fa-users'
-            }),
-            'stat_3_number': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., 150+'
-            }),
-            'stat_3_label': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Faculty'
-            }),
-            'stat_3_icon': forms.TextInput(attrs={
+    def clean_value(self):
+        """Validate value"""
+        value = self.cleaned_data.get('value')
+        if value:
+            value = value.strip()
+            if len(value) < 1:
+                raise forms.ValidationError('Value cannot be empty.')
+        return value
+
+
+class AcademicFacilityForm(forms.ModelForm):
+    """Enhanced form for Academic Facilities with features management"""
+    
+    class Meta:
+        model = AcademicFacility
+        fields = '__all__'
+        widgets = {
+            'title': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., fas fa-chalkboard-teacher'
+                'placeholder': 'e.g., Smart Classrooms, Modern Laboratories',
+                'maxlength': '200'
             }),
-            'stat_4_number': forms.TextInput(attrs={
+            'description': forms.Textarea(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., 25+'
+                'rows': 4,
+                'placeholder': 'Detailed description of the facility'
             }),
-            'stat_4_label': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., Years'
+            'facility_type': forms.Select(attrs={
+                'class': 'form-select'
             }),
-            'stat_4_icon': forms.TextInput(attrs={
+            'icon_class': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., fas fa-award'
+                'placeholder': 'e.g., fas fa-chalkboard-teacher, fas fa-flask',
+                'maxlength': '100'
             }),
-            'show_content_cards': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
+            'color_class': forms.Select(attrs={
+                'class': 'form-select'
             }),
-            'content_title': forms.TextInput(attrs={
+            'image': forms.ClearableFileInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Why Choose Us?'
+                'accept': 'image/jpeg,image/jpg,image/png,image/gif,image/webp'
             }),
-            'content_icon': forms.TextInput(attrs={
+            'features': forms.Textarea(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., fas fa-university'
-            }),
-            'content_items': CKEditor5Widget(attrs={
-                'class': 'form-control'
+                'rows': 6,
+                'placeholder': 'List features one per line:\n• Feature 1\n• Feature 2\n• Feature 3'
             }),
-            'auto_play_interval': forms.NumberInput(attrs={
+            'display_order': forms.NumberInput(attrs={
                 'class': 'form-control',
-                'min': '1000',
-                'step': '500'
+                'min': '0',
+                'max': '999',
+                'placeholder': '0'
             }),
-            'show_indicators': forms.CheckboxInput(attrs={
+            'is_featured': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
-            'show_controls': forms.CheckboxInput(attrs={
+            'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
             }),
-=======
+        }
+        
+        help_texts = {
+            'title': 'Name of the academic facility',
+            'description': 'Detailed description of the facility and its capabilities',
+            'facility_type': 'Category of the academic facility',
+            'icon_class': 'Font Awesome icon class for the facility',
+            'color_class': 'Color theme for the facility display',
+            'image': 'Representative image of the facility (recommended: 800x600px)',
+            'features': 'List key features of the facility (one per line, use • for bullet points)',
+            'display_order': 'Order in which facilities appear (lower numbers first)',
+            'is_featured': 'Feature this facility prominently on the website',
+            'is_active': 'Make this facility visible on the website'
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # Add custom choices for color_class
+        self.fields['color_class'].widget = forms.Select(choices=[
+            ('blue', 'Blue'),
+            ('emerald', 'Emerald'),
+            ('purple', 'Purple'),
+            ('orange', 'Orange'),
+            ('red', 'Red'),
+            ('green', 'Green'),
+            ('indigo', 'Indigo'),
+            ('pink', 'Pink'),
+        ])
+    
+    def clean_title(self):
+        """Validate title"""
+        title = self.cleaned_data.get('title')
+        if title:
+            title = title.strip()
+            if len(title) < 3:
+                raise forms.ValidationError('Title must be at least 3 characters long.')
+        return title
+    
+    def clean_features(self):
+        """Clean and format features"""
+        features = self.cleaned_data.get('features')
+        if features:
+            # Clean up the features text
+            features = features.strip()
+            # Remove empty lines and clean up formatting
+            feature_lines = [line.strip() for line in features.split('\n') if line.strip()]
+            features = '\n'.join(feature_lines)
+        return features
+
+
+class SportsFacilityForm(forms.ModelForm):
+    """Enhanced form for Sports Facilities"""
+    
+    class Meta:
+        model = SportsFacility
+        fields = '__all__'
+        widgets = {
+            'title': forms.TextInput(attrs={
+                'class': 'form-control',
                 'placeholder': 'e.g., Basketball Court, Swimming Pool',
                 'maxlength': '200'
             }),
@@ -7569,132 +7719,10 @@ class SportsFacilityForm(forms.ModelForm):
             'image': 'Representative image of the sports facility (recommended: 800x600px)',
             'display_order': 'Order in which facilities appear (lower numbers first)',
             'is_active': 'Make this sports facility visible on the website'
->>>>>>> a11168e (Fix)
         }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-<<<<<<< HEAD
-        # Add help text for better user experience
-        self.fields['title'].help_text = "Main heading that appears prominently on the slide"
-        self.fields['subtitle'].help_text = "Descriptive text that appears below the title"
-        self.fields['slide_type'].help_text = "Choose the type of slide to apply appropriate styling"
-        self.fields['display_order'].help_text = "Lower numbers appear first (0 = first slide)"
-        self.fields['badge_text'].help_text = "Optional badge text that appears above the title"
-        self.fields['badge_icon'].help_text = "FontAwesome icon class (e.g., fas fa-star, fas fa-heart)"
-        self.fields['primary_button_text'].help_text = "Text for the main call-to-action button"
-        self.fields['primary_button_url'].help_text = "URL where the primary button should link"
-        self.fields['secondary_button_text'].help_text = "Text for the secondary button (optional)"
-        self.fields['secondary_button_url'].help_text = "URL where the secondary button should link"
-        self.fields['gradient_type'].help_text = "Choose a predefined gradient or create custom"
-        self.fields['show_statistics'].help_text = "Display statistics cards on the right side"
-        self.fields['auto_play_interval'].help_text = "Time in milliseconds between automatic slide changes"
-        self.fields['content_items'].help_text = "HTML content for custom slides (use CKEditor for rich formatting)"
-
-
-class HeroCarouselSlideQuickEditForm(forms.ModelForm):
-    """Quick edit form for essential hero carousel slide fields"""
-    
-    class Meta:
-        model = HeroCarouselSlide
-        fields = [
-            'title', 'subtitle', 'slide_type', 'is_active', 'display_order',
-            'badge_text', 'primary_button_text', 'primary_button_url',
-            'secondary_button_text', 'secondary_button_url', 'gradient_type'
-        ]
-        widgets = {
-            'title': forms.TextInput(attrs={
-                'class': 'form-control form-control-sm'
-            }),
-            'subtitle': forms.Textarea(attrs={
-                'class': 'form-control form-control-sm',
-                'rows': 2
-            }),
-            'slide_type': forms.Select(attrs={
-                'class': 'form-select form-select-sm'
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'display_order': forms.NumberInput(attrs={
-                'class': 'form-control form-control-sm',
-                'min': '0'
-            }),
-            'badge_text': forms.TextInput(attrs={
-                'class': 'form-control form-control-sm'
-            }),
-            'primary_button_text': forms.TextInput(attrs={
-                'class': 'form-control form-control-sm'
-            }),
-            'primary_button_url': forms.URLInput(attrs={
-                'class': 'form-control form-control-sm'
-            }),
-            'secondary_button_text': forms.TextInput(attrs={
-                'class': 'form-control form-control-sm'
-            }),
-            'secondary_button_url': forms.URLInput(attrs={
-                'class': 'form-control form-control-sm'
-            }),
-            'gradient_type': forms.Select(attrs={
-                'class': 'form-select form-select-sm'
-            }),
-        }
-
-
-class HeroCarouselSettingsForm(forms.ModelForm):
-    """Form for managing global hero carousel settings"""
-    
-    class Meta:
-        model = HeroCarouselSettings
-        fields = '__all__'
-        widgets = {
-            'is_enabled': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'auto_play': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'default_interval': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': '1000',
-                'step': '500'
-            }),
-            'show_indicators': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'show_controls': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'pause_on_hover': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'enable_keyboard': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'enable_touch': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'transition_duration': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': '100',
-                'step': '50'
-            }),
-            'fade_effect': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'mobile_height': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., 24rem, 70vh'
-            }),
-            'tablet_height': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., 28rem, 80vh'
-            }),
-            'desktop_height': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'e.g., 24rem, 100vh'
-            }),
-=======
         
         # Add custom choices for color_class
         self.fields['color_class'].widget = forms.Select(choices=[
@@ -7765,27 +7793,10 @@ class TechnologyInfrastructureForm(forms.ModelForm):
             'color_class': 'Color theme for the technology display',
             'display_order': 'Order in which technologies appear (lower numbers first)',
             'is_active': 'Make this technology infrastructure visible on the website'
->>>>>>> a11168e (Fix)
         }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-<<<<<<< HEAD
-        # Add help text for better user experience
-        self.fields['is_enabled'].help_text = "Enable or disable the entire hero carousel"
-        self.fields['auto_play'].help_text = "Automatically advance slides"
-        self.fields['default_interval'].help_text = "Default time between slide changes (milliseconds)"
-        self.fields['show_indicators'].help_text = "Show dots at the bottom for slide navigation"
-        self.fields['show_controls'].help_text = "Show left/right arrow navigation buttons"
-        self.fields['pause_on_hover'].help_text = "Pause auto-play when user hovers over carousel"
-        self.fields['enable_keyboard'].help_text = "Allow keyboard navigation (arrow keys)"
-        self.fields['enable_touch'].help_text = "Allow touch/swipe navigation on mobile devices"
-        self.fields['transition_duration'].help_text = "Duration of slide transition animation (milliseconds)"
-        self.fields['fade_effect'].help_text = "Use fade transition instead of slide transition"
-        self.fields['mobile_height'].help_text = "Carousel height on mobile devices (CSS units)"
-        self.fields['tablet_height'].help_text = "Carousel height on tablet devices (CSS units)"
-        self.fields['desktop_height'].help_text = "Carousel height on desktop devices (CSS units)"
-=======
         
         # Add custom choices for color_class
         self.fields['color_class'].widget = forms.Select(choices=[
@@ -7927,4 +7938,3 @@ class StudentAmenityForm(forms.ModelForm):
         if display_order is not None and display_order < 0:
             raise forms.ValidationError('Display order must be a non-negative number.')
         return display_order
->>>>>>> a11168e (Fix)
@@ -0,0 +1,147 @@
+"""
+Model-version-stamped fragment caching
+
+Every model in the app has a generation token in the cache that signals.py
+replaces on each save or delete. A cached fragment's key includes the tokens
+of all the models it was built from, so any change to one of them makes the
+next render miss and rebuild, and an untouched fragment is reused until then.
+No TTL has to be guessed; the timeout only lets superseded entries age out.
+
+Templates use {% cache_versioned %} (templatetags/cache_tags.py); Python code
+uses cached_fragment() or the cache_versioned decorator. While
+collect_dependencies() is active, every fragment served reports its models,
+so an enclosing cache (see page_cache.py) depends on them even on a hit.
+Content with a schedule reports when it next changes the same way through
+record_expiry().
+"""
+
+import contextvars
+import functools
+import hashlib
+import uuid
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+
+GENERATION_KEY = 'model_generation:{label}'
+FRAGMENT_KEY = 'fragment:{name}:{digest}'
+
+DEFAULT_APP_LABEL = 'college_website'
+# Superseded fragments are never read again; a day is enough for them to go
+DEFAULT_FRAGMENT_TIMEOUT = 60 * 60 * 24
+
+
+def resolve_model(model):
+    """Model class for a class, an instance, 'app_label.Model' or a bare model name"""
+    if isinstance(model, str):
+        if '.' in model:
+            return apps.get_model(model)
+        return apps.get_model(DEFAULT_APP_LABEL, model)
+    if isinstance(model, models.Model):
+        return type(model)
+    return model
+
+
+_collector = contextvars.ContextVar('fragment_dependencies', default=None)
+
+
+@contextmanager
+def collect_dependencies():
+    """Collect the labels of models reported with record_dependencies()"""
+    labels = set()
+    token = _collector.set(labels)
+    try:
+        yield labels
+    finally:
+        _collector.reset(token)
+
+
+def record_dependencies(model_list):
+    """Report models the content being built depends on"""
+    labels = _collector.get()
+    if labels is not None:
+        labels.update(resolve_model(model)._meta.label for model in model_list)
+
+
+_expiry_collector = contextvars.ContextVar('fragment_expiry', default=None)
+
+
+@contextmanager
+def collect_expiry():
+    """Collect the moments reported with record_expiry(); min() is the earliest"""
+    moments = []
+    token = _expiry_collector.set(moments)
+    try:
+        yield moments
+    finally:
+        _expiry_collector.reset(token)
+
+
+def record_expiry(moment):
+    """Report that the content being built goes out of date at moment"""
+    moments = _expiry_collector.get()
+    if moments is not None:
+        moments.append(moment)
+
+
+def get_generations(model_list):
+    """Current generation tokens for the models, in the order given"""
+    labels = [resolve_model(model)._meta.label for model in model_list]
+    keys = [GENERATION_KEY.format(label=label) for label in labels]
+    tokens = cache.get_many(keys)
+    for key in keys:
+        if key not in tokens:
+            token = uuid.uuid4().hex
+            if not cache.add(key, token, timeout=None):
+                token = cache.get(key, token)
+            tokens[key] = token
+    return tuple(tokens[key] for key in keys)
+
+
+def bump_generation(model):
+    """Invalidate every fragment built from this model"""
+    label = resolve_model(model)._meta.label
+    cache.set(GENERATION_KEY.format(label=label), uuid.uuid4().hex, timeout=None)
+
+
+def fragment_key(name, model_list, vary_on=()):
+    """Cache key for a fragment at the models' current generations"""
+    parts = list(get_generations(model_list))
+    parts.append('|')
+    parts.extend(str(getattr(value, 'pk', value)) for value in vary_on)
+    digest = hashlib.sha1(':'.join(parts).encode()).hexdigest()
+    return FRAGMENT_KEY.format(name=name, digest=digest)
+
+
+def cached_fragment(name, model_list, build, vary_on=(), timeout=None):
+    """Cached result of build(), rebuilt after any change to the models"""
+    record_dependencies(model_list)
+    key = fragment_key(name, model_list, vary_on)
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        if timeout is None:
+            timeout = getattr(settings, 'FRAGMENT_CACHE_TIMEOUT', DEFAULT_FRAGMENT_TIMEOUT)
+        cache.set(key, value, timeout)
+    return value
+
+
+def cache_versioned(*model_list, name=None, timeout=None):
+    """Decorator caching a function's result until one of the models changes
+
+    Positional arguments are part of the key (model instances by pk):
+
+        @cache_versioned('Department', 'Faculty')
+        def department_summary(department): ...
+    """
+    def decorator(func):
+        fragment_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            return cached_fragment(fragment_name, model_list, lambda: func(*args), vary_on=args, timeout=timeout)
+        return wrapper
+    return decorator
@@ -0,0 +1,204 @@
+"""
+Responsive image derivatives
+
+Uploaded images are resized into width buckets and saved as WebP and JPEG
+variants under content-hashed names (derivatives/<digest>/<width>.<ext>), so
+the same upload always maps to the same files and they can be cached forever.
+A small JSON manifest per source file records which variants exist; it is kept
+in storage next to the variants and mirrored in the cache.
+
+Derivatives are generated when a registered model is saved, or in bulk by the
+generate_image_derivatives management command; never while a page renders.
+The {% responsive_image %} tag only reads manifests and falls back to the
+original upload until one exists. Images without a manifest, and images that
+could not be processed, are remembered in the cache so neither rendering nor
+repeated saves keep going back to storage or Pillow for them.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from io import BytesIO
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_ROOT = 'derivatives'
+DERIVATIVE_WIDTHS = (320, 640, 960, 1280, 1920)
+
+# (extension, Pillow format, MIME type, save options), preferred format first
+DERIVATIVE_FORMATS = (
+    ('webp', 'WEBP', 'image/webp', {'quality': 80, 'method': 4}),
+    ('jpg', 'JPEG', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+)
+
+MANIFEST_KEY = 'image_derivatives:{name}'
+
+# Cached in place of a manifest: none exists yet, or building one failed
+MISSING = 'missing'
+FAILED = 'failed'
+MISSING_TIMEOUT = 60 * 5
+FAILED_TIMEOUT = 60 * 60 * 24
+
+# Image fields that get derivatives, as (model label, field names)
+RESPONSIVE_IMAGE_FIELDS = (
+    ('college_website.SliderImage', ('image',)),
+    ('college_website.GalleryPhoto', ('image',)),
+    ('college_website.Gallery', ('cover_image',)),
+    ('college_website.EventImage', ('image',)),
+    ('college_website.HistoryGalleryImage', ('image',)),
+    ('college_website.InfrastructurePhoto', ('image',)),
+    ('college_website.Faculty', ('photo',)),
+)
+
+
+def get_responsive_image_models():
+    """(model, field names) pairs for the registered models that exist"""
+    registered = []
+    for label, field_names in RESPONSIVE_IMAGE_FIELDS:
+        try:
+            registered.append((apps.get_model(label), field_names))
+        except LookupError:
+            logger.warning(f"Responsive image model {label} is not installed")
+    return registered
+
+
+@dataclass(frozen=True)
+class DerivativeManifest:
+    """Variants generated for one source image"""
+    source: str
+    digest: str
+    width: int
+    height: int
+    # (extension, width, storage name), widest last
+    variants: tuple
+
+    def srcset(self, extension):
+        return ', '.join(
+            f"{default_storage.url(name)} {width}w"
+            for variant_extension, width, name in self.variants
+            if variant_extension == extension
+        )
+
+    def fallback_url(self, extension='jpg'):
+        """Largest variant of the given format"""
+        names = [name for variant_extension, _, name in self.variants if variant_extension == extension]
+        return default_storage.url(names[-1]) if names else default_storage.url(self.source)
+
+    def to_json(self):
+        return json.dumps({
+            'source': self.source,
+            'digest': self.digest,
+            'width': self.width,
+            'height': self.height,
+            'variants': [list(variant) for variant in self.variants],
+        })
+
+    @classmethod
+    def from_json(cls, data):
+        data = json.loads(data)
+        return cls(
+            source=data['source'],
+            digest=data['digest'],
+            width=data['width'],
+            height=data['height'],
+            variants=tuple(tuple(variant) for variant in data['variants']),
+        )
+
+
+def _manifest_name(source):
+    return f"{DERIVATIVE_ROOT}/manifests/{hashlib.sha1(source.encode()).hexdigest()}.json"
+
+
+def _bucket_widths(width):
+    """Buckets narrower than the source, plus the source width capped at the widest bucket"""
+    widths = [bucket for bucket in DERIVATIVE_WIDTHS if bucket < width]
+    widths.append(min(width, DERIVATIVE_WIDTHS[-1]))
+    return sorted(set(widths))
+
+
+def _for_format(image, pillow_format):
+    if pillow_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+        # JPEG has no alpha channel; flatten onto white
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        rgba = image.convert('RGBA')
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        return background
+    if image.mode not in ('RGB', 'RGBA', 'L'):
+        return image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    return image
+
+
+def generate_derivatives(source, storage=default_storage):
+    """Create any missing variants for a stored image and write its manifest"""
+    with storage.open(source, 'rb') as source_file:
+        data = source_file.read()
+    digest = hashlib.sha256(data).hexdigest()[:20]
+
+    variants = []
+    with Image.open(BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        width, height = image.size
+        for target_width in _bucket_widths(width):
+            target_height = max(1, round(height * target_width / width))
+            resized = image if target_width == width else image.resize(
+                (target_width, target_height), Image.LANCZOS
+            )
+            for extension, pillow_format, _, options in DERIVATIVE_FORMATS:
+                name = f"{DERIVATIVE_ROOT}/{digest[:2]}/{digest}/{target_width}.{extension}"
+                if not storage.exists(name):
+                    buffer = BytesIO()
+                    _for_format(resized, pillow_format).save(buffer, pillow_format, **options)
+                    storage.save(name, ContentFile(buffer.getvalue()))
+                variants.append((extension, target_width, name))
+
+    manifest = DerivativeManifest(source, digest, width, height, tuple(variants))
+    manifest_name = _manifest_name(source)
+    if storage.exists(manifest_name):
+        storage.delete(manifest_name)
+    storage.save(manifest_name, ContentFile(manifest.to_json().encode()))
+    cache.set(MANIFEST_KEY.format(name=source), manifest, timeout=None)
+    return manifest
+
+
+def get_manifest(source, storage=default_storage):
+    """Manifest for a source image if its derivatives already exist"""
+    manifest = cache.get(MANIFEST_KEY.format(name=source))
+    if manifest is not None:
+        return manifest if isinstance(manifest, DerivativeManifest) else None
+    manifest_name = _manifest_name(source)
+    if not storage.exists(manifest_name):
+        cache.set(MANIFEST_KEY.format(name=source), MISSING, timeout=MISSING_TIMEOUT)
+        return None
+    with storage.open(manifest_name, 'rb') as manifest_file:
+        manifest = DerivativeManifest.from_json(manifest_file.read())
+    cache.set(MANIFEST_KEY.format(name=source), manifest, timeout=None)
+    return manifest
+
+
+def ensure_derivatives(field_file):
+    """Manifest for an image field's file, generating derivatives if missing
+
+    Returns None when there is no file or it cannot be processed, in which
+    case callers should fall back to the original upload. A failure is not
+    retried on save for FAILED_TIMEOUT; generate_image_derivatives still tries it.
+    """
+    if not field_file or not field_file.name:
+        return None
+    key = MANIFEST_KEY.format(name=field_file.name)
+    if cache.get(key) == FAILED:
+        return None
+    try:
+        return get_manifest(field_file.name, field_file.storage) or generate_derivatives(
+            field_file.name, field_file.storage
+        )
+    except Exception as e:
+        logger.warning(f"Could not build derivatives for {field_file.name}: {e}")
+        cache.set(key, FAILED, timeout=FAILED_TIMEOUT)
+        return None
@@ -0,0 +1,242 @@
+"""
+Per-request query and latency instrumentation
+
+RequestMetricsMiddleware measures every request: the number of queries and
+the time spent in the database, in template rendering and in each context
+processor. Template and context processor times come from
+InstrumentedDjangoTemplates, a drop-in for the DjangoTemplates backend;
+template time excludes the context processors run during the render.
+
+The figures are sent as a Server-Timing header (to staff, or to everyone
+with DEBUG) and added to a rolling window of the last SAMPLE_WINDOW requests
+per view. Queries repeated with identical parameters within one request,
+such as a NavbarInfo lookup done by several template tags, are counted per
+view. Both are shown on the staff request metrics page.
+
+The window lives in each worker process and is reset when it restarts.
+"""
+
+import contextvars
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+
+SAMPLE_WINDOW = 500
+# Distinct duplicated statements remembered per view
+MAX_DUPLICATES = 50
+PERCENTILES = (50, 95, 99)
+
+_current = contextvars.ContextVar('request_metrics', default=None)
+
+
+@dataclass
+class RequestTimings:
+    """Measurements for the request being handled"""
+    queries: int = 0
+    db_time: float = 0.0
+    template_time: float = 0.0
+    render_depth: int = 0
+    context_processors: Counter = field(default_factory=Counter)
+    statements: Counter = field(default_factory=Counter)
+
+    @property
+    def context_processor_time(self):
+        return sum(self.context_processors.values())
+
+    def duplicates(self):
+        """{sql: executions} for statements run more than once with the same parameters"""
+        repeated = Counter()
+        for (sql, _), count in self.statements.items():
+            if count > 1:
+                repeated[sql] += count - 1
+        return repeated
+
+    def server_timing(self, total):
+        metrics = [
+            ('db', self.db_time, f'{self.queries} queries'),
+            ('tpl', self.template_time - self.context_processor_time, 'templates'),
+        ]
+        metrics.extend((f'cp-{name}', seconds, None) for name, seconds in self.context_processors.most_common())
+        metrics.append(('total', total, None))
+        return ', '.join(
+            f'{name};dur={seconds * 1000:.1f}' + (f';desc="{desc}"' if desc else '')
+            for name, seconds, desc in metrics
+        )
+
+
+def _record_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db_time += time.perf_counter() - started
+        timings.queries += 1
+        timings.statements[(sql, repr(params))] += 1
+
+
+def _timed_processor(processor):
+    name = processor.__name__
+
+    def timed(request):
+        timings = _current.get()
+        if timings is None:
+            return processor(request)
+        started = time.perf_counter()
+        try:
+            return processor(request)
+        finally:
+            timings.context_processors[name] += time.perf_counter() - started
+    return timed
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        timings = _current.get()
+        if timings is None:
+            return super().render(context, request)
+        # Templates rendered from within a render are part of the outer one
+        timings.render_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings.render_depth -= 1
+            if not timings.render_depth:
+                timings.template_time += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates backend that reports render and context processor times"""
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.engine.__dict__['template_context_processors'] = tuple(
+            _timed_processor(processor) for processor in self.engine.template_context_processors
+        )
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return InstrumentedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+class EndpointStats:
+    """Rolling window of request measurements for one view"""
+
+    def __init__(self):
+        self.requests = 0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+        self.duplicates = {}
+
+    def add(self, total, timings):
+        self.requests += 1
+        self.samples.append((
+            total,
+            timings.queries,
+            timings.db_time,
+            timings.template_time - timings.context_processor_time,
+            timings.context_processor_time,
+        ))
+        for sql, repeats in timings.duplicates().items():
+            entry = self.duplicates.get(sql)
+            if entry is None:
+                if len(self.duplicates) >= MAX_DUPLICATES:
+                    continue
+                entry = self.duplicates[sql] = {'sql': sql, 'requests': 0, 'max_repeats': 0}
+            entry['requests'] += 1
+            entry['max_repeats'] = max(entry['max_repeats'], repeats)
+
+    def summary(self):
+        totals = sorted(sample[0] for sample in self.samples)
+        count = len(self.samples)
+        summary = {
+            'requests': self.requests,
+            'window': count,
+            'avg_queries': sum(sample[1] for sample in self.samples) / count,
+            'avg_db_ms': sum(sample[2] for sample in self.samples) / count * 1000,
+            'avg_template_ms': sum(sample[3] for sample in self.samples) / count * 1000,
+            'avg_context_processor_ms': sum(sample[4] for sample in self.samples) / count * 1000,
+            'duplicates': sorted(self.duplicates.values(), key=lambda entry: -entry['requests']),
+        }
+        for percentile in PERCENTILES:
+            index = min(count - 1, int(count * percentile / 100))
+            summary[f'p{percentile}_ms'] = totals[index] * 1000
+        return summary
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def record(endpoint, total, timings):
+    with _stats_lock:
+        _stats.setdefault(endpoint, EndpointStats()).add(total, timings)
+
+
+def get_endpoint_summaries():
+    """Summaries of every view seen by this worker, slowest p95 first"""
+    with _stats_lock:
+        summaries = [dict(stats.summary(), endpoint=endpoint) for endpoint, stats in _stats.items()]
+    return sorted(summaries, key=lambda summary: -summary['p95_ms'])
+
+
+def reset_metrics():
+    with _stats_lock:
+        _stats.clear()
+
+
+def _endpoint(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return '<unresolved>'
+    return match.view_name or match._func_path
+
+
+def _is_staff(request):
+    """Without a session cookie nobody is signed in, so the session is not loaded"""
+    if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return False
+    user = getattr(request, 'user', None)
+    return user is not None and user.is_staff
+
+
+class RequestMetricsMiddleware:
+    """Measure queries, DB, template and context processor time per request"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_record_query))
+                response = self.get_response(request)
+                # Decided while still measuring: for a signed-in request this
+                # may load the session and user
+                send_timing = settings.DEBUG or _is_staff(request)
+        finally:
+            _current.reset(token)
+        total = time.perf_counter() - started
+
+        record(_endpoint(request), total, timings)
+        if send_timing:
+            response['Server-Timing'] = timings.server_timing(total)
+        return response
@@ -0,0 +1,493 @@
+"""
+Synthetic dataset for load tests and benchmarks
+
+generate_load_dataset() bulk-inserts production-sized volumes of the content
+that dominates the public pages: departments and faculty, galleries and
+their photos, notices, question papers, publications, CMS pages and deep
+menu trees.
+Volumes are VOLUMES multiplied by the scale. Every section draws from its
+own random generator seeded from the seed, so a given seed and scale always
+produce the same rows, and one section's volume does not shift another's.
+
+Generated rows are recognisable by LOAD_PREFIX in their slug (or DOI for
+publications) and are removed by clear_load_dataset(). Files point into a
+small pool of placeholder images and PDFs under MEDIA_ROOT/load/.
+
+bulk_create sends no signals, and clear_load_dataset() deletes with the
+model signals muted, so both finish with one search index rebuild and one
+round of invalidation: the fragment generations of the touched models, the
+site chrome and the side menus.
+"""
+
+import io
+import random
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import signals
+
+from .fragment_cache import bump_generation
+from .models import (
+    BlockRichText, Department, Faculty, Gallery, GalleryPhoto, Menu, MenuItem,
+    Notice, Page, Publication, QuestionPaper,
+)
+from .side_menus import bump_side_menu_version
+from .site_chrome import bump_chrome_version
+
+LOAD_PREFIX = 'load-'
+LOAD_DOI_PREFIX = '10.5555/load.'
+
+# Generated dates count back from here, so a seed gives the same rows on any day
+EPOCH = date(2025, 6, 1)
+
+# Every model the dataset writes to
+LOAD_MODELS = (
+    Department, Faculty, Gallery, GalleryPhoto, Notice, QuestionPaper, Publication,
+    Page, BlockRichText, Menu, MenuItem,
+)
+
+# Rows at scale 1
+VOLUMES = {
+    'departments': 40,
+    'faculty': 10_000,
+    'galleries': 1_000,
+    'gallery_photos': 100_000,
+    'notices': 50_000,
+    'question_papers': 5_000,
+    'publications': 5_000,
+    'pages': 200,
+    'menus': 4,
+}
+
+# Rich text blocks on every CMS page
+PAGE_BLOCKS = 6
+
+# Every menu is a full tree of this depth and branching (1364 items)
+MENU_DEPTH = 5
+MENU_BRANCHING = 4
+
+PLACEHOLDER_IMAGES = 24
+PLACEHOLDER_DOCUMENTS = 8
+
+WORDS = (
+    'annual', 'campus', 'science', 'research', 'student', 'examination', 'seminar',
+    'workshop', 'national', 'cultural', 'laboratory', 'library', 'sports', 'admission',
+    'scholarship', 'faculty', 'department', 'chemistry', 'physics', 'botany', 'commerce',
+    'history', 'literature', 'mathematics', 'festival', 'lecture', 'conference', 'result',
+    'semester', 'practical', 'project', 'community', 'village', 'environment', 'youth',
+)
+FIRST_NAMES = (
+    'Anil', 'Sunita', 'Rakesh', 'Priya', 'Manoj', 'Kavita', 'Vijay', 'Neha', 'Suresh',
+    'Pooja', 'Ramesh', 'Anjali', 'Deepak', 'Rekha', 'Sanjay', 'Meena', 'Ashok', 'Shalini',
+)
+LAST_NAMES = (
+    'Sharma', 'Verma', 'Gupta', 'Patel', 'Tiwari', 'Sahu', 'Yadav', 'Dewangan', 'Mishra',
+    'Chandra', 'Kashyap', 'Pandey', 'Shukla', 'Sinha', 'Jaiswal', 'Dubey',
+)
+
+
+def _choices(field_choices):
+    return [value for value, _ in field_choices]
+
+
+def _words(rng, count):
+    return ' '.join(rng.choice(WORDS) for _ in range(count))
+
+
+def _title(rng, count=5):
+    return _words(rng, count).capitalize()
+
+
+def _paragraphs(rng, count):
+    return ''.join(f'<p>{_words(rng, 40).capitalize()}.</p>' for _ in range(count))
+
+
+def _person(rng):
+    return f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+
+
+def _volume(name, scale):
+    return max(1, round(VOLUMES[name] * scale))
+
+
+def _rng(seed, section):
+    return random.Random(f'{seed}:{section}')
+
+
+def _placeholder_image(rng):
+    from PIL import Image
+
+    colour = tuple(rng.randrange(256) for _ in range(3))
+    buffer = io.BytesIO()
+    Image.new('RGB', (1200, 800), colour).save(buffer, format='JPEG', quality=80)
+    return buffer.getvalue()
+
+
+def _placeholder_pdf(number):
+    text = f'Placeholder document {number}'
+    stream = f'BT /F1 24 Tf 72 720 Td ({text}) Tj ET'
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+        '/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>',
+        f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    pdf, offsets = '%PDF-1.4\n', []
+    for object_number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f'{object_number} 0 obj\n{body}\nendobj\n'
+    xref = len(pdf)
+    pdf += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'
+    pdf += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets)
+    pdf += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'
+    return pdf.encode('ascii')
+
+
+def ensure_placeholder_media(seed):
+    """Write the placeholder files if missing; returns (image names, document names)"""
+    rng = _rng(seed, 'media')
+    images, documents = [], []
+    for number in range(PLACEHOLDER_IMAGES):
+        name = f'load/images/placeholder-{number:02d}.jpg'
+        content = _placeholder_image(rng)
+        if not default_storage.exists(name):
+            default_storage.save(name, ContentFile(content))
+        images.append(name)
+    for number in range(PLACEHOLDER_DOCUMENTS):
+        name = f'load/documents/placeholder-{number:02d}.pdf'
+        if not default_storage.exists(name):
+            default_storage.save(name, ContentFile(_placeholder_pdf(number)))
+        documents.append(name)
+    return images, documents
+
+
+def has_load_dataset():
+    return (
+        Department.objects.filter(slug__startswith=LOAD_PREFIX).exists()
+        or Notice.objects.filter(slug__startswith=LOAD_PREFIX).exists()
+        or Menu.objects.filter(slug__startswith=LOAD_PREFIX).exists()
+    )
+
+
+@contextmanager
+def _model_signals_muted():
+    """Run without delete signal receivers, so cascades need no per-row handling"""
+    muted = (signals.pre_delete, signals.post_delete, signals.m2m_changed)
+    saved = [(signal, signal.receivers) for signal in muted]
+    for signal in muted:
+        signal.receivers = []
+        signal.sender_receivers_cache.clear()
+    try:
+        yield
+    finally:
+        for signal, receivers in saved:
+            signal.receivers = receivers
+            signal.sender_receivers_cache.clear()
+
+
+def _invalidate():
+    """Bring the search index and caches in line after signal-free writes"""
+    from .search import rebuild_index
+
+    rebuild_index()
+    for model in LOAD_MODELS:
+        bump_generation(model)
+    # Departments, pages and menus are in the site chrome; pages in side menus
+    bump_chrome_version()
+    bump_side_menu_version()
+
+
+def clear_load_dataset():
+    """Delete every generated row; faculty, photos and menu items go with their parents"""
+    with _model_signals_muted(), transaction.atomic():
+        for queryset in (
+            Department.objects.filter(slug__startswith=LOAD_PREFIX),
+            Gallery.objects.filter(slug__startswith=LOAD_PREFIX),
+            Notice.objects.filter(slug__startswith=LOAD_PREFIX),
+            QuestionPaper.objects.filter(slug__startswith=LOAD_PREFIX),
+            Publication.objects.filter(doi__startswith=LOAD_DOI_PREFIX),
+            Page.objects.filter(slug__startswith=LOAD_PREFIX),
+            Menu.objects.filter(slug__startswith=LOAD_PREFIX),
+        ):
+            queryset.delete()
+    _invalidate()
+
+
+def _departments(rng, scale, images):
+    disciplines = _choices(Department.DISCIPLINE_CHOICES)
+    themes = _choices(Department.THEME_COLOR_CHOICES)
+    departments = []
+    for index in range(_volume('departments', scale)):
+        subject = rng.choice(WORDS).capitalize()
+        departments.append(Department(
+            name=f'Department of {subject} {index + 1}',
+            short_name=f'{subject} Dept.',
+            slug=f'{LOAD_PREFIX}department-{index + 1}',
+            discipline=rng.choice(disciplines),
+            theme_color=rng.choice(themes),
+            tagline=_title(rng, 6),
+            short_description=_words(rng, 30).capitalize(),
+            description=_paragraphs(rng, 4),
+            head_of_department=f'Dr. {_person(rng)}',
+            department_image=rng.choice(images),
+            established_year=rng.randint(1960, 2020),
+            programs_offered='\n'.join(_title(rng, 3) for _ in range(4)),
+            research_areas='\n'.join(_title(rng, 3) for _ in range(4)),
+            ordering=index,
+        ))
+    return departments
+
+
+def _faculty(rng, scale, departments, images, documents):
+    designations = _choices(Faculty.DESIGNATION_CHOICES)
+    qualifications = _choices(Faculty.QUALIFICATION_CHOICES)
+    for index in range(_volume('faculty', scale)):
+        name = _person(rng)
+        yield Faculty(
+            name=f'Dr. {name}',
+            slug=f'{LOAD_PREFIX}faculty-{index + 1}',
+            department=departments[index % len(departments)],
+            designation=rng.choice(designations),
+            designation_order=rng.randint(0, 6),
+            highest_qualification=rng.choice(qualifications),
+            qualifications=f'Ph.D. in {_title(rng, 2)}\nM.Sc. in {_title(rng, 2)}',
+            specialization=_title(rng, 3),
+            experience_years=rng.randint(1, 35),
+            joining_date=EPOCH - timedelta(days=rng.randint(100, 12_000)),
+            email=f'faculty{index + 1}@example.edu',
+            bio=_paragraphs(rng, 3),
+            research_interests='\n'.join(_title(rng, 3) for _ in range(3)),
+            courses_taught='\n'.join(_title(rng, 2) for _ in range(3)),
+            photo=rng.choice(images),
+            cv_file=rng.choice(documents),
+            is_featured=rng.random() < 0.05,
+        )
+
+
+def _galleries(rng, scale, images):
+    categories = _choices(Gallery.CATEGORY_CHOICES)
+    galleries = []
+    for index in range(_volume('galleries', scale)):
+        title = _title(rng, 4)
+        galleries.append(Gallery(
+            title=title,
+            slug=f'{LOAD_PREFIX}gallery-{index + 1}',
+            description=_words(rng, 25).capitalize(),
+            category=rng.choice(categories),
+            cover_image=rng.choice(images),
+            is_featured=rng.random() < 0.02,
+            ordering=index,
+            meta_description=f'View {title} gallery',
+        ))
+    return galleries
+
+
+def _gallery_photos(rng, scale, galleries, images):
+    categories = _choices(GalleryPhoto.CATEGORY_CHOICES)
+    for index in range(_volume('gallery_photos', scale)):
+        yield GalleryPhoto(
+            gallery=galleries[index % len(galleries)],
+            image=rng.choice(images),
+            title=_title(rng, 3),
+            caption=_words(rng, 12).capitalize(),
+            photographer=_person(rng),
+            category=rng.choice(categories),
+            date_taken=EPOCH - timedelta(days=rng.randint(0, 3_650)),
+            ordering=index // len(galleries),
+        )
+
+
+def _notices(rng, scale, documents):
+    categories = _choices(Notice.CATEGORY_CHOICES)
+    for index in range(_volume('notices', scale)):
+        yield Notice(
+            title=_title(rng, 7),
+            slug=f'{LOAD_PREFIX}notice-{index + 1}',
+            content=_paragraphs(rng, 3),
+            category=rng.choice(categories),
+            attachment=rng.choice(documents) if rng.random() < 0.3 else '',
+            publish_date=EPOCH - timedelta(days=rng.randint(0, 1_825)),
+        )
+
+
+def _question_papers(rng, scale, documents):
+    subjects = _choices(QuestionPaper.SUBJECT_CHOICES)
+    semesters = _choices(QuestionPaper.SEMESTER_CHOICES)
+    degrees = _choices(QuestionPaper.DEGREE_CHOICES)
+    combinations = len(subjects) * len(semesters) * len(degrees)
+    for index in range(_volume('question_papers', scale)):
+        # Walk the unique (subject, semester, degree, year) combinations,
+        # going one academic year further back after each full round
+        subject = subjects[index % len(subjects)]
+        semester = semesters[index // len(subjects) % len(semesters)]
+        degree = degrees[index // (len(subjects) * len(semesters)) % len(degrees)]
+        year = EPOCH.year - 1 - index // combinations
+        yield QuestionPaper(
+            title=f'{subject.replace("-", " ").title()} - Semester {semester}',
+            slug=f'{LOAD_PREFIX}question-paper-{index + 1}',
+            subject=subject,
+            semester=semester,
+            degree_type=degree,
+            academic_year=f'{year}-{year + 1}',
+            question_paper_file=rng.choice(documents),
+            file_size=f'{rng.randint(80, 900)} KB',
+            description=_words(rng, 15).capitalize(),
+            duration='3 hours',
+            total_marks=rng.choice((50, 75, 100)),
+            download_count=rng.randint(0, 5_000),
+        )
+
+
+def _publications(rng, scale, documents):
+    departments = _choices(Publication.DEPARTMENT_CHOICES)
+    journal_types = _choices(Publication.JOURNAL_TYPE_CHOICES)
+    for index in range(_volume('publications', scale)):
+        yield Publication(
+            title=_title(rng, 10),
+            authors=', '.join(_person(rng) for _ in range(rng.randint(1, 5))),
+            abstract=_words(rng, 120).capitalize(),
+            journal_name=f'Journal of {_title(rng, 2)}',
+            journal_type=rng.choice(journal_types),
+            department=rng.choice(departments),
+            publication_year=rng.randint(EPOCH.year - 20, EPOCH.year),
+            citations=rng.randint(0, 400),
+            doi=f'{LOAD_DOI_PREFIX}{index + 1}',
+            pdf_file=rng.choice(documents) if rng.random() < 0.5 else '',
+            is_featured=rng.random() < 0.02,
+        )
+
+
+def _pages(rng, scale, images):
+    pages = []
+    for index in range(_volume('pages', scale)):
+        title = _title(rng, 4)
+        pages.append(Page(
+            title=title,
+            slug=f'{LOAD_PREFIX}page-{index + 1}',
+            banner_image=rng.choice(images),
+            meta_title=title[:60],
+            meta_description=_words(rng, 20).capitalize()[:160],
+        ))
+    return pages
+
+
+def _page_blocks(rng, pages):
+    for page in pages:
+        for position in range(PAGE_BLOCKS):
+            yield BlockRichText(page=page, title=_title(rng, 3), body=_paragraphs(rng, 4), ordering=position)
+
+
+def _menu_trees(rng, scale, batch_size):
+    """Full menu trees, created one level at a time with their materialized paths"""
+    menus = Menu.objects.bulk_create([
+        Menu(title=f'Load menu {index + 1}', slug=f'{LOAD_PREFIX}menu-{index + 1}', ordering=100 + index)
+        for index in range(_volume('menus', scale))
+    ])
+    created = 0
+    for menu in menus:
+        level, parents = 0, [None]
+        while level < MENU_DEPTH:
+            items = []
+            for parent in parents:
+                for position in range(MENU_BRANCHING):
+                    number = created + len(items) + 1
+                    items.append(MenuItem(
+                        menu=menu,
+                        parent=parent,
+                        title=_title(rng, 2),
+                        slug=f'{LOAD_PREFIX}item-{number}',
+                        path_type='external',
+                        external_url=f'https://example.edu/{menu.slug}/{number}/',
+                        ordering=position,
+                        depth=level,
+                    ))
+            MenuItem.objects.bulk_create(items, batch_size=batch_size)
+            for item in items:
+                parent_path = item.parent.tree_path if item.parent else ''
+                item.tree_path = parent_path + MenuItem.path_segment(item.pk)
+            MenuItem.objects.bulk_update(items, ['tree_path'], batch_size=batch_size)
+            created += len(items)
+            parents, level = items, level + 1
+    return len(menus), created
+
+
+def _bulk_create(model, rows, batch_size, restore=(), **kwargs):
+    """Insert a generator of rows batch by batch; returns the number inserted
+    
+    Fields in restore (auto_now_add dates) are overwritten on insert, so the
+    generated values are written back with a bulk_update after each batch.
+    Rows skipped by ignore_conflicts are not counted.
+    """
+    before = model.objects.count()
+    
+    def insert(batch):
+        generated = [[getattr(row, field) for field in restore] for row in batch]
+        model.objects.bulk_create(batch, **kwargs)
+        if restore:
+            for row, values in zip(batch, generated):
+                for field, value in zip(restore, values):
+                    setattr(row, field, value)
+            model.objects.bulk_update(batch, restore)
+    
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            insert(batch)
+            batch = []
+    if batch:
+        insert(batch)
+    return model.objects.count() - before
+
+
+def generate_load_dataset(scale=1.0, seed=0, batch_size=1000, log=None):
+    """Insert the dataset at scale; returns {section: rows}"""
+    log = log or (lambda message: None)
+    images, documents = ensure_placeholder_media(seed)
+    counts = {}
+    with transaction.atomic():
+        departments = Department.objects.bulk_create(
+            _departments(_rng(seed, 'departments'), scale, images)
+        )
+        counts['departments'] = len(departments)
+        counts['faculty'] = _bulk_create(
+            Faculty, _faculty(_rng(seed, 'faculty'), scale, departments, images, documents), batch_size
+        )
+        log(f'{counts["departments"]} departments, {counts["faculty"]} faculty')
+
+        galleries = Gallery.objects.bulk_create(_galleries(_rng(seed, 'galleries'), scale, images))
+        counts['galleries'] = len(galleries)
+        counts['gallery_photos'] = _bulk_create(
+            GalleryPhoto, _gallery_photos(_rng(seed, 'gallery_photos'), scale, galleries, images), batch_size
+        )
+        log(f'{counts["galleries"]} galleries, {counts["gallery_photos"]} photos')
+
+        counts['notices'] = _bulk_create(
+            Notice, _notices(_rng(seed, 'notices'), scale, documents), batch_size, restore=['publish_date'],
+        )
+        # Existing papers may already hold some (subject, semester, degree, year) combinations
+        counts['question_papers'] = _bulk_create(
+            QuestionPaper, _question_papers(_rng(seed, 'question_papers'), scale, documents), batch_size,
+            ignore_conflicts=True,
+        )
+        counts['publications'] = _bulk_create(
+            Publication, _publications(_rng(seed, 'publications'), scale, documents), batch_size
+        )
+        log(f'{counts["notices"]} notices, {counts["question_papers"]} question papers, '
+            f'{counts["publications"]} publications')
+
+        pages = Page.objects.bulk_create(_pages(_rng(seed, 'pages'), scale, images))
+        counts['pages'] = len(pages)
+        counts['page_blocks'] = _bulk_create(BlockRichText, _page_blocks(_rng(seed, 'page_blocks'), pages), batch_size)
+        log(f'{counts["pages"]} pages, {counts["page_blocks"]} content blocks')
+
+        counts['menus'], counts['menu_items'] = _menu_trees(_rng(seed, 'menus'), scale, batch_size)
+        log(f'{counts["menus"]} menus, {counts["menu_items"]} menu items')
+
+    _invalidate()
+    return counts
@@ -0,0 +1,90 @@
+"""
+Django management command to backfill responsive image derivatives
+Usage: python manage.py generate_image_derivatives [--workers 4] [--model college_website.GalleryPhoto]
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from college_website.images import (
+    MANIFEST_KEY, generate_derivatives, get_manifest, get_responsive_image_models,
+)
+
+
+def _init_worker():
+    # Spawned (non-forked) workers start without a configured Django
+    django.setup()
+
+
+def _generate(name):
+    """Runs in a worker process; returns the manifest or the error message"""
+    try:
+        return name, generate_derivatives(name), None
+    except Exception as e:
+        return name, None, str(e)
+
+
+class Command(BaseCommand):
+    help = 'Generate responsive WebP/JPEG derivatives for existing uploaded images'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of worker processes (default: CPU count)'
+        )
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            help='Only process this model label, e.g. college_website.GalleryPhoto (may be repeated)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate manifests even for images that already have them'
+        )
+
+    def handle(self, *args, **options):
+        names = set()
+        for model, field_names in get_responsive_image_models():
+            if options['models'] and model._meta.label not in options['models']:
+                continue
+            for field_name in field_names:
+                names.update(
+                    name for name in model.objects.exclude(
+                        **{f'{field_name}__in': ['', None]}
+                    ).values_list(field_name, flat=True) if name
+                )
+
+        if not options['force']:
+            names = {name for name in names if get_manifest(name) is None}
+
+        if not names:
+            self.stdout.write(self.style.SUCCESS('All images already have derivatives.'))
+            return
+
+        self.stdout.write(f'Generating derivatives for {len(names)} image(s) with {options["workers"]} worker(s)...')
+        # Worker processes must not inherit open database connections
+        connections.close_all()
+
+        done = failed = 0
+        with ProcessPoolExecutor(max_workers=max(1, options['workers']), initializer=_init_worker) as pool:
+            futures = [pool.submit(_generate, name) for name in sorted(names)]
+            for future in as_completed(futures):
+                name, manifest, error = future.result()
+                if manifest is None:
+                    failed += 1
+                    self.stderr.write(f'  {name}: {error}')
+                    continue
+                # Workers have their own caches; publish the manifest from here
+                cache.set(MANIFEST_KEY.format(name=name), manifest, timeout=None)
+                done += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Generated derivatives for {done} image(s), {failed} failed.'))
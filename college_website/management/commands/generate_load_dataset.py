@@ -0,0 +1,63 @@
+"""
+Django management command to generate a production-sized synthetic dataset
+Usage: python manage.py generate_load_dataset [--scale 1.0] [--seed 0] [--clear]
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from college_website.load_dataset import (
+    VOLUMES, clear_load_dataset, generate_load_dataset, has_load_dataset,
+)
+
+
+class Command(BaseCommand):
+    help = 'Bulk-create deterministic synthetic content for load tests and benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            type=float,
+            default=1.0,
+            help=f'Multiplier of the base volumes, e.g. {VOLUMES["gallery_photos"]} gallery photos '
+                 f'and {VOLUMES["notices"]} notices at 1 (default: 1)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed; the same seed and scale always give the same data (default: 0)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows per INSERT (default: 1000)'
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete a previously generated dataset first'
+        )
+
+    def handle(self, *args, **options):
+        if options['scale'] <= 0:
+            raise CommandError('--scale must be positive')
+
+        if has_load_dataset():
+            if not options['clear']:
+                raise CommandError('A generated dataset already exists; pass --clear to replace it')
+            self.stdout.write('Deleting the previous dataset...')
+            clear_load_dataset()
+
+        started = time.monotonic()
+        counts = generate_load_dataset(
+            scale=options['scale'],
+            seed=options['seed'],
+            batch_size=max(1, options['batch_size']),
+            log=self.stdout.write,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {sum(counts.values())} rows in {time.monotonic() - started:.1f}s'
+        ))
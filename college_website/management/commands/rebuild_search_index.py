@@ -0,0 +1,27 @@
+"""
+Django management command to rebuild the site search index
+Usage: python manage.py rebuild_search_index [--type notice --type event ...]
+"""
+
+from django.core.management.base import BaseCommand
+
+from college_website.search import SEARCH_SOURCES, rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index from the searchable models'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--type',
+            action='append',
+            dest='doc_types',
+            choices=list(SEARCH_SOURCES),
+            help='Only rebuild documents of this type (may be repeated)'
+        )
+
+    def handle(self, *args, **options):
+        counts = rebuild_index(options['doc_types'])
+        for doc_type, count in counts.items():
+            self.stdout.write(f'{SEARCH_SOURCES[doc_type].label}: {count} document(s)')
+        self.stdout.write(self.style.SUCCESS(f'Indexed {sum(counts.values())} document(s).'))
@@ -0,0 +1,81 @@
+"""
+Django management command to benchmark the hot public endpoints
+Usage: python manage.py run_benchmarks [--scale 0.01 --scale 0.1] [--output results.json]
+                                       [--baseline baseline.json] [--threshold 0.25]
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from college_website.benchmarks import SCENARIOS, BenchmarkError, compare, run_suite
+
+
+class Command(BaseCommand):
+    help = 'Time the hot public endpoints at several dataset sizes and compare with a baseline'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            type=float,
+            action='append',
+            dest='scales',
+            help='Dataset scale, as for generate_load_dataset (may be repeated; default: 0.01 and 0.1)'
+        )
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            dest='scenarios',
+            choices=list(SCENARIOS),
+            help='Only run this scenario (may be repeated)'
+        )
+        parser.add_argument('--iterations', type=int, default=30, help='Timed runs per scenario (default: 30)')
+        parser.add_argument('--warmup', type=int, default=3, help='Untimed runs first (default: 3)')
+        parser.add_argument('--seed', type=int, default=0, help='Dataset seed (default: 0)')
+        parser.add_argument(
+            '--output',
+            default='benchmark-results.json',
+            help='Where to write the JSON results (default: benchmark-results.json)'
+        )
+        parser.add_argument('--baseline', help='Saved results to compare against')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.25,
+            help='Allowed relative growth in latency and memory before a regression (default: 0.25)'
+        )
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1')
+        baseline = None
+        if options['baseline']:
+            try:
+                baseline = json.loads(Path(options['baseline']).read_text())
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Cannot read the baseline {options['baseline']}: {exc}")
+
+        try:
+            report = run_suite(
+                options['scales'] or [0.01, 0.1],
+                iterations=options['iterations'],
+                warmup=max(0, options['warmup']),
+                seed=options['seed'],
+                scenario_names=options['scenarios'],
+                log=self.stdout.write,
+            )
+        except BenchmarkError as exc:
+            raise CommandError(str(exc))
+
+        Path(options['output']).write_text(json.dumps(report, indent=2, sort_keys=True) + '\n')
+        self.stdout.write(f"Results written to {options['output']}")
+
+        if baseline is None:
+            return
+        regressions = compare(report, baseline, options['threshold'])
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(regression)
+            raise CommandError(f'{len(regressions)} regression(s) against {options["baseline"]}')
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {options['baseline']}"))
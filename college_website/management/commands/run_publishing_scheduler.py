@@ -0,0 +1,65 @@
+"""
+Django management command to publish and unpublish scheduled content on time
+Usage: python manage.py run_publishing_scheduler [--once] [--refresh 60]
+"""
+
+import heapq
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from college_website.publishing import publish_due, upcoming_transitions
+
+
+class Command(BaseCommand):
+    help = 'Flip scheduled slides, notifications, NSS-NCC notices and academic calendars live at their boundaries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Apply due transitions and exit (for cron)'
+        )
+        parser.add_argument(
+            '--refresh',
+            type=float,
+            default=60,
+            help='Seconds between reloads of the schedule, to pick up edits (default: 60)'
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            self._publish(timezone.now())
+            return
+
+        refresh = max(1, options['refresh'])
+        self.stdout.write(f'Publishing scheduler started, reloading the schedule every {refresh:g}s')
+        heap, reload_at = [], 0
+        try:
+            while True:
+                now = timezone.now()
+                due = []
+                while heap and heap[0][0] <= now:
+                    due.append(heapq.heappop(heap))
+                if due or time.monotonic() >= reload_at:
+                    # Every wake re-checks all windows, so edits made since the
+                    # last reload are caught up here at the latest
+                    self._publish(now)
+                    if time.monotonic() >= reload_at:
+                        heap = upcoming_transitions(now)
+                        reload_at = time.monotonic() + refresh
+                close_old_connections()
+
+                wait = reload_at - time.monotonic()
+                if heap:
+                    wait = min(wait, (heap[0][0] - timezone.now()).total_seconds())
+                time.sleep(max(0.0, wait))
+        except KeyboardInterrupt:
+            self.stdout.write('Publishing scheduler stopped')
+
+    def _publish(self, now):
+        changed = publish_due(now)
+        if changed:
+            self.stdout.write(f'{now:%Y-%m-%d %H:%M:%S}: updated {", ".join(changed)}')
@@ -0,0 +1,24 @@
+from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
+from django.shortcuts import redirect, render
+from django.views.decorators.http import require_http_methods
+
+from .instrumentation import PERCENTILES, SAMPLE_WINDOW, get_endpoint_summaries, reset_metrics
+
+
+@staff_member_required
+@require_http_methods(["GET", "POST"])
+def request_metrics_view(request):
+    """Slowest views and repeated queries seen by this worker process"""
+    if request.method == 'POST':
+        reset_metrics()
+        messages.success(request, 'Request metrics were reset for this worker.')
+        return redirect('college_website:request_metrics')
+
+    context = {
+        'title': 'Request Metrics',
+        'endpoints': get_endpoint_summaries(),
+        'percentiles': PERCENTILES,
+        'sample_window': SAMPLE_WINDOW,
+    }
+    return render(request, 'admin/request_metrics.html', context)
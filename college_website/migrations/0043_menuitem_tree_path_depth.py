@@ -0,0 +1,48 @@
+# Generated by Django 5.0.7 on 2026-10-17 09:00
+
+from django.db import migrations, models
+
+
+TREE_STEP_WIDTH = 8
+
+
+def backfill_tree_paths(apps, schema_editor):
+    """Compute tree_path and depth for existing menu items, parents first"""
+    MenuItem = apps.get_model('college_website', 'MenuItem')
+    items = list(MenuItem.objects.only('pk', 'parent_id'))
+    children_by_parent = {}
+    for item in items:
+        children_by_parent.setdefault(item.parent_id, []).append(item)
+
+    updated = []
+    pending = [(item, '') for item in children_by_parent.get(None, [])]
+    while pending:
+        item, parent_path = pending.pop()
+        item.tree_path = f"{parent_path}{item.pk:0{TREE_STEP_WIDTH}d}/"
+        item.depth = item.tree_path.count('/') - 1
+        updated.append(item)
+        pending.extend((child, item.tree_path) for child in children_by_parent.get(item.pk, []))
+
+    MenuItem.objects.bulk_update(updated, ['tree_path', 'depth'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('college_website', '0041_navbarinfo_border_radius_navbarinfo_box_shadow_and_more'),
+        ('college_website', '0042_academiccalendar_download_count_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menuitem',
+            name='tree_path',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Materialized path of zero-padded ancestor ids, maintained on save', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='menuitem',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_tree_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.0.7 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE college_website_searchdocument_fts USING fts5(
+        title, body,
+        content='college_website_searchdocument', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER college_website_searchdocument_ai AFTER INSERT ON college_website_searchdocument BEGIN
+        INSERT INTO college_website_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER college_website_searchdocument_ad AFTER DELETE ON college_website_searchdocument BEGIN
+        INSERT INTO college_website_searchdocument_fts(college_website_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER college_website_searchdocument_au AFTER UPDATE ON college_website_searchdocument BEGIN
+        INSERT INTO college_website_searchdocument_fts(college_website_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO college_website_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS college_website_searchdocument_au",
+    "DROP TRIGGER IF EXISTS college_website_searchdocument_ad",
+    "DROP TRIGGER IF EXISTS college_website_searchdocument_ai",
+    "DROP TABLE IF EXISTS college_website_searchdocument_fts",
+]
+
+POSTGRES_CREATE = [
+    """
+    CREATE INDEX college_website_searchdocument_tsv ON college_website_searchdocument USING GIN ((
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ))
+    """,
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS college_website_searchdocument_tsv",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    _run(schema_editor, {'sqlite': SQLITE_CREATE, 'postgresql': POSTGRES_CREATE})
+
+
+def drop_search_index(apps, schema_editor):
+    _run(schema_editor, {'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('college_website', '0043_menuitem_tree_path_depth'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('doc_type', models.CharField(db_index=True, max_length=30)),
+                ('object_id', models.PositiveIntegerField()),
+                ('title', models.CharField(max_length=500)),
+                ('body', models.TextField(blank=True)),
+                ('url', models.CharField(max_length=500)),
+                ('published', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'unique_together': {('doc_type', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
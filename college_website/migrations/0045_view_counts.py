@@ -0,0 +1,33 @@
+# Generated by Django 5.0.7 on 2026-10-17 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('college_website', '0044_searchdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='view_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of detail page views'),
+        ),
+        migrations.AddField(
+            model_name='gallery',
+            name='view_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of detail page views'),
+        ),
+        migrations.AddField(
+            model_name='notice',
+            name='view_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of detail page views'),
+        ),
+        migrations.AddField(
+            model_name='program',
+            name='view_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of detail page views'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.7 on 2026-10-17 12:00
+
+from django.db import migrations, models
+from django.db.models import Q
+from django.utils import timezone
+
+LIVE_HELP_TEXT = 'Inside its publishing window; kept up to date by the publishing scheduler'
+
+
+def set_is_live(apps, schema_editor):
+    now = timezone.now()
+    windows = (
+        ('SliderImage', 'start_date', 'end_date', True),
+        ('ScrollingNotification', 'start_date', 'end_date', False),
+        ('NSSNCCNotice', 'publish_date', 'expiry_date', False),
+    )
+    for model_name, start_field, end_field, start_optional in windows:
+        started = Q(**{f'{start_field}__lte': now})
+        if start_optional:
+            started |= Q(**{f'{start_field}__isnull': True})
+        live = started & (Q(**{f'{end_field}__isnull': True}) | Q(**{f'{end_field}__gte': now}))
+        apps.get_model('college_website', model_name).objects.exclude(live).update(is_live=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('college_website', '0045_view_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nssnccnotice',
+            name='is_live',
+            field=models.BooleanField(db_index=True, default=True, editable=False, help_text=LIVE_HELP_TEXT),
+        ),
+        migrations.AddField(
+            model_name='scrollingnotification',
+            name='is_live',
+            field=models.BooleanField(db_index=True, default=True, editable=False, help_text=LIVE_HELP_TEXT),
+        ),
+        migrations.AddField(
+            model_name='sliderimage',
+            name='is_live',
+            field=models.BooleanField(db_index=True, default=True, editable=False, help_text=LIVE_HELP_TEXT),
+        ),
+        migrations.RunPython(set_is_live, migrations.RunPython.noop),
+    ]
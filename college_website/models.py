@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
 from django.urls import reverse
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
@@ -26,8 +28,6 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
-<<<<<<< HEAD
-=======
 class AcademicCalendar(TimeStampedModel):
     """Academic Calendar model for managing academic year information"""
     
@@ -122,9 +122,9 @@ class AcademicCalendar(TimeStampedModel):
         return None
     
     def increment_download_count(self):
-        """Increment the download count"""
-        self.download_count += 1
-        self.save(update_fields=['download_count'])
+        """Increment the download count (buffered, see counters.py)"""
+        from .counters import increment
+        increment(self, 'download_count')
 
 
 class AcademicEvent(TimeStampedModel):
@@ -206,7 +206,6 @@ class AcademicEvent(TimeStampedModel):
             raise ValidationError("End date must be after or equal to start date.")
 
 
->>>>>>> a11168e (Fix)
 class Student(TimeStampedModel):
     """Student model with comprehensive profile information"""
     
@@ -688,6 +687,7 @@ class ScrollingNotification(TimeStampedModel):
     pause_on_hover = models.BooleanField(default=True)
     
     is_active = models.BooleanField(default=True)
+    is_live = models.BooleanField(default=True, editable=False, db_index=True, help_text="Inside its publishing window; kept up to date by the publishing scheduler")
     display_order = models.IntegerField(default=0, help_text="Lower numbers appear first")
     
     class Meta:
@@ -764,6 +764,12 @@ class SliderImage(TimeStampedModel):
         null=True, 
         help_text="Optional: When to stop showing this slide (leave empty for permanent)"
     )
+    is_live = models.BooleanField(
+        default=True,
+        editable=False,
+        db_index=True,
+        help_text="Inside its publishing window; kept up to date by the publishing scheduler"
+    )
     
     # SEO and accessibility
     alt_text = models.CharField(
@@ -1266,7 +1272,6 @@ class Program(TimeStampedModel):
     scholarship_available = models.BooleanField(default=False, help_text="Scholarships available for this program")
     scholarship_details = models.TextField(blank=True, help_text="Details about available scholarships")
     
-<<<<<<< HEAD
     # Course Syllabus Information
     first_year_subjects = CKEditor5Field(blank=True, help_text="First year subjects and curriculum")
     second_year_subjects = CKEditor5Field(blank=True, help_text="Second year subjects and curriculum")
@@ -1300,8 +1305,6 @@ class Program(TimeStampedModel):
     assessment_methods = CKEditor5Field(blank=True, help_text="Assessment and evaluation methods")
     global_opportunities = CKEditor5Field(blank=True, help_text="International and global opportunities")
     
-=======
->>>>>>> a11168e (Fix)
     # Additional Information
     brochure = models.FileField(upload_to='programs/brochures/', blank=True, help_text="Program brochure PDF")
     program_image = models.ImageField(upload_to='programs/images/', blank=True, help_text="Program representative image")
@@ -1310,6 +1313,7 @@ class Program(TimeStampedModel):
     # SEO and Management
     slug = models.SlugField(unique=True, blank=True)
     is_active = models.BooleanField(default=True)
+    view_count = models.PositiveIntegerField(default=0, editable=False, help_text="Number of detail page views")
     
     # Meta Information
     accreditation = models.CharField(max_length=200, blank=True, help_text="Accreditation details (e.g., UGC, AICTE)")
@@ -1356,6 +1360,7 @@ class Event(TimeStampedModel):
     is_featured = models.BooleanField(default=False, help_text="Show on homepage")
     slug = models.SlugField(unique=True, blank=True)
     is_active = models.BooleanField(default=True)
+    view_count = models.PositiveIntegerField(default=0, editable=False, help_text="Number of detail page views")
     
     class Meta:
         ordering = ['-date']
@@ -1435,6 +1440,7 @@ class Notice(TimeStampedModel):
     attachment = models.FileField(upload_to='notices/', blank=True)
     slug = models.SlugField(unique=True, blank=True)
     is_active = models.BooleanField(default=True)
+    view_count = models.PositiveIntegerField(default=0, editable=False, help_text="Number of detail page views")
     
     class Meta:
         ordering = ['-publish_date']
@@ -1559,7 +1565,11 @@ class Menu(TimeStampedModel):
     
     def get_url(self):
         """Get URL for the menu - returns the first active menu item's URL if available"""
-        first_item = self.items.filter(is_active=True).first()
+        if hasattr(self, 'active_items_cache'):
+            # Items already loaded by the site chrome snapshot
+            first_item = self.active_items_cache[0] if self.active_items_cache else None
+        else:
+            first_item = self.items.filter(is_active=True).first()
         if first_item:
             return first_item.get_url()
         return '#'
@@ -1628,6 +1638,14 @@ class MenuItem(TimeStampedModel):
     description = models.TextField(blank=True, help_text="Optional description for the menu item")
     is_active = models.BooleanField(default=True)
     ordering = models.IntegerField(default=0)
+    tree_path = models.CharField(
+        max_length=255, blank=True, editable=False, db_index=True,
+        help_text="Materialized path of zero-padded ancestor ids, maintained on save"
+    )
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+    
+    # Each path segment is the item's id padded to this width plus a '/'
+    TREE_STEP_WIDTH = 8
     
     class Meta:
         ordering = ['ordering', 'title']
@@ -1636,7 +1654,99 @@ class MenuItem(TimeStampedModel):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self._sync_tree_path()
+    
+    @classmethod
+    def path_segment(cls, pk):
+        """Path segment for a single item id"""
+        return f"{pk:0{cls.TREE_STEP_WIDTH}d}/"
+    
+    @staticmethod
+    def _check_parent_path(parent_path, own_path):
+        """Refuse a parent inside this item's own subtree, which would form a cycle"""
+        if own_path and parent_path.startswith(own_path):
+            raise ValidationError({'parent': "A menu item cannot be placed under itself or one of its sub-items."})
+    
+    def clean(self):
+        super().clean()
+        if self.pk and self.parent_id:
+            paths = dict(MenuItem.objects.filter(pk__in=[self.pk, self.parent_id]).values_list('pk', 'tree_path'))
+            self._check_parent_path(paths.get(self.parent_id, ''), paths.get(self.pk, ''))
+    
+    def _sync_tree_path(self):
+        """Recompute this item's path and rewrite its subtree in one UPDATE"""
+        parent_path = ''
+        if self.parent_id:
+            parent_path = MenuItem.objects.filter(pk=self.parent_id).values_list(
+                'tree_path', flat=True
+            ).first() or ''
+        new_path = parent_path + self.path_segment(self.pk)
+        new_depth = new_path.count('/') - 1
+        
+        # Read the stored path; this instance may predate a move of an ancestor
+        old_path, old_depth = MenuItem.objects.filter(pk=self.pk).values_list(
+            'tree_path', 'depth'
+        ).get()
+        # Raised inside save()'s transaction, so the parent change is rolled back
+        self._check_parent_path(parent_path, old_path)
+        self.tree_path, self.depth = new_path, new_depth
+        if (old_path, old_depth) == (new_path, new_depth):
+            return
+        
+        MenuItem.objects.filter(pk=self.pk).update(tree_path=new_path, depth=new_depth)
+        if old_path:
+            MenuItem.objects.filter(tree_path__startswith=old_path).exclude(pk=self.pk).update(
+                tree_path=Concat(Value(new_path), Substr('tree_path', len(old_path) + 1)),
+                depth=F('depth') + (new_depth - old_depth),
+            )
+    
+    @property
+    def ancestor_ids(self):
+        """Ids of this item's ancestors, root first"""
+        return [int(segment) for segment in self.tree_path.split('/')[:-2]]
+    
+    def is_descendant_of(self, other):
+        """Check whether this item sits anywhere below other"""
+        return (
+            bool(other.tree_path) and self.pk != other.pk
+            and self.tree_path.startswith(other.tree_path)
+        )
+    
+    def get_ancestors(self, include_self=False):
+        """Ancestors ordered root first, in a single query"""
+        ids = self.ancestor_ids
+        if include_self:
+            ids.append(self.pk)
+        return MenuItem.objects.filter(pk__in=ids).order_by('depth')
+    
+    def get_descendants(self, include_self=False):
+        """The whole subtree below this item, in a single query ordered by path"""
+        descendants = MenuItem.objects.filter(tree_path__startswith=self.tree_path)
+        if not include_self:
+            descendants = descendants.exclude(pk=self.pk)
+        return descendants.order_by('tree_path')
+    
+    @classmethod
+    def attach_children(cls, items):
+        """Link a flat list of items into trees and return the roots
+        
+        Sets ``prefetched_children`` on every item so ``has_children`` and
+        ``active_children`` need no further queries. Items keep the order of
+        the list, so pass them sorted by ('ordering', 'title').
+        """
+        by_pk = {item.pk: item for item in items}
+        roots = []
+        for item in items:
+            item.prefetched_children = []
+        for item in items:
+            parent = by_pk.get(item.parent_id)
+            if parent is None:
+                roots.append(item)
+            else:
+                parent.prefetched_children.append(item)
+        return roots
     
     def get_url(self):
         """Get the appropriate URL for this menu item"""
@@ -1653,34 +1763,34 @@ class MenuItem(TimeStampedModel):
     
     def get_full_path(self):
         """Get the full hierarchical path for this menu item"""
-        path_parts = []
-        current = self
-        while current:
-            path_parts.insert(0, current.slug)
-            current = current.parent
-        return '/'.join(path_parts)
+        slugs = list(self.get_ancestors().values_list('slug', flat=True))
+        slugs.append(self.slug)
+        return '/'.join(slugs)
     
     def get_breadcrumb(self):
         """Get breadcrumb list for this menu item"""
         breadcrumb = []
-        current = self
-        while current:
-            breadcrumb.insert(0, {
+        for current in [*self.get_ancestors().select_related('page'), self]:
+            breadcrumb.append({
                 'title': current.title,
                 'url': current.get_url(),
                 'slug': current.slug
             })
-            current = current.parent
         return breadcrumb
     
     @property
     def has_children(self):
         """Check if this menu item has child items"""
+        if hasattr(self, 'prefetched_children'):
+            return bool(self.prefetched_children)
         return self.children.filter(is_active=True).exists()
     
     @property
     def active_children(self):
         """Get active child menu items"""
+        if hasattr(self, 'prefetched_children'):
+            # Children already loaded by the site chrome snapshot
+            return self.prefetched_children
         return self.children.filter(is_active=True).order_by('ordering', 'title')
     
     def __str__(self):
@@ -1819,6 +1929,7 @@ class Gallery(TimeStampedModel):
     is_featured = models.BooleanField(default=False, help_text='Show on homepage')
     is_active = models.BooleanField(default=True)
     ordering = models.IntegerField(default=0)
+    view_count = models.PositiveIntegerField(default=0, editable=False, help_text='Number of detail page views')
     
     # SEO fields
     meta_description = models.TextField(max_length=160, blank=True)
@@ -2500,6 +2611,11 @@ class IQACReport(TimeStampedModel):
         
         super().save(*args, **kwargs)
     
+    def increment_download_count(self):
+        """Increment download count (buffered, see counters.py)"""
+        from .counters import increment
+        increment(self, 'download_count')
+    
     def __str__(self):
         return f"{self.title} ({self.academic_year})"
 
@@ -3001,6 +3117,9 @@ class SideMenu(TimeStampedModel):
     @property
     def active_items(self):
         """Get all active menu items ordered by their position"""
+        if hasattr(self, 'prefetched_items'):
+            # Items already loaded by the compiled side menu matcher
+            return self.prefetched_items
         return self.items.filter(is_active=True).order_by('ordering', 'title')
     
     def matches_request(self, request):
@@ -3351,11 +3470,15 @@ class SideMenuItem(TimeStampedModel):
     @property
     def has_children(self):
         """Check if this item has child items"""
+        if hasattr(self, 'prefetched_children'):
+            return bool(self.prefetched_children)
         return self.children.filter(is_active=True).exists()
     
     @property
     def active_children(self):
         """Get active child items"""
+        if hasattr(self, 'prefetched_children'):
+            return self.prefetched_children
         return self.children.filter(is_active=True).order_by('ordering', 'title')
     
     def __str__(self):
@@ -3982,7 +4105,6 @@ class Faculty(TimeStampedModel):
     phone = models.CharField(max_length=20, blank=True)
     office_location = models.CharField(max_length=200, blank=True)
     
-<<<<<<< HEAD
     # Social Media & Academic Profiles
     linkedin_url = models.URLField(blank=True, help_text="LinkedIn profile URL")
     google_scholar_url = models.URLField(blank=True, help_text="Google Scholar profile URL")
@@ -3994,8 +4116,6 @@ class Faculty(TimeStampedModel):
     instagram_url = models.URLField(blank=True, help_text="Instagram profile URL")
     website_url = models.URLField(blank=True, help_text="Personal website URL")
     
-=======
->>>>>>> a11168e (Fix)
     # Academic Details
     research_interests = models.TextField(blank=True, help_text="Research interests, one per line")
     publications = CKEditor5Field(blank=True, help_text="Publications and research papers")
@@ -4049,7 +4169,6 @@ class Faculty(TimeStampedModel):
         if self.courses_taught:
             return [course.strip() for course in self.courses_taught.split('\n') if course.strip()]
         return []
-<<<<<<< HEAD
     
     def get_social_media_links(self):
         """Get all social media and academic profile links"""
@@ -4209,8 +4328,6 @@ class NonAcademicStaff(TimeStampedModel):
         if self.website_url:
             links['website'] = self.website_url
         return links
-=======
->>>>>>> a11168e (Fix)
 
 
 class DepartmentEvent(TimeStampedModel):
@@ -4366,8 +4483,6 @@ class HeroBanner(models.Model):
         null=True,
         help_text="Background image (optional)"
     )
-<<<<<<< HEAD
-=======
     
     # Hero Image (for right side display)
     hero_image = models.ImageField(
@@ -4376,7 +4491,6 @@ class HeroBanner(models.Model):
         null=True,
         help_text="Hero image displayed on the right side (optional)"
     )
->>>>>>> a11168e (Fix)
     background_image_opacity = models.IntegerField(
         default=100,
         validators=[MinValueValidator(0), MaxValueValidator(100)],
@@ -4666,13 +4780,9 @@ class HeroBanner(models.Model):
             return f"background-color: {self.solid_background_color}"
         elif self.background_type == 'image' and self.background_image:
             opacity = self.background_image_opacity / 100
-<<<<<<< HEAD
-            return f"background-image: url('{self.background_image.url}'); background-size: cover; background-position: center;"
-=======
             return f"background-image: url('{self.background_image.url}'); background-size: cover; background-position: center; background-repeat: no-repeat;"
         elif self.background_type == 'video':
             return f"background-color: {self.solid_background_color};"
->>>>>>> a11168e (Fix)
         return ""
     
     def get_title_classes(self):
@@ -5003,15 +5113,47 @@ class MenuVisibilitySettings(TimeStampedModel):
     
     @classmethod
     def get_current_settings(cls):
-        """Get current active settings or create default ones"""
+        """Get current active settings, or unsaved defaults if none exist"""
         settings = cls.objects.filter(is_active=True).first()
         if not settings:
-            settings = cls.objects.create(
+            # Never write on a read path; the defaults show every menu
+            settings = cls(
                 name="Default Settings",
                 is_active=True
             )
         return settings
     
+    # Menu slugs that can be hidden, mapped to their settings fields; every
+    # other menu is always shown
+    VISIBILITY_FIELDS = {
+        'research': 'show_research_menu',
+        'placement': 'show_placement_menu',
+        'alumni': 'show_alumni_menu',
+        'events': 'show_events_menu',
+        'exam_timetable': 'show_exam_timetable',
+        'exam_revaluation': 'show_exam_revaluation',
+        'exam_question_papers': 'show_exam_question_papers',
+        'exam_rules': 'show_exam_rules',
+        'student_portal': 'show_student_portal',
+        'sports_cultural': 'show_sports_cultural',
+        'nss_ncc': 'show_nss_ncc',
+        'research_centers': 'show_research_centers',
+        'publications': 'show_publications',
+        'patents_projects': 'show_patents_projects',
+    }
+    
+    @classmethod
+    def get_visibility_fields(cls):
+        """Map menu slugs to their show_* fields (e.g. 'research' -> 'show_research_menu')"""
+        return cls.VISIBILITY_FIELDS
+    
+    def compile_visibility(self):
+        """Compile these settings into a menu slug -> visible dict"""
+        return {
+            slug: bool(getattr(self, field_name))
+            for slug, field_name in self.get_visibility_fields().items()
+        }
+    
     def get_visible_menu_count(self):
         """Get count of visible menu items"""
         visible_fields = [
@@ -5140,9 +5282,9 @@ class QuestionPaper(TimeStampedModel):
         return reverse('college_website:question_paper_detail', kwargs={'slug': self.slug})
     
     def increment_download_count(self):
-        """Increment download count"""
-        self.download_count += 1
-        self.save(update_fields=['download_count'])
+        """Increment download count (buffered, see counters.py)"""
+        from .counters import increment
+        increment(self, 'download_count')
     
     def get_subject_display_color(self):
         """Get color class for subject display"""
@@ -6031,6 +6173,7 @@ class NSSNCCNotice(TimeStampedModel):
     # Status
     is_active = models.BooleanField(default=True, help_text="Make this notice visible")
     is_featured = models.BooleanField(default=False, help_text="Feature this notice prominently")
+    is_live = models.BooleanField(default=True, editable=False, db_index=True, help_text="Inside its publishing window; kept up to date by the publishing scheduler")
     
     # Media
     attachment = models.FileField(upload_to='nss_ncc_clubs/notices/', blank=True, null=True, help_text="Notice attachment")
@@ -6179,7 +6322,6 @@ class NSSNCCAchievement(TimeStampedModel):
         return colors.get(self.achievement_type, 'secondary')
 
 
-<<<<<<< HEAD
 class HeroCarouselSlide(TimeStampedModel):
     """Model for managing hero carousel slides with dynamic content"""
     
@@ -6342,7 +6484,6 @@ class HeroCarouselSettings(TimeStampedModel):
         """Get or create default settings"""
         settings, created = cls.objects.get_or_create(pk=1)
         return settings
-=======
 # ============================================================================
 # INFRASTRUCTURE MODELS
 # ============================================================================
@@ -6671,4 +6812,28 @@ class InfrastructurePhoto(TimeStampedModel):
         
         if len(selected_facilities) == 0:
             raise ValidationError("At least one facility must be selected.")
->>>>>>> a11168e (Fix)
+
+
+# Search Index
+
+class SearchDocument(models.Model):
+    """Plain-text copy of a searchable object, kept in sync by signals (see search.py)
+    
+    On SQLite an FTS5 table and on PostgreSQL a GIN expression index are built
+    over title and body by migration 0044.
+    """
+    doc_type = models.CharField(max_length=30, db_index=True)
+    object_id = models.PositiveIntegerField()
+    title = models.CharField(max_length=500)
+    body = models.TextField(blank=True)
+    url = models.CharField(max_length=500)
+    published = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        unique_together = ['doc_type', 'object_id']
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+    
+    def __str__(self):
+        return f"{self.doc_type}: {self.title}"
@@ -1,9 +1,14 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
-from django.views.decorators.http import require_http_methods
+from django.http import HttpResponse
+from django.views.decorators.http import require_http_methods, require_safe
 from .models import NavbarInfo
 from .forms import NavbarInfoForm
+from .site_chrome import get_navbar_config, get_navbar_stylesheet
+
+# Stylesheet URLs carry a content hash, so they can be cached forever
+NAVBAR_STYLESHEET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
 
 @staff_member_required
 def navbar_config_view(request):
@@ -131,3 +136,24 @@ def navbar_preview(request):
     }
     
     return render(request, 'admin/navbar_preview.html', context)
+
+@require_safe
+def navbar_stylesheet(request, digest):
+    """Serve the navbar CSS variables as a versioned, immutable stylesheet"""
+    current_digest, css = get_navbar_stylesheet(get_navbar_config(request))
+
+    if digest != current_digest:
+        # Stale link from an old page: point at the current version instead of
+        # letting caches store today's CSS under yesterday's URL.
+        response = redirect('college_website:navbar_stylesheet', digest=current_digest)
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+    etag = f'"{current_digest}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(css, content_type='text/css; charset=utf-8')
+    response['ETag'] = etag
+    response['Cache-Control'] = NAVBAR_STYLESHEET_CACHE_CONTROL
+    return response
@@ -0,0 +1,183 @@
+"""
+Full-page cache for anonymous visitors
+
+Views decorated with @cache_anonymous_page store their whole response for
+anonymous GET/HEAD requests, keyed by path and query string. A page records
+the models it depends on while it is rendered:
+* models named in the decorator,
+* every app table its queries touch,
+* the models of any {% cache_versioned %} fragment it includes.
+The stored copy is found through the current generation tokens of those
+models (see fragment_cache.py), plus the site chrome and side menu versions
+that every page shares. Saving a Notice therefore only misses pages that
+actually read notices.
+
+Responses are never stored, and cached copies never served, when:
+* the visitor is logged in,
+* flash messages are waiting,
+* the page used a CSRF token,
+* the page set a cookie or touched the session,
+* the response is anything other than a plain 200.
+Form pages and per-user content therefore stay correct. Pages showing
+scheduled slides or notifications expire when the schedule next changes
+(see scheduled_content.py).
+
+Only decorate views without side effects: a cache hit never reaches the view.
+"""
+
+import functools
+import hashlib
+import re
+from urllib.parse import urlencode
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.utils import timezone
+
+from .fragment_cache import collect_dependencies, collect_expiry, get_generations, resolve_model
+from .side_menus import get_side_menu_version
+from .site_chrome import get_chrome_version
+
+PAGE_KEY = 'page:{digest}'
+PAGE_DEPENDENCIES_KEY = 'page_dependencies:{digest}'
+
+DEFAULT_PAGE_TIMEOUT = 60 * 5
+
+# Headers not replayed from a stored response
+UNCACHED_HEADERS = {'set-cookie', 'vary'}
+
+_TABLE_RE = re.compile(r'\b(?:FROM|JOIN)\s+"?(\w+)"?', re.IGNORECASE)
+
+_table_labels = None
+
+
+def _get_table_labels():
+    """Map db_table to model label for this app's models"""
+    global _table_labels
+    if _table_labels is None:
+        _table_labels = {
+            model._meta.db_table: model._meta.label
+            for model in apps.get_app_config('college_website').get_models()
+        }
+    return _table_labels
+
+
+def _request_digest(request):
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    return hashlib.sha1(f"{request.path}?{query}".encode()).hexdigest()
+
+
+def shared_versions():
+    """Versions of the site chrome and side menus, which every page shows"""
+    return [get_chrome_version(), get_side_menu_version()]
+
+
+def _page_key(request_digest, versions, tokens):
+    parts = [request_digest, *versions, *tokens]
+    return PAGE_KEY.format(digest=hashlib.sha1(':'.join(parts).encode()).hexdigest())
+
+
+def is_cacheable_request(request):
+    """Whether a shared copy may answer this request: anonymous GET/HEAD, no pending messages"""
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return False
+    # len() loads pending messages without marking them as shown
+    return not len(messages.get_messages(request))
+
+
+def is_cacheable_response(request, response):
+    """Whether this response is the same for every anonymous visitor and may be stored"""
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    if request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+        return False
+    session = getattr(request, 'session', None)
+    if session is not None and session.modified:
+        return False
+    if len(messages.get_messages(request)):
+        return False
+    cache_control = response.get('Cache-Control', '')
+    return 'private' not in cache_control and 'no-store' not in cache_control
+
+
+def _freeze(response):
+    headers = [(name, value) for name, value in response.items() if name.lower() not in UNCACHED_HEADERS]
+    return response.content, headers
+
+
+def _thaw(frozen):
+    content, headers = frozen
+    response = HttpResponse(content)
+    for name, value in headers:
+        response[name] = value
+    return response
+
+
+def cache_anonymous_page(*model_list, timeout=None):
+    """Cache a view's response for anonymous visitors until its models change
+
+    Models can be listed explicitly for data the page reads without a query
+    of its own (e.g. from another cache); tables queried while rendering are
+    picked up automatically.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not is_cacheable_request(request):
+                return view(request, *args, **kwargs)
+
+            request_digest = _request_digest(request)
+            labels = cache.get(PAGE_DEPENDENCIES_KEY.format(digest=request_digest))
+            if labels is not None:
+                frozen = cache.get(_page_key(request_digest, shared_versions(), get_generations(labels)))
+                if frozen is not None:
+                    return _thaw(frozen)
+
+            # Tokens are read when a dependency is first seen, before its
+            # data is, so a change made mid-render stores the page under an
+            # already outdated key instead of serving stale content later
+            versions = shared_versions()
+            tokens = {}
+
+            def capture(new_labels):
+                new_labels = [label for label in new_labels if label not in tokens]
+                if new_labels:
+                    tokens.update(zip(new_labels, get_generations(new_labels)))
+
+            capture(resolve_model(model)._meta.label for model in model_list)
+            table_labels = _get_table_labels()
+
+            def record_tables(execute, sql, params, many, context):
+                capture(table_labels[table] for table in _TABLE_RE.findall(sql) if table in table_labels)
+                return execute(sql, params, many, context)
+
+            with collect_dependencies() as fragment_labels, collect_expiry() as expiries, \
+                    connection.execute_wrapper(record_tables):
+                response = view(request, *args, **kwargs)
+                if hasattr(response, 'render') and not response.is_rendered:
+                    response.render()
+            capture(fragment_labels)
+
+            if is_cacheable_response(request, response):
+                labels = sorted(tokens)
+                page_timeout = timeout or getattr(settings, 'PAGE_CACHE_TIMEOUT', DEFAULT_PAGE_TIMEOUT)
+                if expiries:
+                    # Scheduled content on the page changes then
+                    remaining = int((min(expiries) - timezone.now()).total_seconds()) + 1
+                    page_timeout = max(1, min(page_timeout, remaining))
+                cache.set(PAGE_DEPENDENCIES_KEY.format(digest=request_digest), labels, page_timeout)
+                cache.set(
+                    _page_key(request_digest, versions, [tokens[label] for label in labels]),
+                    _freeze(response),
+                    page_timeout,
+                )
+            return response
+        return wrapper
+    return decorator
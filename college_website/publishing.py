@@ -0,0 +1,154 @@
+"""
+Scheduled publishing
+
+Slider images, scrolling notifications and NSS-NCC notices are shown inside a
+start/end window. Readers select the rows inside it themselves with
+PublishingWindow.live_q() (see scheduled_content.py), so content goes live and
+expires on time whether or not the scheduler runs. Each row also stores
+is_live: set from the window when the row is saved (signals.py), and flipped
+by the publishing scheduler when a window opens or closes, which is how the
+scheduler finds the rows that have just crossed a boundary.
+
+The scheduler (manage.py run_publishing_scheduler) keeps a heap of upcoming
+start and end moments, sleeps until the next one and then applies every due
+transition with bulk updates. Updates bypass post_save, so the scheduler bumps
+the generation token of each model it changed, which invalidates the fragment,
+list and page caches built from it (see fragment_cache.py).
+
+Academic calendars switch the same way: when a published calendar's
+start_date arrives it becomes the active academic year. Only the crossing of
+the start date acts, so a calendar activated by hand mid-year stays active.
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .fragment_cache import bump_generation
+
+logger = logging.getLogger(__name__)
+
+LAST_RUN_KEY = 'publishing_last_run'
+
+# A window includes its end moment, so it closes just after it
+END_DELAY = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class PublishingWindow:
+    """A model shown while now is within [start_field, end_field]"""
+    label: str
+    start_field: str
+    end_field: str
+    start_optional: bool = False
+
+    @property
+    def model(self):
+        return apps.get_model(self.label)
+
+    def live_q(self, now):
+        started = Q(**{f'{self.start_field}__lte': now})
+        if self.start_optional:
+            started |= Q(**{f'{self.start_field}__isnull': True})
+        return started & (Q(**{f'{self.end_field}__isnull': True}) | Q(**{f'{self.end_field}__gte': now}))
+
+    def is_live(self, instance, now):
+        start = getattr(instance, self.start_field)
+        end = getattr(instance, self.end_field)
+        if start is None:
+            started = self.start_optional
+        else:
+            started = start <= now
+        return started and (end is None or end >= now)
+
+    def upcoming(self, now):
+        """Moments after now at which a row's live state changes"""
+        manager = self.model._default_manager
+        starts = manager.filter(**{f'{self.start_field}__gt': now}).values_list(self.start_field, flat=True)
+        ends = manager.filter(**{f'{self.end_field}__gte': now}).values_list(self.end_field, flat=True)
+        return [*starts, *(end + END_DELAY for end in ends)]
+
+    def apply(self, now):
+        """Bring stored is_live in line with the window; returns the number of rows flipped"""
+        manager = self.model._default_manager
+        live = self.live_q(now)
+        return (
+            manager.filter(live, is_live=False).update(is_live=True)
+            + manager.filter(~live, is_live=True).update(is_live=False)
+        )
+
+
+PUBLISHING_WINDOWS = (
+    PublishingWindow('college_website.SliderImage', 'start_date', 'end_date', start_optional=True),
+    PublishingWindow('college_website.ScrollingNotification', 'start_date', 'end_date'),
+    PublishingWindow('college_website.NSSNCCNotice', 'publish_date', 'expiry_date'),
+)
+
+
+def get_publishing_window(model):
+    for window in PUBLISHING_WINDOWS:
+        if window.model is model:
+            return window
+    return None
+
+
+def _start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _upcoming_calendar_starts(now):
+    from .models import AcademicCalendar
+
+    days = AcademicCalendar.objects.filter(
+        is_published=True, start_date__gt=timezone.localdate(now)
+    ).values_list('start_date', flat=True)
+    return [_start_of_day(day) for day in days]
+
+
+def _activate_started_calendar(since, now):
+    """Make the calendar whose start_date passed in (since, now] the active one"""
+    from .models import AcademicCalendar
+
+    calendar = AcademicCalendar.objects.filter(
+        is_published=True,
+        start_date__gt=timezone.localdate(since),
+        start_date__lte=timezone.localdate(now),
+    ).order_by('-start_date').first()
+    if calendar is None or calendar.is_active:
+        return False
+    AcademicCalendar.objects.filter(is_active=True).update(is_active=False)
+    AcademicCalendar.objects.filter(pk=calendar.pk).update(is_active=True)
+    logger.info(f"Academic calendar {calendar.academic_year} is now the active year")
+    return True
+
+
+def upcoming_transitions(now):
+    """Heap of (moment, model label) for every transition after now"""
+    heap = [(moment, window.label) for window in PUBLISHING_WINDOWS for moment in window.upcoming(now)]
+    heap.extend((moment, 'college_website.AcademicCalendar') for moment in _upcoming_calendar_starts(now))
+    heapq.heapify(heap)
+    return heap
+
+
+def publish_due(now=None):
+    """Apply every transition due by now; returns the labels of the models changed"""
+    now = now or timezone.now()
+    since = cache.get(LAST_RUN_KEY)
+    changed = []
+    with transaction.atomic():
+        for window in PUBLISHING_WINDOWS:
+            if window.apply(now):
+                changed.append(window.label)
+        if since is not None and _activate_started_calendar(since, now):
+            changed.append('college_website.AcademicCalendar')
+    for label in changed:
+        bump_generation(label)
+    cache.set(LAST_RUN_KEY, now, timeout=None)
+    return changed
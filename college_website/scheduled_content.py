@@ -0,0 +1,81 @@
+"""
+Schedule-aware caching of time-windowed content
+
+Slider images and scrolling notifications are shown between an optional
+start_date and end_date. The rows live right now are selected in the database,
+and the list is cached until the next start_date or end_date among the active
+rows, when the set can change next. Between boundaries a request costs one
+cache lookup and no queries; a save or delete invalidates the list through the
+model's generation token (see fragment_cache.py).
+
+The publishing scheduler (publishing.py) flips the stored is_live flag at the
+same boundaries and bumps the generation tokens then, but reads do not depend
+on it: without a scheduler running the lists still change on time.
+"""
+
+from django.core.cache import cache
+from django.db.models import Min, Q
+from django.utils import timezone
+
+from .fragment_cache import fragment_key, record_dependencies, record_expiry
+from .models import ScrollingNotification, SliderImage
+from .publishing import get_publishing_window
+
+# Upper bound when nothing is scheduled, so superseded lists age out
+MAX_SCHEDULE_TIMEOUT = 60 * 60 * 24
+
+SCHEDULED_LISTS = {
+    SliderImage: ('ordering', '-created_at'),
+    ScrollingNotification: ('display_order', '-priority', '-start_date'),
+}
+
+
+def next_boundary(queryset, window, now):
+    """Earliest moment after now at which a row in queryset starts or ends"""
+    bounds = queryset.aggregate(
+        next_start=Min(window.start_field, filter=Q(**{f'{window.start_field}__gt': now})),
+        next_end=Min(window.end_field, filter=Q(**{f'{window.end_field}__gte': now})),
+    )
+    return min(filter(None, bounds.values()), default=None)
+
+
+def _scheduled_entry(model):
+    """(rows live right now, next boundary), cached until that boundary"""
+    order_by = SCHEDULED_LISTS[model]
+    key = fragment_key(f"scheduled:{model._meta.label_lower}", [model], order_by)
+    entry = cache.get(key)
+    if entry is None:
+        now = timezone.now()
+        window = get_publishing_window(model)
+        candidates = model.objects.filter(is_active=True)
+        items = list(candidates.filter(window.live_q(now)).order_by(*order_by))
+        boundary = next_boundary(candidates, window, now)
+        timeout = MAX_SCHEDULE_TIMEOUT
+        if boundary is not None:
+            # end_date is inclusive, so expire just after the boundary
+            timeout = min(timeout, int((boundary - now).total_seconds()) + 1)
+        entry = (items, boundary)
+        cache.set(key, entry, timeout)
+    return entry
+
+
+def get_scheduled(model):
+    """Active rows of model live right now, cached until the schedule next changes"""
+    record_dependencies([model])
+    items, boundary = _scheduled_entry(model)
+    if boundary is not None:
+        record_expiry(boundary)
+    return items
+
+
+def get_schedule_boundaries():
+    """Next boundary of each scheduled list; changes whenever one of the lists does"""
+    return [_scheduled_entry(model)[1] for model in SCHEDULED_LISTS]
+
+
+def get_live_slider_images():
+    return get_scheduled(SliderImage)
+
+
+def get_live_scrolling_notifications():
+    return get_scheduled(ScrollingNotification)
@@ -0,0 +1,396 @@
+"""
+Site search index
+
+Searchable models are registered in SEARCH_SOURCES. Each object is flattened
+into a SearchDocument row (title, plain-text body, URL, date) whenever it is
+saved, and removed when it is deleted or hidden. Queries run against the
+database's full-text index over those rows: FTS5 on SQLite and a tsvector GIN
+index on PostgreSQL, with a LIKE scan as the fallback for other backends.
+Ranking, snippet highlighting and LIMIT/OFFSET all happen in the database.
+"""
+
+import datetime
+import html
+import logging
+import re
+from dataclasses import dataclass, field
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.urls import reverse
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+from .models import (
+    Notice, Event, Program, Page, Faculty, Department, Publication,
+    QuestionPaper, Gallery, IQACReport, SearchDocument,
+)
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = 'college_website_searchdocument_fts'
+
+# Bodies are truncated so a single huge page cannot bloat the index
+MAX_BODY_LENGTH = 20000
+
+# Query terms beyond this are ignored
+MAX_QUERY_TERMS = 10
+
+# Snippet highlight markers; control characters never survive strip_tags text
+_MARK_START = '\x02'
+_MARK_END = '\x03'
+
+_WORD_RE = re.compile(r'\w+')
+_SPACE_RE = re.compile(r'\s+')
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """How one model is turned into search documents"""
+    doc_type: str
+    label: str
+    model: type
+    title_field: str
+    body_fields: tuple
+    date_field: str
+    get_url: object = None
+    filters: dict = field(default_factory=dict)
+    select_related: tuple = ()
+
+    def get_queryset(self):
+        """Objects of this source that should be in the index"""
+        queryset = self.model.objects.filter(**self.filters)
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        return queryset
+
+    def is_searchable(self, instance):
+        return all(getattr(instance, name) == value for name, value in self.filters.items())
+
+    def build_document(self, instance):
+        """Unsaved SearchDocument for instance"""
+        body = ' '.join(
+            _plain_text(getattr(instance, name)) for name in self.body_fields
+        )
+        published = getattr(instance, self.date_field, None)
+        if isinstance(published, datetime.datetime):
+            published = published.date()
+        url = self.get_url(instance) if self.get_url else instance.get_absolute_url()
+        return SearchDocument(
+            doc_type=self.doc_type,
+            object_id=instance.pk,
+            title=_plain_text(getattr(instance, self.title_field))[:500],
+            body=body.strip()[:MAX_BODY_LENGTH],
+            url=url[:500],
+            published=published,
+        )
+
+
+def _plain_text(value):
+    """Rich text or plain value as a single line of plain text"""
+    if not value:
+        return ''
+    text = html.unescape(strip_tags(str(value)))
+    return _SPACE_RE.sub(' ', text).strip()
+
+
+def _publication_url(publication):
+    if publication.url:
+        return publication.url
+    if publication.doi:
+        return f"https://doi.org/{publication.doi}"
+    return reverse('college_website:publications')
+
+
+def _iqac_report_url(report):
+    if report.report_file:
+        return reverse('college_website:iqac_report_download', kwargs={'slug': report.slug})
+    return reverse('college_website:iqac_reports')
+
+
+SEARCH_SOURCES = {source.doc_type: source for source in (
+    SearchSource('notice', 'Notice', Notice, 'title', ('content', 'category'), 'publish_date',
+                 filters={'is_active': True}),
+    SearchSource('event', 'Event', Event, 'title', ('description', 'location', 'organizer'), 'date',
+                 filters={'is_active': True}),
+    SearchSource('program', 'Program', Program, 'name',
+                 ('short_name', 'description', 'department', 'eligibility', 'career_opportunities'),
+                 'created_at', filters={'is_active': True}),
+    SearchSource('page', 'Page', Page, 'title', ('meta_description', 'meta_keywords'), 'updated_at',
+                 filters={'is_active': True}),
+    SearchSource('faculty', 'Faculty', Faculty, 'name',
+                 ('specialization', 'qualifications', 'research_interests', 'bio'), 'updated_at',
+                 filters={'is_active': True}, select_related=('department',)),
+    SearchSource('department', 'Department', Department, 'name',
+                 ('short_name', 'tagline', 'short_description', 'description', 'research_areas'),
+                 'updated_at', filters={'is_active': True}),
+    SearchSource('publication', 'Publication', Publication, 'title',
+                 ('authors', 'journal_name', 'abstract'), 'created_at',
+                 get_url=_publication_url, filters={'is_active': True}),
+    SearchSource('question_paper', 'Question Paper', QuestionPaper, 'title',
+                 ('subject', 'academic_year', 'description'), 'created_at',
+                 filters={'is_active': True}),
+    SearchSource('gallery', 'Gallery', Gallery, 'title', ('description', 'meta_description'), 'created_at',
+                 filters={'is_active': True}),
+    SearchSource('iqac_report', 'IQAC Report', IQACReport, 'title', ('academic_year', 'description'),
+                 'publish_date', get_url=_iqac_report_url, filters={'is_published': True}),
+)}
+
+_SOURCES_BY_MODEL = {source.model: source for source in SEARCH_SOURCES.values()}
+
+
+def get_search_models():
+    """Models whose saves and deletes must update the index"""
+    return tuple(_SOURCES_BY_MODEL)
+
+
+def get_search_categories():
+    """(doc_type, label) choices for the search form"""
+    return [(source.doc_type, source.label) for source in SEARCH_SOURCES.values()]
+
+
+def index_instance(instance):
+    """Add, refresh or drop the search document for a saved object"""
+    source = _SOURCES_BY_MODEL.get(type(instance))
+    if source is None:
+        return
+    if not source.is_searchable(instance):
+        remove_instance(instance)
+        return
+    document = source.build_document(instance)
+    SearchDocument.objects.update_or_create(
+        doc_type=source.doc_type,
+        object_id=instance.pk,
+        defaults={
+            'title': document.title,
+            'body': document.body,
+            'url': document.url,
+            'published': document.published,
+        },
+    )
+
+
+def remove_instance(instance):
+    """Drop the search document for an object"""
+    source = _SOURCES_BY_MODEL.get(type(instance))
+    if source is not None:
+        SearchDocument.objects.filter(doc_type=source.doc_type, object_id=instance.pk).delete()
+
+
+def rebuild_index(doc_types=None):
+    """Recreate search documents from scratch; returns the number indexed per type"""
+    counts = {}
+    with transaction.atomic():
+        for doc_type, source in SEARCH_SOURCES.items():
+            if doc_types and doc_type not in doc_types:
+                continue
+            # A raw delete skips loading every row and the per-row autocomplete
+            # updates; the whole prefix index is reset below
+            SearchDocument.objects.filter(doc_type=doc_type)._raw_delete(SearchDocument.objects.db)
+            documents = [source.build_document(instance) for instance in source.get_queryset().iterator()]
+            SearchDocument.objects.bulk_create(documents, batch_size=500)
+            counts[doc_type] = len(documents)
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    # bulk_create sends no signals, so the autocomplete index must be told
+    from .autocomplete import reset_prefix_index
+    reset_prefix_index()
+    return counts
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked search result"""
+    doc_type: str
+    object_id: int
+    title: str
+    url: str
+    published: object
+    snippet: str
+    rank: float
+
+    @property
+    def label(self):
+        source = SEARCH_SOURCES.get(self.doc_type)
+        return source.label if source else self.doc_type
+
+
+def _query_terms(query):
+    return _WORD_RE.findall(query.lower())[:MAX_QUERY_TERMS]
+
+
+def _highlight(text):
+    """Escape snippet text and turn the highlight markers into <mark> tags"""
+    return mark_safe(
+        escape(text).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+    )
+
+
+class _FTS5Backend:
+    """SQLite FTS5 over the external-content table created by migration 0044"""
+
+    FROM = (
+        f"FROM {FTS_TABLE} JOIN college_website_searchdocument d ON d.id = {FTS_TABLE}.rowid "
+        f"WHERE {FTS_TABLE} MATCH %s"
+    )
+
+    def _match(self, terms):
+        # Every term must match; the last one may be a prefix of a longer word
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += '*'
+        return ' '.join(quoted)
+
+    def _where(self, terms, doc_type):
+        sql, params = self.FROM, [self._match(terms)]
+        if doc_type:
+            sql += " AND d.doc_type = %s"
+            params.append(doc_type)
+        return sql, params
+
+    def count(self, terms, doc_type):
+        where, params = self._where(terms, doc_type)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) {where}", params)
+            return cursor.fetchone()[0]
+
+    def hits(self, terms, doc_type, limit, offset):
+        where, params = self._where(terms, doc_type)
+        sql = (
+            "SELECT d.doc_type, d.object_id, d.title, d.url, d.published, "
+            f"snippet({FTS_TABLE}, -1, char(2), char(3), '…', 24), bm25({FTS_TABLE}, 10.0, 1.0) AS rank "
+            f"{where} ORDER BY rank, d.published DESC LIMIT %s OFFSET %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params + [limit, offset])
+            rows = cursor.fetchall()
+        return [
+            SearchHit(doc_type, object_id, title, url, _as_date(published), _highlight(snippet), -rank)
+            for doc_type, object_id, title, url, published, snippet, rank in rows
+        ]
+
+
+class _PostgresBackend:
+    """tsvector query matching the GIN expression index created by migration 0044"""
+
+    VECTOR = (
+        "(setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(body, '')), 'B'))"
+    )
+
+    def _where(self, terms, doc_type):
+        # Prefix-match the last term, AND all of them
+        tsquery = ' & '.join(terms[:-1] + [f"{terms[-1]}:*"])
+        sql = f"FROM college_website_searchdocument, to_tsquery('english', %s) query WHERE {self.VECTOR} @@ query"
+        params = [tsquery]
+        if doc_type:
+            sql += " AND doc_type = %s"
+            params.append(doc_type)
+        return sql, params
+
+    def count(self, terms, doc_type):
+        where, params = self._where(terms, doc_type)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) {where}", params)
+            return cursor.fetchone()[0]
+
+    def hits(self, terms, doc_type, limit, offset):
+        where, params = self._where(terms, doc_type)
+        # Rank and page first, then build headlines only for the rows on this page
+        sql = (
+            "SELECT doc_type, object_id, title, url, published, "
+            "ts_headline('english', body, query, 'StartSel=\x02, StopSel=\x03, MaxWords=35, MinWords=15'), rank "
+            f"FROM (SELECT doc_type, object_id, title, url, published, body, query, "
+            f"ts_rank({self.VECTOR}, query) AS rank {where} "
+            "ORDER BY rank DESC, published DESC NULLS LAST LIMIT %s OFFSET %s) page "
+            "ORDER BY rank DESC, published DESC NULLS LAST"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params + [limit, offset])
+            rows = cursor.fetchall()
+        return [
+            SearchHit(doc_type, object_id, title, url, published, _highlight(snippet), rank)
+            for doc_type, object_id, title, url, published, snippet, rank in rows
+        ]
+
+
+class _LikeBackend:
+    """Unindexed fallback for databases without a full-text index"""
+
+    def _queryset(self, terms, doc_type):
+        queryset = SearchDocument.objects.all()
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(body__icontains=term))
+        if doc_type:
+            queryset = queryset.filter(doc_type=doc_type)
+        return queryset
+
+    def count(self, terms, doc_type):
+        return self._queryset(terms, doc_type).count()
+
+    def hits(self, terms, doc_type, limit, offset):
+        documents = self._queryset(terms, doc_type).order_by('-published', 'title')[offset:offset + limit]
+        return [
+            SearchHit(doc.doc_type, doc.object_id, doc.title, doc.url, doc.published,
+                      _highlight(_like_snippet(doc.body, terms)), 0.0)
+            for doc in documents
+        ]
+
+
+def _like_snippet(body, terms, width=160):
+    lowered = body.lower()
+    start = min((lowered.find(term) for term in terms if term in lowered), default=0)
+    start = max(start - width // 4, 0)
+    text = body[start:start + width]
+    pattern = re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+    text = pattern.sub(lambda match: f"{_MARK_START}{match.group(0)}{_MARK_END}", text)
+    return ('…' if start else '') + text + ('…' if start + width < len(body) else '')
+
+
+def _as_date(value):
+    # SQLite hands raw SQL dates back as ISO strings
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+def get_search_backend():
+    if connection.vendor == 'sqlite':
+        return _FTS5Backend()
+    if connection.vendor == 'postgresql':
+        return _PostgresBackend()
+    return _LikeBackend()
+
+
+class SearchResults:
+    """Lazily evaluated results for one query, sliceable by Paginator
+
+    count() runs a single COUNT over the index and slicing runs a single
+    ranked LIMIT/OFFSET query; nothing beyond the requested page is loaded.
+    """
+
+    def __init__(self, query, doc_type=None):
+        self.terms = _query_terms(query or '')
+        self.doc_type = doc_type or None
+        self.backend = get_search_backend()
+        self._count = None
+
+    def count(self):
+        if self._count is None:
+            self._count = self.backend.count(self.terms, self.doc_type) if self.terms else 0
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start = key.start or 0
+            stop = key.stop if key.stop is not None else self.count()
+            if not self.terms or stop <= start:
+                return []
+            return self.backend.hits(self.terms, self.doc_type, stop - start, start)
+        hits = self[key:key + 1]
+        if not hits:
+            raise IndexError(key)
+        return hits[0]
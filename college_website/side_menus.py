@@ -0,0 +1,149 @@
+"""
+Compiled side menu matcher
+
+Active SideMenu rules are compiled once per side menu version into a prefix
+trie (url_pattern menus) plus hash maps (page_slug and section menus), so a
+request is matched in a single walk over its path instead of calling
+``SideMenu.matches_request`` on every menu. Matched menus carry their active
+items already linked into a tree.
+"""
+
+import logging
+import uuid
+
+from django.core.cache import cache
+
+from .cache_stampede import cached_value
+from .models import SideMenu, SideMenuItem
+
+logger = logging.getLogger(__name__)
+
+SIDE_MENU_VERSION_KEY = 'side_menu_version'
+SIDE_MENU_MATCHER_KEY = 'side_menu_matcher:{version}'
+SIDE_MENU_MATCHER_TIMEOUT = 3600
+
+# Trie node key holding the menus whose url_pattern ends at that node
+_MENUS = '\0'
+
+# Process-local copy of the last matcher, so each request does not have to
+# unpickle it from the cache.
+_local_matcher = None
+
+
+class SideMenuMatcher:
+    """Side menu rules compiled into lookup structures for one version"""
+
+    def __init__(self, version, menus):
+        self.version = version
+        self.global_menus = []
+        self.prefix_trie = {}
+        self.page_slugs = {}
+        self.sections = {}
+        # Section names spanning several path segments fall back to a substring check
+        self.nested_sections = []
+        # Menus arrive ordered by ('-priority', 'name'); matches keep that order
+        self.rank = {menu.pk: position for position, menu in enumerate(menus)}
+
+        for menu in menus:
+            if menu.assignment_type == 'global':
+                self.global_menus.append(menu)
+            elif menu.assignment_type == 'url_pattern' and menu.url_pattern:
+                node = self.prefix_trie
+                for char in menu.url_pattern:
+                    node = node.setdefault(char, {})
+                node.setdefault(_MENUS, []).append(menu)
+            elif menu.assignment_type == 'page_slug' and menu.page_slug:
+                self.page_slugs.setdefault(menu.page_slug, []).append(menu)
+            elif menu.assignment_type == 'section' and menu.section_name:
+                if '/' in menu.section_name:
+                    self.nested_sections.append((f"/{menu.section_name}/", menu))
+                else:
+                    self.sections.setdefault(menu.section_name, []).append(menu)
+
+    def match(self, request):
+        """Side menus for the request, highest priority first"""
+        path = request.path
+        matched = list(self.global_menus)
+
+        node = self.prefix_trie
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            matched.extend(node.get(_MENUS, ()))
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match and self.page_slugs:
+            matched.extend(self.page_slugs.get(resolver_match.kwargs.get('slug'), ()))
+
+        if self.sections:
+            # Only segments enclosed by slashes count, matching "/<section>/" in path
+            for segment in path.split('/')[1:-1]:
+                matched.extend(self.sections.get(segment, ()))
+        for needle, menu in self.nested_sections:
+            if needle in path:
+                matched.append(menu)
+
+        unique = {menu.pk: menu for menu in matched}
+        return sorted(unique.values(), key=lambda menu: self.rank[menu.pk])
+
+
+def build_side_menu_matcher(version):
+    """Load active side menus with their item trees and compile the matcher"""
+    menus = list(SideMenu.objects.filter(is_active=True).order_by('-priority', 'name'))
+    items = SideMenuItem.objects.filter(
+        is_active=True, side_menu__in=menus
+    ).select_related('cms_page').order_by('ordering', 'title')
+
+    items_by_menu = {menu.pk: [] for menu in menus}
+    children_by_parent = {}
+    for item in items:
+        items_by_menu[item.side_menu_id].append(item)
+        children_by_parent.setdefault(item.parent_id, []).append(item)
+
+    for menu in menus:
+        menu.prefetched_items = items_by_menu[menu.pk]
+        menu.top_level_items = [item for item in menu.prefetched_items if item.parent_id is None]
+        for item in menu.prefetched_items:
+            item.prefetched_children = children_by_parent.get(item.pk, [])
+
+    return SideMenuMatcher(version, menus)
+
+
+def get_side_menu_version():
+    """Get the current side menu version, initialising it if missing"""
+    version = cache.get(SIDE_MENU_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(SIDE_MENU_VERSION_KEY, version, timeout=None):
+            version = cache.get(SIDE_MENU_VERSION_KEY, version)
+    return version
+
+
+def bump_side_menu_version():
+    """Invalidate the compiled matcher by moving to a new version"""
+    global _local_matcher
+    version = uuid.uuid4().hex
+    cache.set(SIDE_MENU_VERSION_KEY, version, timeout=None)
+    _local_matcher = None
+    return version
+
+
+def get_side_menu_matcher():
+    """Get the matcher for the current side menu version, compiling it if needed"""
+    global _local_matcher
+    version = get_side_menu_version()
+
+    matcher = _local_matcher
+    if matcher is not None and matcher.version == version:
+        return matcher
+
+    # Single flight, so a version bump doesn't make every worker rebuild at once
+    matcher = cached_value(
+        SIDE_MENU_MATCHER_KEY.format(version=version),
+        lambda: build_side_menu_matcher(version),
+        SIDE_MENU_MATCHER_TIMEOUT,
+    )
+
+    _local_matcher = matcher
+    return matcher
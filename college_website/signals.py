@@ -3,13 +3,29 @@ Signal handlers for college website models
 """
 
 import logging
-from django.db.models.signals import pre_save, post_save, post_delete
+from django.apps import apps
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
 from django.dispatch import receiver
 from django.core.cache import cache
+from django.db import transaction
 from django.contrib import messages
 from django.utils import timezone
-from .models import TopUtilityBar, ScrollingNotification
+from .models import (
+    TopUtilityBar, ScrollingNotification, CollegeInfo, NavbarInfo, HeaderInfo,
+    Menu, MenuItem, Page, ImportantLink, Department, Notice,
+    MenuCategory, MenuSubmenu, MenuVisibilitySettings, SideMenu, SideMenuItem,
+    SearchDocument, AcademicCalendar, AcademicEvent,
+)
 from .validators import TopUtilityBarValidator
+from .site_chrome import bump_chrome_version
+from .side_menus import bump_side_menu_version
+from .search import get_search_models, index_instance, remove_instance
+from .autocomplete import update_suggestion, remove_suggestion
+from .images import ensure_derivatives, get_responsive_image_models
+from .calendar_pdf import schedule_calendar_pdf
+from .fragment_cache import bump_generation
+from .cache_stampede import cache_single_flight
+from .publishing import PUBLISHING_WINDOWS, get_publishing_window
 
 logger = logging.getLogger(__name__)
 
@@ -71,13 +87,6 @@ def handle_top_utility_bar_save(sender, instance, created, **kwargs):
         if deactivated_count > 0:
             logger.info(f'{deactivated_count} other utility bar(s) were automatically deactivated')
         
-        # Cache the active utility bar
-        cache.set('active_utility_bar', instance, timeout=3600)  # Cache for 1 hour
-    else:
-        # Remove from cache if deactivated
-        cached_bar = cache.get('active_utility_bar')
-        if cached_bar and cached_bar.pk == instance.pk:
-            cache.delete('active_utility_bar')
 
 
 @receiver(post_delete, sender=TopUtilityBar)
@@ -111,97 +120,82 @@ def validate_scrolling_notification(sender, instance, **kwargs):
             raise ValidationError("End date must be after start date")
 
 
+@cache_single_flight('active_utility_bar', timeout=3600, stale_timeout=300)
 def get_active_utility_bar():
     """
     Helper function to get the active utility bar with caching
     """
-    cached_bar = cache.get('active_utility_bar')
-    
-    if cached_bar is None:
-        try:
-            active_bar = TopUtilityBar.objects.get(is_active=True)
-            cache.set('active_utility_bar', active_bar, timeout=3600)
-            return active_bar
-        except TopUtilityBar.DoesNotExist:
-            return None
-        except TopUtilityBar.MultipleObjectsReturned:
-            # Handle case where multiple are active (shouldn't happen but just in case)
-            logger.warning("Multiple active utility bars found, using the most recent")
-            active_bar = TopUtilityBar.objects.filter(is_active=True).order_by('-updated_at').first()
-            
-            # Fix the issue by deactivating all but the most recent
-            TopUtilityBar.objects.filter(is_active=True).exclude(pk=active_bar.pk).update(is_active=False)
-            
-            cache.set('active_utility_bar', active_bar, timeout=3600)
-            return active_bar
-    
-    return cached_bar
+    try:
+        return TopUtilityBar.objects.get(is_active=True)
+    except TopUtilityBar.DoesNotExist:
+        return None
+    except TopUtilityBar.MultipleObjectsReturned:
+        # Handle case where multiple are active (shouldn't happen but just in case)
+        logger.warning("Multiple active utility bars found, using the most recent")
+        active_bar = TopUtilityBar.objects.filter(is_active=True).order_by('-updated_at').first()
+        
+        # Fix the issue by deactivating all but the most recent
+        TopUtilityBar.objects.filter(is_active=True).exclude(pk=active_bar.pk).update(is_active=False)
+        
+        return active_bar
 
 
+@cache_single_flight('utility_bar_context', timeout=1800, stale_timeout=300)
 def get_utility_bar_context():
     """
     Get utility bar context for templates with caching
     """
-    context = cache.get('utility_bar_context')
+    active_bar = get_active_utility_bar()
+    if not active_bar:
+        return {'utility_bar': None}
+
+    # Build context data
+    context = {
+        'utility_bar': active_bar,
+        'show_social_icons': active_bar.show_social_icons,
+        'show_contact_info': active_bar.show_contact_info,
+        'show_custom_links': active_bar.show_custom_links,
+        'social_links': [],
+        'contact_info': {},
+        'custom_links': []
+    }
     
-    if context is None:
-        active_bar = get_active_utility_bar()
+    # Collect social links
+    if active_bar.show_social_icons:
+        social_links = [
+            ('facebook', active_bar.facebook_url, 'fab fa-facebook-f'),
+            ('twitter', active_bar.twitter_url, 'fab fa-twitter'),
+            ('instagram', active_bar.instagram_url, 'fab fa-instagram'),
+            ('youtube', active_bar.youtube_url, 'fab fa-youtube'),
+            ('linkedin', active_bar.linkedin_url, 'fab fa-linkedin'),
+        ]
         
-        if active_bar:
-            # Build context data
-            context = {
-                'utility_bar': active_bar,
-                'show_social_icons': active_bar.show_social_icons,
-                'show_contact_info': active_bar.show_contact_info,
-                'show_custom_links': active_bar.show_custom_links,
-                'social_links': [],
-                'contact_info': {},
-                'custom_links': []
-            }
-            
-            # Collect social links
-            if active_bar.show_social_icons:
-                social_links = [
-                    ('facebook', active_bar.facebook_url, 'fab fa-facebook-f'),
-                    ('twitter', active_bar.twitter_url, 'fab fa-twitter'),
-                    ('instagram', active_bar.instagram_url, 'fab fa-instagram'),
-                    ('youtube', active_bar.youtube_url, 'fab fa-youtube'),
-                    ('linkedin', active_bar.linkedin_url, 'fab fa-linkedin'),
-                ]
-                
-                context['social_links'] = [
-                    {'platform': platform, 'url': url, 'icon': icon}
-                    for platform, url, icon in social_links if url
-                ]
-            
-            # Collect contact info
-            if active_bar.show_contact_info:
-                contact_info = {}
-                if active_bar.contact_phone:
-                    contact_info['phone'] = active_bar.contact_phone
-                if active_bar.contact_email:
-                    contact_info['email'] = active_bar.contact_email
-                context['contact_info'] = contact_info
-            
-            # Collect custom links
-            if active_bar.show_custom_links:
-                custom_links = []
-                for i in range(1, 4):
-                    text = getattr(active_bar, f'custom_link_{i}_text', '')
-                    url = getattr(active_bar, f'custom_link_{i}_url', '')
-                    
-                    if text and url:
-                        custom_links.append({'text': text, 'url': url})
-                
-                context['custom_links'] = custom_links
-            
-            # Cache for 30 minutes
-            cache.set('utility_bar_context', context, timeout=1800)
-        else:
-            context = {'utility_bar': None}
-            # Cache empty result for 5 minutes
-            cache.set('utility_bar_context', context, timeout=300)
+        context['social_links'] = [
+            {'platform': platform, 'url': url, 'icon': icon}
+            for platform, url, icon in social_links if url
+        ]
+    
+    # Collect contact info
+    if active_bar.show_contact_info:
+        contact_info = {}
+        if active_bar.contact_phone:
+            contact_info['phone'] = active_bar.contact_phone
+        if active_bar.contact_email:
+            contact_info['email'] = active_bar.contact_email
+        context['contact_info'] = contact_info
     
+    # Collect custom links
+    if active_bar.show_custom_links:
+        custom_links = []
+        for i in range(1, 4):
+            text = getattr(active_bar, f'custom_link_{i}_text', '')
+            url = getattr(active_bar, f'custom_link_{i}_url', '')
+            
+            if text and url:
+                custom_links.append({'text': text, 'url': url})
+        
+        context['custom_links'] = custom_links
+
     return context
 
 
@@ -219,6 +213,147 @@ def clear_utility_bar_cache(sender, **kwargs):
         cache.delete(key)
 
 
+# Models whose rows end up in the site chrome snapshot (see site_chrome.py).
+# Page is included because CMS menu items link to pages by slug, and Notice
+# because of the "recent notices" badge.
+SITE_CHROME_MODELS = (
+    CollegeInfo, NavbarInfo, HeaderInfo, Menu, MenuItem, Page, ImportantLink,
+    Department, Notice, MenuCategory, MenuSubmenu, MenuVisibilitySettings,
+)
+
+
+def invalidate_site_chrome(sender, **kwargs):
+    """Rebuild the site chrome snapshot once a chrome model change is committed"""
+    # A bump before the commit lets another worker cache the old rows under
+    # the new version
+    transaction.on_commit(bump_chrome_version)
+
+
+for _model in SITE_CHROME_MODELS:
+    post_save.connect(invalidate_site_chrome, sender=_model, dispatch_uid=f'site_chrome_save_{_model.__name__}')
+    post_delete.connect(invalidate_site_chrome, sender=_model, dispatch_uid=f'site_chrome_delete_{_model.__name__}')
+
+
+# Models feeding the compiled side menu matcher (see side_menus.py). Page is
+# included because side menu items link to CMS pages.
+SIDE_MENU_MODELS = (SideMenu, SideMenuItem, Page)
+
+
+def invalidate_side_menus(sender, **kwargs):
+    """Recompile the side menu matcher once a side menu change is committed"""
+    transaction.on_commit(bump_side_menu_version)
+
+
+for _model in SIDE_MENU_MODELS:
+    post_save.connect(invalidate_side_menus, sender=_model, dispatch_uid=f'side_menus_save_{_model.__name__}')
+    post_delete.connect(invalidate_side_menus, sender=_model, dispatch_uid=f'side_menus_delete_{_model.__name__}')
+
+
+def update_search_document(sender, instance, raw=False, **kwargs):
+    """Keep the search index in step with a saved object"""
+    if raw:
+        return
+    try:
+        index_instance(instance)
+    except Exception as e:
+        # A broken index must not block saving content
+        logger.error(f"Error indexing {sender.__name__} {instance.pk} for search: {e}")
+
+
+def delete_search_document(sender, instance, **kwargs):
+    """Drop a deleted object from the search index"""
+    try:
+        remove_instance(instance)
+    except Exception as e:
+        logger.error(f"Error removing {sender.__name__} {instance.pk} from search: {e}")
+
+
+for _model in get_search_models():
+    post_save.connect(update_search_document, sender=_model, dispatch_uid=f'search_save_{_model.__name__}')
+    post_delete.connect(delete_search_document, sender=_model, dispatch_uid=f'search_delete_{_model.__name__}')
+
+
+@receiver(post_save, sender=SearchDocument)
+def update_autocomplete_suggestion(sender, instance, **kwargs):
+    """Patch the autocomplete prefix index when a search document changes"""
+    update_suggestion(instance)
+
+
+@receiver(post_delete, sender=SearchDocument)
+def remove_autocomplete_suggestion(sender, instance, **kwargs):
+    """Drop a deleted search document from the autocomplete prefix index"""
+    remove_suggestion(instance)
+
+
+def generate_image_derivatives(sender, instance, raw=False, **kwargs):
+    """Build responsive variants for freshly uploaded images"""
+    if raw:
+        return
+    for field_name in RESPONSIVE_IMAGE_FIELD_NAMES[sender]:
+        # Cheap when the manifest already exists, so unchanged images cost nothing
+        ensure_derivatives(getattr(instance, field_name))
+
+
+RESPONSIVE_IMAGE_FIELD_NAMES = dict(get_responsive_image_models())
+
+for _model in RESPONSIVE_IMAGE_FIELD_NAMES:
+    post_save.connect(generate_image_derivatives, sender=_model, dispatch_uid=f'image_derivatives_{_model.__name__}')
+
+
+@receiver([post_save, post_delete], sender=AcademicCalendar)
+def regenerate_calendar_pdf(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Re-render the generated PDF once a calendar change is committed"""
+    if raw or update_fields == frozenset({'download_count'}):
+        return
+    # Read the pk now; deletion clears it before on_commit callbacks run
+    calendar_id = instance.pk
+    transaction.on_commit(lambda: schedule_calendar_pdf(calendar_id))
+
+
+@receiver([post_save, post_delete], sender=AcademicEvent)
+def regenerate_calendar_pdf_for_event(sender, instance, raw=False, **kwargs):
+    """Re-render the generated PDF of the event's calendar"""
+    if raw:
+        return
+    calendar_id = instance.calendar_id
+    transaction.on_commit(lambda: schedule_calendar_pdf(calendar_id))
+
+
+def set_live_state(sender, instance, raw=False, **kwargs):
+    """Store whether the row is inside its publishing window as of now"""
+    if raw:
+        return
+    instance.is_live = get_publishing_window(sender).is_live(instance, timezone.now())
+
+
+for _window in PUBLISHING_WINDOWS:
+    pre_save.connect(set_live_state, sender=_window.model, dispatch_uid=f'publishing_live_state_{_window.label}')
+
+
+def bump_fragment_generation(sender, raw=False, **kwargs):
+    """Invalidate {% cache_versioned %} fragments built from the saved model once committed"""
+    if raw:
+        return
+    transaction.on_commit(lambda: bump_generation(sender))
+
+
+@receiver(m2m_changed, dispatch_uid='fragment_generation_m2m')
+def bump_fragment_generation_m2m(sender, instance, action, model, **kwargs):
+    """Relation changes count as changes to both sides"""
+    if action in ('post_add', 'post_remove', 'post_clear') and instance._meta.app_label == 'college_website':
+        changed = type(instance)
+
+        def bump_both():
+            bump_generation(changed)
+            bump_generation(model)
+        transaction.on_commit(bump_both)
+
+
+for _model in apps.get_app_config('college_website').get_models():
+    post_save.connect(bump_fragment_generation, sender=_model, dispatch_uid=f'fragment_generation_save_{_model.__name__}')
+    post_delete.connect(bump_fragment_generation, sender=_model, dispatch_uid=f'fragment_generation_delete_{_model.__name__}')
+
+
 class UtilityBarManager:
     """
     Manager class for utility bar operations
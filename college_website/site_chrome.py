@@ -0,0 +1,343 @@
+"""
+Versioned site chrome snapshot
+
+Everything the shared page chrome needs (college info, navbar, header, CMS
+menus, important/quick links, departments and menu visibility) is built once,
+stored in the cache under a version key and reused by every request until one
+of the underlying models is saved or deleted.
+"""
+
+import hashlib
+import logging
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .cache_stampede import cached_value
+from .models import (
+    CollegeInfo, NavbarInfo, HeaderInfo, Menu, MenuItem, ImportantLink,
+    Department, Notice, MenuCategory, MenuSubmenu, MenuVisibilitySettings,
+)
+
+logger = logging.getLogger(__name__)
+
+CHROME_VERSION_KEY = 'site_chrome_version'
+CHROME_SNAPSHOT_KEY = 'site_chrome_snapshot_v2:{version}'
+
+# The snapshot carries a "notices in the last 7 days" badge, so it is rebuilt
+# at least hourly even when nothing is edited.
+CHROME_SNAPSHOT_TIMEOUT = 3600
+CHROME_SNAPSHOT_STALE_TIMEOUT = 300
+
+# Generated navbar stylesheet, keyed by the NavbarInfo row and its updated_at
+NAVBAR_STYLESHEET_KEY = 'navbar_stylesheet:{pk}:{stamp}'
+
+# Request attribute holding the per-request navbar config memo
+NAVBAR_MEMO_ATTR = '_navbar_config_memo'
+
+# Process-local copy of the last snapshot, so repeated lookups within a worker
+# do not have to unpickle it from the cache every time. It is only trusted
+# until the snapshot is CHROME_SNAPSHOT_TIMEOUT old; after that the shared
+# cache decides whether to refresh it.
+_local_snapshot = None
+
+
+class MenuVisibilityTable(Mapping):
+    """Read-only menu slug -> visible lookup compiled from MenuVisibilitySettings"""
+
+    def __init__(self, visible=None):
+        self._visible = dict(visible or {})
+
+    def __getitem__(self, menu_name):
+        return self._visible[menu_name]
+
+    def __iter__(self):
+        return iter(self._visible)
+
+    def __len__(self):
+        return len(self._visible)
+
+    def is_visible(self, menu_name):
+        """Menus without a visibility setting are always shown"""
+        return self._visible.get(str(menu_name).lower(), True)
+
+
+@dataclass(frozen=True)
+class SiteChrome:
+    """Immutable bundle of everything rendered around page content"""
+    version: str
+    college_info: object
+    navbar_info: object
+    header_info: object
+    cms_menus: tuple
+    important_links: tuple
+    quick_links: tuple
+    departments: tuple
+    menu_visibility: object
+    menu_visibility_table: MenuVisibilityTable
+    menu_categories: tuple
+    recent_notices_count: int
+    navbar_css_vars: tuple
+    built_at: object
+
+    def as_context(self):
+        """Template context variables provided by the snapshot"""
+        return {
+            'college_info': self.college_info,
+            'main_menus': self.cms_menus,  # Legacy support
+            'cms_menus': self.cms_menus,
+            'navbar_info': self.navbar_info,
+            'navbar_config': self.navbar_info,
+            'navbar_css_vars': dict(self.navbar_css_vars),
+            'header_info': self.header_info,
+            'important_links': self.important_links,
+            'quick_links': self.quick_links,
+            'recent_notices_count': self.recent_notices_count,
+            'departments': self.departments,
+            'menu_visibility': self.menu_visibility,
+            'menu_visibility_table': self.menu_visibility_table,
+            'menu_categories': self.menu_categories,
+        }
+
+
+def get_chrome_version():
+    """Get the current site chrome version, initialising it if missing"""
+    version = cache.get(CHROME_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        # add() so that concurrent initialisers agree on a single version
+        if not cache.add(CHROME_VERSION_KEY, version, timeout=None):
+            version = cache.get(CHROME_VERSION_KEY, version)
+    return version
+
+
+def bump_chrome_version():
+    """Invalidate every cached snapshot by moving to a new version"""
+    global _local_snapshot
+    version = uuid.uuid4().hex
+    cache.set(CHROME_VERSION_KEY, version, timeout=None)
+    _local_snapshot = None
+    return version
+
+
+def get_site_chrome():
+    """Get the site chrome snapshot for the current version, building it if needed"""
+    global _local_snapshot
+    version = get_chrome_version()
+
+    snapshot = _local_snapshot
+    if (snapshot is not None and snapshot.version == version
+            and timezone.now() - snapshot.built_at < timezone.timedelta(seconds=CHROME_SNAPSHOT_TIMEOUT)):
+        return snapshot
+
+    # One request rebuilds after a version bump while the others wait for it;
+    # on the hourly refresh the old snapshot is served during the rebuild
+    snapshot = cached_value(
+        CHROME_SNAPSHOT_KEY.format(version=version),
+        lambda: build_site_chrome(version),
+        CHROME_SNAPSHOT_TIMEOUT,
+        stale_timeout=CHROME_SNAPSHOT_STALE_TIMEOUT,
+    )
+
+    _local_snapshot = snapshot
+    return snapshot
+
+
+class NavbarConfigMemo:
+    """Active NavbarInfo resolved for one request, with a count of reused lookups"""
+
+    def __init__(self, config):
+        self.config = config
+        self.lookups = 1
+        self.hits = 0
+
+
+def get_navbar_config(request=None, chrome=None):
+    """
+    Get the active navbar configuration, resolved at most once per request.
+
+    Without a request the snapshot's (per-version) copy is returned.
+    """
+    memo = getattr(request, NAVBAR_MEMO_ATTR, None) if request is not None else None
+    if memo is not None:
+        memo.lookups += 1
+        memo.hits += 1
+        return memo.config
+
+    config = (chrome or get_site_chrome()).navbar_info
+    if request is not None:
+        setattr(request, NAVBAR_MEMO_ATTR, NavbarConfigMemo(config))
+    return config
+
+
+def get_navbar_memo_stats(request):
+    """Return (lookups, served_from_memo) for the navbar config memo of a request"""
+    memo = getattr(request, NAVBAR_MEMO_ATTR, None)
+    if memo is None:
+        return 0, 0
+    return memo.lookups, memo.hits
+
+
+def build_site_chrome(version):
+    """Query every chrome model once and freeze the result"""
+    navbar_info = _get_navbar_info()
+
+    now = timezone.now()
+    recent_notices_count = Notice.objects.filter(
+        is_active=True,
+        publish_date__gte=now - timezone.timedelta(days=7)
+    ).count()
+
+    links = list(ImportantLink.objects.filter(is_active=True).order_by('ordering'))
+    menu_visibility = _get_menu_visibility()
+
+    return SiteChrome(
+        version=version,
+        college_info=CollegeInfo.objects.filter(is_active=True).first(),
+        navbar_info=navbar_info,
+        header_info=HeaderInfo.objects.filter(is_active=True).first(),
+        cms_menus=_build_menu_tree(),
+        important_links=tuple(link for link in links if link.type == 'important'),
+        quick_links=tuple(link for link in links if link.type == 'quick'),
+        departments=tuple(Department.objects.filter(is_active=True).order_by('name')),
+        menu_visibility=menu_visibility,
+        menu_visibility_table=MenuVisibilityTable(
+            menu_visibility.compile_visibility() if menu_visibility else None
+        ),
+        menu_categories=_get_menu_categories(),
+        recent_notices_count=recent_notices_count,
+        navbar_css_vars=tuple(build_navbar_css_vars(navbar_info).items()),
+        built_at=now,
+    )
+
+
+def _get_navbar_info():
+    """Get the active navbar configuration, creating the default one if none exists"""
+    navbar_info = NavbarInfo.objects.filter(is_active=True).first()
+    if not navbar_info:
+        navbar_info = NavbarInfo.objects.create(
+            brand_name="Chaitanya Science and Arts College",
+            brand_subtitle="Shaheed Nandkumar Patel Vishwavidyalaya, Raigarh",
+            is_active=True
+        )
+    return navbar_info
+
+
+def _build_menu_tree():
+    """Load active CMS menus and attach their top-level items and children"""
+    menus = list(Menu.objects.filter(is_active=True).order_by('ordering', 'title'))
+    items = MenuItem.objects.filter(
+        is_active=True, menu__in=menus
+    ).select_related('page').order_by('ordering', 'title')
+
+    items_by_menu = {menu.pk: [] for menu in menus}
+    for item in items:
+        items_by_menu[item.menu_id].append(item)
+
+    for menu in menus:
+        menu.active_items_cache = items_by_menu[menu.pk]
+        MenuItem.attach_children(menu.active_items_cache)
+        menu.top_level_items = [item for item in menu.active_items_cache if item.parent_id is None]
+
+    return tuple(menus)
+
+
+def _get_menu_visibility():
+    """Get the current menu visibility settings"""
+    try:
+        return MenuVisibilitySettings.get_current_settings()
+    except Exception:
+        # Fallback if the table doesn't exist yet (during migrations)
+        logger.exception('Could not load menu visibility settings')
+        return None
+
+
+def _get_menu_categories():
+    """Get active menu categories with their active submenus attached"""
+    try:
+        categories = list(MenuCategory.objects.filter(is_active=True).order_by('order'))
+        submenus_by_category = {category.pk: [] for category in categories}
+        for submenu in MenuSubmenu.objects.filter(category__in=categories, is_active=True).order_by('order'):
+            submenus_by_category[submenu.category_id].append(submenu)
+        for category in categories:
+            category.active_submenus = submenus_by_category[category.pk]
+        return tuple(categories)
+    except Exception:
+        logger.exception('Could not load menu categories')
+        return ()
+
+
+def get_menu_visibility_table():
+    """Get the compiled menu visibility lookup for the current settings version"""
+    return get_site_chrome().menu_visibility_table
+
+
+def build_navbar_css_vars(navbar_config):
+    """Convert navbar config to CSS custom properties"""
+    return {
+        '--navbar-height': f'{navbar_config.navbar_height}px',
+        '--navbar-padding-top': f'{navbar_config.navbar_padding_top}rem',
+        '--navbar-padding-bottom': f'{navbar_config.navbar_padding_bottom}rem',
+        '--navbar-padding-horizontal': f'{navbar_config.navbar_padding_horizontal}rem',
+        '--menu-item-padding-vertical': f'{navbar_config.menu_item_padding_vertical}rem',
+        '--menu-item-padding-horizontal': f'{navbar_config.menu_item_padding_horizontal}rem',
+        '--menu-item-margin': f'{navbar_config.menu_item_margin}rem',
+        '--menu-item-gap': f'{navbar_config.menu_item_gap}rem',
+        '--menu-item-border-radius': f'{navbar_config.menu_item_border_radius}px',
+        '--brand-font-size': f'{navbar_config.brand_font_size}rem',
+        '--menu-font-size': f'{navbar_config.menu_font_size}rem',
+        '--menu-line-height': f'{navbar_config.menu_line_height}',
+        '--logo-height': f'{navbar_config.logo_height}px',
+        '--mobile-breakpoint': f'{navbar_config.mobile_breakpoint}px',
+        '--tablet-breakpoint': f'{navbar_config.tablet_breakpoint}px',
+        '--mobile-navbar-height': f'{navbar_config.mobile_navbar_height}px',
+        '--mobile-padding-horizontal': f'{navbar_config.mobile_padding_horizontal}rem',
+        '--mobile-menu-font-size': f'{navbar_config.mobile_menu_font_size}rem',
+        '--mobile-brand-font-size': f'{navbar_config.mobile_brand_font_size}rem',
+        '--mobile-logo-height': f'{navbar_config.mobile_logo_height}px',
+        '--dropdown-padding': f'{navbar_config.dropdown_padding}rem',
+        '--dropdown-item-padding-vertical': f'{navbar_config.dropdown_item_padding_vertical}rem',
+        '--dropdown-item-padding-horizontal': f'{navbar_config.dropdown_item_padding_horizontal}rem',
+        '--dropdown-item-font-size': f'{navbar_config.dropdown_item_font_size}rem',
+        '--dropdown-item-margin': f'{navbar_config.dropdown_item_margin}rem',
+        '--mega-menu-padding': f'{navbar_config.mega_menu_padding}rem',
+        '--mega-menu-columns': f'{navbar_config.mega_menu_columns}',
+        '--mega-menu-width': navbar_config.mega_menu_width,
+        '--transition-duration': f'{navbar_config.transition_duration}s',
+        '--hover-scale': f'{navbar_config.hover_scale}',
+        '--box-shadow': navbar_config.box_shadow,
+        '--border-radius': f'{navbar_config.border_radius}px',
+        '--navbar-background-color': navbar_config.navbar_background_color,
+        '--navbar-text-color': navbar_config.navbar_text_color,
+        '--navbar-hover-color': navbar_config.navbar_hover_color,
+        '--navbar-border-color': navbar_config.navbar_border_color,
+    }
+
+
+def get_navbar_stylesheet(navbar_config=None):
+    """
+    Get (digest, css) for the navbar CSS variables stylesheet.
+
+    The stylesheet is regenerated only when the active NavbarInfo changes; the
+    digest is a hash of its content and goes into the stylesheet URL.
+    """
+    if navbar_config is None:
+        navbar_config = get_navbar_config()
+    if navbar_config is None:
+        return None, ''
+
+    stamp = navbar_config.updated_at.timestamp() if navbar_config.updated_at else 0
+    key = NAVBAR_STYLESHEET_KEY.format(pk=navbar_config.pk, stamp=stamp)
+    stylesheet = cache.get(key)
+    if stylesheet is None:
+        properties = ''.join(
+            f'    {name}: {value};\n' for name, value in build_navbar_css_vars(navbar_config).items()
+        )
+        css = f':root {{\n{properties}}}\n'
+        digest = hashlib.sha256(css.encode('utf-8')).hexdigest()[:16]
+        stylesheet = (digest, css)
+        cache.set(key, stylesheet, timeout=None)
+    return stylesheet
@@ -1,46 +1,249 @@
-from django.contrib.sitemaps import Sitemap
-from .models import Notice, Event, Program, Page
+"""
+Sitemap index and per-section sitemaps
+
+/sitemap.xml is an index of one sitemap per section, each paginated at
+Sitemap.limit URLs. Sections read plain values_list rows (lastmod first,
+then the URL arguments) and fill a URL pattern reversed once per request, so
+no model instance is built and no reverse() runs per row.
+
+Every section has a version: the latest updated_at and the row count of its
+queryset, plus the latest updated_at of any model its URLs also depend on
+(a faculty URL contains the department slug). Rendered sitemaps are cached
+under the versions they were built from, so an edit, a new row or a
+deletion shows up on the next request without any signal handling. The
+same aggregate gives the index its lastmod and the paginator its count.
+"""
+
+import hashlib
+
+from django.contrib.sitemaps import Sitemap, views as sitemap_views
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.utils.functional import cached_property
+
+from .models import (
+    Department, Event, Faculty, Gallery, IQACReport, Notice, Page, Program,
+    Publication, QuestionPaper,
+)
+from .page_cache import UNCACHED_HEADERS
+
+SITEMAP_KEY = 'sitemap:{digest}'
+SITEMAP_TIMEOUT = 60 * 60 * 24
+
+# Name of the section view, which the index reverses
+SECTION_URL_NAME = 'sitemap_section'
+
+
+class ValuesSitemap(Sitemap):
+    """Sitemap over (updated_at, *url kwargs) rows of the active queryset"""
+    limit = 2000
+    model = None
+    url_name = None
+    # url kwarg -> field lookup
+    url_kwargs = {'slug': 'slug'}
+    # Models whose changes can move these URLs
+    depends_on = ()
+
+    def get_queryset(self):
+        return self.model._default_manager.filter(is_active=True)
 
-
-class NoticeSitemap(Sitemap):
+    def items(self):
+        return self.get_queryset().order_by('pk').values_list('updated_at', *self.url_kwargs.values())
+
+    @cached_property
+    def url_pattern(self):
+        """The URL with a positional {} field for each url kwarg"""
+        placeholders = {kwarg: f'urlkwarg{index}' for index, kwarg in enumerate(self.url_kwargs)}
+        path = reverse(self.url_name, kwargs=placeholders)
+        path = path.replace('{', '{{').replace('}', '}}')
+        for index, placeholder in enumerate(placeholders.values()):
+            path = path.replace(placeholder, f'{{{index}}}')
+        return path
+
+    def location(self, item):
+        return self.url_pattern.format(*item[1:])
+
+    def lastmod(self, item):
+        return item[0]
+
+    def version_aggregate(self):
+        return self.get_queryset().aggregate(lastmod=Max('updated_at'), count=Count('pk'))
+
+    @cached_property
+    def version(self):
+        """(latest updated_at, number of items, *latest updated_at of depends_on)"""
+        aggregate = self.version_aggregate()
+        dependencies = tuple(
+            model._default_manager.aggregate(lastmod=Max('updated_at'))['lastmod']
+            for model in self.depends_on
+        )
+        return (aggregate['lastmod'], aggregate['count'], *dependencies)
+
+    def get_latest_lastmod(self):
+        return self.version[0]
+
+    @cached_property
+    def paginator(self):
+        paginator = super().paginator
+        # Saves the COUNT query; the version already has it
+        paginator.__dict__['count'] = self.version[1]
+        return paginator
+
+
+class NoticeSitemap(ValuesSitemap):
     changefreq = "weekly"
     priority = 0.8
+    model = Notice
+    url_name = 'college_website:notice_detail'
 
-    def items(self):
-        return Notice.objects.filter(is_active=True)
-
-    def lastmod(self, obj):
-        return obj.updated_at
 
-
-class EventSitemap(Sitemap):
+class EventSitemap(ValuesSitemap):
     changefreq = "weekly"
     priority = 0.7
+    model = Event
+    url_name = 'college_website:event_detail'
 
-    def items(self):
-        return Event.objects.filter(is_active=True)
 
-    def lastmod(self, obj):
-        return obj.updated_at
+class ProgramSitemap(ValuesSitemap):
+    changefreq = "monthly"
+    priority = 0.9
+    model = Program
+    url_name = 'college_website:program_detail'
 
 
-class ProgramSitemap(Sitemap):
+class PageSitemap(ValuesSitemap):
     changefreq = "monthly"
-    priority = 0.9
+    priority = 0.6
+    model = Page
+    url_name = 'college_website:page_detail'
 
-    def items(self):
-        return Program.objects.filter(is_active=True)
 
-    def lastmod(self, obj):
-        return obj.updated_at
+class DepartmentSitemap(ValuesSitemap):
+    changefreq = "monthly"
+    priority = 0.8
+    model = Department
+    url_name = 'college_website:department_detail'
 
 
-class PageSitemap(Sitemap):
+class FacultySitemap(ValuesSitemap):
     changefreq = "monthly"
     priority = 0.6
+    model = Faculty
+    url_name = 'college_website:faculty_detail'
+    url_kwargs = {'dept_slug': 'department__slug', 'slug': 'slug'}
+    depends_on = (Department,)
+
+    def get_queryset(self):
+        return Faculty.objects.filter(is_active=True, show_on_website=True)
+
+
+class GallerySitemap(ValuesSitemap):
+    changefreq = "weekly"
+    priority = 0.5
+    model = Gallery
+    url_name = 'college_website:gallery_detail'
+
+
+class QuestionPaperSitemap(ValuesSitemap):
+    changefreq = "yearly"
+    priority = 0.5
+    model = QuestionPaper
+    url_name = 'college_website:question_paper_detail'
+
+
+class IQACReportSitemap(ValuesSitemap):
+    """Reports are downloads, not pages; list the reports page, dated by the latest report"""
+    changefreq = "yearly"
+    priority = 0.4
+    model = IQACReport
+
+    def get_queryset(self):
+        return IQACReport.objects.filter(is_published=True)
 
     def items(self):
-        return Page.objects.filter(is_active=True)
+        lastmod, count = self.version[:2]
+        return [(lastmod,)] if count else []
+
+    @cached_property
+    def url_pattern(self):
+        return reverse('college_website:iqac_reports')
+
+    def version_aggregate(self):
+        aggregate = self.get_queryset().aggregate(lastmod=Max('updated_at'), reports=Count('pk'))
+        return {'lastmod': aggregate['lastmod'], 'count': min(1, aggregate['reports'])}
+
 
-    def lastmod(self, obj):
-        return obj.updated_at
+class PublicationSitemap(ValuesSitemap):
+    """Publications have no pages of their own; list the per-department listings"""
+    changefreq = "monthly"
+    priority = 0.5
+    model = Publication
+
+    def items(self):
+        return (
+            self.get_queryset().order_by('department').values('department')
+            .annotate(lastmod=Max('updated_at')).values_list('lastmod', 'department')
+        )
+
+    @cached_property
+    def url_pattern(self):
+        return reverse('college_website:publications') + '?department={0}'
+
+    def version_aggregate(self):
+        return self.get_queryset().aggregate(lastmod=Max('updated_at'), count=Count('department', distinct=True))
+
+
+SITEMAPS = {
+    'pages': PageSitemap,
+    'programs': ProgramSitemap,
+    'departments': DepartmentSitemap,
+    'faculty': FacultySitemap,
+    'notices': NoticeSitemap,
+    'events': EventSitemap,
+    'galleries': GallerySitemap,
+    'publications': PublicationSitemap,
+    'question-papers': QuestionPaperSitemap,
+    'iqac-reports': IQACReportSitemap,
+}
+
+
+def _cached_sitemap(request, parts, render):
+    """Serve a rendered sitemap stored under parts, rendering it on a miss"""
+    digest = hashlib.md5(repr((request.scheme, request.get_host(), *parts)).encode()).hexdigest()
+    key = SITEMAP_KEY.format(digest=digest)
+    stored = cache.get(key)
+    if stored is None:
+        response = render()
+        response.render()
+        if response.status_code != 200:
+            return response
+        headers = [(name, value) for name, value in response.items() if name.lower() not in UNCACHED_HEADERS]
+        stored = (response.content, headers)
+        cache.set(key, stored, SITEMAP_TIMEOUT)
+    content, headers = stored
+    response = HttpResponse(content)
+    for name, value in headers:
+        response[name] = value
+    return response
+
+
+def sitemap_index_view(request):
+    sites = {section: sitemap() for section, sitemap in SITEMAPS.items()}
+    versions = [(section, site.version) for section, site in sites.items()]
+    return _cached_sitemap(
+        request, ('index', versions),
+        lambda: sitemap_views.index(request, sites, sitemap_url_name=SECTION_URL_NAME),
+    )
+
+
+def sitemap_section_view(request, section):
+    if section not in SITEMAPS:
+        raise Http404(f"No sitemap available for section: {section!r}")
+    site = SITEMAPS[section]()
+    page = request.GET.get('p', '1')
+    return _cached_sitemap(
+        request, (section, page, site.version),
+        lambda: sitemap_views.sitemap(request, {section: site}, section=section),
+    )
@@ -0,0 +1,61 @@
+from django import template
+from django.template.base import FilterExpression
+
+from ..fragment_cache import cached_fragment, resolve_model
+
+register = template.Library()
+
+
+class VersionedCacheNode(template.Node):
+    def __init__(self, nodelist, fragment_name, model_list, vary_on):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+        self.model_list = model_list
+        self.vary_on = vary_on
+
+    def render(self, context):
+        vary_on = [expression.resolve(context) for expression in self.vary_on]
+        return cached_fragment(
+            self.fragment_name,
+            self.model_list,
+            lambda: self.nodelist.render(context),
+            vary_on=vary_on,
+        )
+
+
+@register.tag('cache_versioned')
+def do_cache_versioned(parser, token):
+    """Cache a fragment until any of the listed models is saved or deleted
+
+    Usage: {% cache_versioned department_detail Department Faculty Program vary_on department.pk %}
+    Models are bare names from this app or app_label.Model. Values after
+    vary_on are resolved in the context and become part of the key.
+    """
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag requires a fragment name and at least one model."
+        )
+    fragment_name = bits[1].strip('"\'')
+    model_names, vary_on = bits[2:], []
+    if 'vary_on' in model_names:
+        position = model_names.index('vary_on')
+        model_names, vary_on = model_names[:position], model_names[position + 1:]
+
+    model_list = []
+    for model_name in model_names:
+        try:
+            model_list.append(resolve_model(model_name.strip('"\'')))
+        except (LookupError, ValueError):
+            raise template.TemplateSyntaxError(f"'{bits[0]}' tag got unknown model {model_name}.")
+    if not model_list:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires at least one model.")
+
+    nodelist = parser.parse(('endcache_versioned',))
+    parser.delete_first_token()
+    return VersionedCacheNode(
+        nodelist,
+        fragment_name,
+        model_list,
+        [FilterExpression(expression, parser) for expression in vary_on],
+    )
@@ -0,0 +1,51 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from ..images import DERIVATIVE_FORMATS, get_manifest
+
+register = template.Library()
+
+DEFAULT_SIZES = '100vw'
+
+
+@register.simple_tag
+def responsive_image(image, alt='', sizes=DEFAULT_SIZES, loading='lazy', **attrs):
+    """Render an ImageField as a <picture> with WebP/JPEG srcsets
+
+    Usage: {% responsive_image gallery.cover_image alt=gallery.title sizes="(max-width: 768px) 100vw, 33vw" class="card-img-top" %}
+    Extra keyword arguments become attributes of the <img>. Falls back to a
+    plain <img> of the original upload until derivatives exist; they are built
+    on save or by generate_image_derivatives, never here.
+    """
+    if not image:
+        return ''
+
+    img_attrs = {'alt': alt, 'loading': loading, 'decoding': 'async'}
+    img_attrs.update(attrs)
+
+    manifest = get_manifest(image.name, image.storage)
+    if manifest is None:
+        return format_html('<img src="{}"{}>', image.url, flatatt(img_attrs))
+
+    img_attrs.setdefault('width', manifest.width)
+    img_attrs.setdefault('height', manifest.height)
+
+    # The last format is the universally supported fallback used by <img>
+    *source_formats, (fallback_extension, _, fallback_type, _) = DERIVATIVE_FORMATS
+    sources = [
+        format_html(
+            '<source type="{}" srcset="{}" sizes="{}">',
+            mime_type, manifest.srcset(extension), sizes
+        )
+        for extension, _, mime_type, _ in source_formats
+    ]
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}"{}></picture>',
+        mark_safe(''.join(sources)),
+        manifest.fallback_url(fallback_extension),
+        manifest.srcset(fallback_extension),
+        sizes,
+        flatatt(img_attrs),
+    )
@@ -1,14 +1,69 @@
+import time
+
 from django import template
+from django.core.cache import cache
+from django.utils.html import format_html
 from django.utils.safestring import mark_safe
-from ..models import MenuVisibilitySettings, MenuCategory, MenuSubmenu
+from ..models import MenuCategory, MenuSubmenu
+from ..site_chrome import (
+    get_chrome_version, get_site_chrome, get_menu_visibility_table, CHROME_SNAPSHOT_TIMEOUT,
+)
 
 register = template.Library()
 
+# url_names the hybrid navbar highlights as active (see includes/hybrid_navbar.html);
+# every other page shares the same pre-rendered fragment.
+NAVBAR_ACTIVE_SECTIONS = frozenset({'home', 'about', 'notices_list', 'gallery', 'contact'})
+
+NAVBAR_FRAGMENT_KEY = 'hybrid_navbar_fragment:{version}:{section}'
+MENU_CATEGORY_FRAGMENT_KEY = 'menu_category_fragment:{version}:{pk}:{current}'
+
+# Fragments follow the site chrome version; the timeout only bounds how long
+# the "recent notices" badge inside the navbar can lag behind.
+FRAGMENT_TIMEOUT = CHROME_SNAPSHOT_TIMEOUT
+
+# Process-local copies of rendered fragments: {key: (built_at, html)}. The
+# shared cache stores the same pair, so a copy taken from it expires when the
+# fragment is FRAGMENT_TIMEOUT old, not FRAGMENT_TIMEOUT after it was copied.
+_local_fragments = {}
+
+
+def _get_fragment(key, render):
+    """Get a rendered fragment from the local dict, the shared cache, or by rendering it"""
+    now = time.time()
+    entry = _local_fragments.get(key)
+    if entry is not None and entry[0] + FRAGMENT_TIMEOUT > now:
+        return entry[1]
+
+    entry = cache.get(key)
+    if entry is None:
+        entry = (now, render())
+        cache.set(key, entry, timeout=FRAGMENT_TIMEOUT)
+
+    if len(_local_fragments) > 256:
+        # Old chrome versions are never looked up again
+        _local_fragments.clear()
+    _local_fragments[key] = entry
+    return entry[1]
+
+
+@register.simple_tag(takes_context=True)
+def hybrid_navbar(context):
+    """Render includes/hybrid_navbar.html once per (site chrome version, active section)"""
+    request = context.get('request')
+    resolver_match = getattr(request, 'resolver_match', None)
+    url_name = resolver_match.url_name if resolver_match else None
+    section = url_name if url_name in NAVBAR_ACTIVE_SECTIONS else ''
+
+    key = NAVBAR_FRAGMENT_KEY.format(version=get_chrome_version(), section=section)
+    template_obj = context.template.engine.get_template('includes/hybrid_navbar.html')
+    return mark_safe(_get_fragment(key, lambda: template_obj.render(context)))
+
 
 @register.simple_tag
 def get_menu_visibility():
     """Get current menu visibility settings"""
-    return MenuVisibilitySettings.get_current_settings()
+    return get_site_chrome().menu_visibility
 
 
 @register.simple_tag
@@ -22,50 +77,32 @@ def get_active_menus():
 @register.simple_tag
 def is_menu_visible(menu_name):
     """Check if a specific menu is visible based on settings"""
-    settings = MenuVisibilitySettings.get_current_settings()
-    if not settings:
-        return True  # Default to visible if no settings
-    
-    # Map menu names to settings fields
-    menu_mapping = {
-        'research': 'show_research_menu',
-        'placement': 'show_placement_menu',
-        'alumni': 'show_alumni_menu',
-        'events': 'show_events_menu',
-        'exam_timetable': 'show_exam_timetable',
-        'exam_revaluation': 'show_exam_revaluation',
-        'exam_question_papers': 'show_exam_question_papers',
-        'exam_rules': 'show_exam_rules',
-        'student_portal': 'show_student_portal',
-        'sports_cultural': 'show_sports_cultural',
-        'nss_ncc': 'show_nss_ncc',
-        'research_centers': 'show_research_centers',
-        'publications': 'show_publications',
-        'patents_projects': 'show_patents_projects',
-    }
-    
-    setting_field = menu_mapping.get(menu_name.lower())
-    if setting_field:
-        return getattr(settings, setting_field, True)
-    
-    return True  # Default to visible
+    return get_menu_visibility_table().is_visible(menu_name)
+
+
+def _render_menu_item_html(menu_item, is_active=False):
+    """HTML for a single menu item"""
+    return format_html(
+        '''
+    <a class="dropdown-item tw-transition-all tw-duration-200 {}" 
+       href="{}" 
+       style="color: {};">
+        <i class="{} me-3 tw-text-blue-500 tw-w-4"></i>
+        {}
+    </a>
+    ''',
+        'active' if is_active else '',
+        menu_item.url,
+        menu_item.text_color,
+        menu_item.icon_class,
+        menu_item.name,
+    )
 
 
 @register.simple_tag
 def render_menu_item(menu_item, is_active=False):
     """Render a single menu item with proper styling"""
-    active_class = 'active' if is_active else ''
-    
-    html = f'''
-    <a class="dropdown-item tw-transition-all tw-duration-200 {active_class}" 
-       href="{menu_item.url}" 
-       style="color: {menu_item.text_color};">
-        <i class="{menu_item.icon_class} me-3 tw-text-blue-500 tw-w-4"></i>
-        {menu_item.name}
-    </a>
-    '''
-    
-    return mark_safe(html)
+    return _render_menu_item_html(menu_item, is_active)
 
 
 @register.simple_tag
@@ -77,42 +114,60 @@ def render_menu_category(category, current_url=''):
     # Check if current page matches this category
     is_current = current_url.startswith(category.slug) if category.slug != 'home' else current_url == '/'
     
-    html = f'''
-    <li class="nav-item dropdown">
-        <a class="nav-link dropdown-toggle {"active" if is_current else ""}" 
-           href="#" role="button" data-bs-toggle="dropdown" 
-           aria-expanded="false" id="{category.slug}Dropdown"
-           style="color: {category.text_color};">
-            <i class="{category.icon_class} me-2 tw-text-sm"></i>{category.name}
-        </a>
-        <ul class="dropdown-menu tw-animate-pulse">
-    '''
+    key = MENU_CATEGORY_FRAGMENT_KEY.format(version=get_chrome_version(), pk=category.pk, current=int(is_current))
+    return mark_safe(_get_fragment(key, lambda: _render_menu_category_html(category, is_current)))
+
+
+def _render_menu_category_html(category, is_current):
+    """Build the dropdown HTML for a menu category"""
+    # Use the submenus attached by the site chrome snapshot when available
+    submenus = getattr(category, 'active_submenus', None)
+    if submenus is None:
+        submenus = category.submenus.filter(is_active=True).order_by('order')
     
     # Group submenus by group_header
     submenus_by_group = {}
-    for submenu in category.submenus.filter(is_active=True).order_by('order'):
+    for submenu in submenus:
         group = submenu.group_header or 'General'
         if group not in submenus_by_group:
             submenus_by_group[group] = []
         submenus_by_group[group].append(submenu)
     
+    parts = [format_html(
+        '''
+    <li class="nav-item dropdown">
+        <a class="nav-link dropdown-toggle {}" 
+           href="#" role="button" data-bs-toggle="dropdown" 
+           aria-expanded="false" id="{}Dropdown"
+           style="color: {};">
+            <i class="{} me-2 tw-text-sm"></i>{}
+        </a>
+        <ul class="dropdown-menu tw-animate-pulse">
+    ''',
+        'active' if is_current else '',
+        category.slug,
+        category.text_color,
+        category.icon_class,
+        category.name,
+    )]
+    
     # Render submenus by group
-    for group_name, submenus in submenus_by_group.items():
+    for group_name, group_submenus in submenus_by_group.items():
         if group_name != 'General':
-            html += f'<li><h6 class="dropdown-header tw-text-red-600 tw-font-bold">{group_name}</h6></li>'
+            parts.append(format_html('<li><h6 class="dropdown-header tw-text-red-600 tw-font-bold">{}</h6></li>', group_name))
         
-        for submenu in submenus:
-            html += render_menu_item(submenu)
+        for submenu in group_submenus:
+            parts.append(_render_menu_item_html(submenu))
             
             if submenu.show_divider:
-                html += '<li><hr class="dropdown-divider tw-border-gray-200"></li>'
+                parts.append('<li><hr class="dropdown-divider tw-border-gray-200"></li>')
     
-    html += '''
+    parts.append('''
         </ul>
     </li>
-    '''
+    ''')
     
-    return mark_safe(html)
+    return ''.join(parts)
 
 
 @register.filter
@@ -121,12 +176,9 @@ def filter_visible_menus(menus, visibility_settings):
     if not visibility_settings:
         return menus
     
-    visible_menus = []
-    for menu in menus:
-        if is_menu_visible(menu.slug):
-            visible_menus.append(menu)
-    
-    return visible_menus
+    # One lookup table for the whole list instead of a settings query per menu
+    visibility = get_menu_visibility_table()
+    return [menu for menu in menus if visibility.is_visible(menu.slug)]
 
 
 @register.simple_tag
@@ -1,116 +1,104 @@
 from django import template
+from django.urls import reverse
 from django.utils.safestring import mark_safe
-from ..models import NavbarInfo
+from ..site_chrome import get_navbar_config, get_navbar_memo_stats, get_navbar_stylesheet
 
 register = template.Library()
 
-@register.simple_tag
-def navbar_css_vars():
+
+def _navbar_config(context):
+    """Active navbar config, shared by every tag (and navbar_config_context) within a request"""
+    return get_navbar_config(context.get('request'))
+
+
+@register.simple_tag(takes_context=True)
+def navbar_css_vars(context):
     """Generate CSS custom properties for navbar configuration"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     
     if not navbar_config:
         return ""
     
-    css_vars = f"""
-    :root {{
-        --navbar-height: {navbar_config.navbar_height}px;
-        --navbar-padding-top: {navbar_config.navbar_padding_top}rem;
-        --navbar-padding-bottom: {navbar_config.navbar_padding_bottom}rem;
-        --navbar-padding-horizontal: {navbar_config.navbar_padding_horizontal}rem;
-        --menu-item-padding-vertical: {navbar_config.menu_item_padding_vertical}rem;
-        --menu-item-padding-horizontal: {navbar_config.menu_item_padding_horizontal}rem;
-        --menu-item-margin: {navbar_config.menu_item_margin}rem;
-        --menu-item-gap: {navbar_config.menu_item_gap}rem;
-        --menu-item-border-radius: {navbar_config.menu_item_border_radius}px;
-        --brand-font-size: {navbar_config.brand_font_size}rem;
-        --menu-font-size: {navbar_config.menu_font_size}rem;
-        --menu-line-height: {navbar_config.menu_line_height};
-        --logo-height: {navbar_config.logo_height}px;
-        --mobile-breakpoint: {navbar_config.mobile_breakpoint}px;
-        --tablet-breakpoint: {navbar_config.tablet_breakpoint}px;
-        --mobile-navbar-height: {navbar_config.mobile_navbar_height}px;
-        --mobile-padding-horizontal: {navbar_config.mobile_padding_horizontal}rem;
-        --mobile-menu-font-size: {navbar_config.mobile_menu_font_size}rem;
-        --mobile-brand-font-size: {navbar_config.mobile_brand_font_size}rem;
-        --mobile-logo-height: {navbar_config.mobile_logo_height}px;
-        --dropdown-padding: {navbar_config.dropdown_padding}rem;
-        --dropdown-item-padding-vertical: {navbar_config.dropdown_item_padding_vertical}rem;
-        --dropdown-item-padding-horizontal: {navbar_config.dropdown_item_padding_horizontal}rem;
-        --dropdown-item-font-size: {navbar_config.dropdown_item_font_size}rem;
-        --dropdown-item-margin: {navbar_config.dropdown_item_margin}rem;
-        --mega-menu-padding: {navbar_config.mega_menu_padding}rem;
-        --mega-menu-columns: {navbar_config.mega_menu_columns};
-        --mega-menu-width: {navbar_config.mega_menu_width};
-        --transition-duration: {navbar_config.transition_duration}s;
-        --hover-scale: {navbar_config.hover_scale};
-        --box-shadow: {navbar_config.box_shadow};
-        --border-radius: {navbar_config.border_radius}px;
-        --navbar-background-color: {navbar_config.navbar_background_color};
-        --navbar-text-color: {navbar_config.navbar_text_color};
-        --navbar-hover-color: {navbar_config.navbar_hover_color};
-        --navbar-border-color: {navbar_config.navbar_border_color};
-    }}
-    """
-    
+    digest, css_vars = get_navbar_stylesheet(navbar_config)
     return mark_safe(css_vars)
 
-@register.simple_tag
-def navbar_config_value(field_name):
+
+@register.simple_tag(takes_context=True)
+def navbar_stylesheet_url(context):
+    """URL of the versioned navbar CSS variables stylesheet"""
+    navbar_config = _navbar_config(context)
+    
+    if not navbar_config:
+        return ""
+    
+    digest, css_vars = get_navbar_stylesheet(navbar_config)
+    return reverse('college_website:navbar_stylesheet', kwargs={'digest': digest})
+
+@register.simple_tag(takes_context=True)
+def navbar_config_value(context, field_name):
     """Get a specific navbar configuration value"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     
     if not navbar_config:
         return ""
     
     return getattr(navbar_config, field_name, "")
 
-@register.simple_tag
-def navbar_brand_name():
+@register.simple_tag(takes_context=True)
+def navbar_brand_name(context):
     """Get the navbar brand name"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     return navbar_config.brand_name if navbar_config else "College"
 
-@register.simple_tag
-def navbar_brand_subtitle():
+@register.simple_tag(takes_context=True)
+def navbar_brand_subtitle(context):
     """Get the navbar brand subtitle"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     return navbar_config.brand_subtitle if navbar_config else ""
 
-@register.simple_tag
-def navbar_logo():
+@register.simple_tag(takes_context=True)
+def navbar_logo(context):
     """Get the navbar logo URL"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     if navbar_config and navbar_config.logo:
         return navbar_config.logo.url
     return ""
 
-@register.simple_tag
-def navbar_show_logo():
+@register.simple_tag(takes_context=True)
+def navbar_show_logo(context):
     """Check if logo should be shown"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     return navbar_config.show_logo if navbar_config else True
 
-@register.simple_tag
-def navbar_show_brand_text():
+@register.simple_tag(takes_context=True)
+def navbar_show_brand_text(context):
     """Check if brand text should be shown"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     return navbar_config.show_brand_text if navbar_config else True
 
-@register.simple_tag
-def navbar_is_sticky():
+@register.simple_tag(takes_context=True)
+def navbar_is_sticky(context):
     """Check if navbar should be sticky"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     return navbar_config.is_sticky if navbar_config else False
 
-@register.simple_tag
-def navbar_enable_search():
+@register.simple_tag(takes_context=True)
+def navbar_enable_search(context):
     """Check if search should be enabled"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     return navbar_config.enable_search if navbar_config else True
 
-@register.simple_tag
-def navbar_search_placeholder():
+@register.simple_tag(takes_context=True)
+def navbar_search_placeholder(context):
     """Get the search placeholder text"""
-    navbar_config = NavbarInfo.objects.filter(is_active=True).first()
+    navbar_config = _navbar_config(context)
     return navbar_config.search_placeholder if navbar_config else "Search..."
+
+@register.simple_tag(takes_context=True)
+def navbar_memo_debug(context):
+    """Debug summary of how many navbar config lookups were served from the request memo"""
+    request = context.get('request')
+    if request is None:
+        return ""
+    lookups, hits = get_navbar_memo_stats(request)
+    return f"navbar config lookups: {lookups}, served from memo: {hits}"
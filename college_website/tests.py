@@ -1,3 +1,628 @@
-from django.test import TestCase
+import datetime
+import decimal
+import json
+import os
+import re
+import tempfile
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-# Create your tests here.
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib import messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import connection, models, transaction
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.template import TemplateDoesNotExist
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, reverse
+from django.utils import timezone
+
+from . import urls as app_urls
+from .cache_backends import SQLiteCache
+from .counters import flush_counters
+from .downloads import parse_range, serve_file
+from .load_dataset import _placeholder_image, _placeholder_pdf, _rng
+from .models import Menu, MenuItem, Notice, QuestionPaper
+from .page_cache import cache_anonymous_page
+
+# Committed per-URL query budgets at LARGE_SCALE for each audience, plus the URLs
+# whose view renders a template that does not exist yet (to be written, then
+# removed from the list); regenerate with UPDATE_QUERY_BUDGETS=1
+QUERY_BUDGETS_PATH = Path(__file__).with_name('query_budgets.json')
+
+# Rows per model in the two seeded datasets
+SMALL_SCALE = 3
+LARGE_SCALE = 12
+
+# Objects that parameterised URLs are reversed against:
+# url name -> (model name, {url kwarg: field lookup})
+URL_OBJECTS = {
+    'faculty_detail': ('Faculty', {'dept_slug': 'department__slug', 'slug': 'slug'}),
+    'staff_detail': ('NonAcademicStaff', {'dept_slug': 'department__slug', 'slug': 'slug'}),
+    'department_detail': ('Department', {'slug': 'slug'}),
+    'academic_calendar_pdf': ('AcademicCalendar', {'year': 'academic_year'}),
+    'academics_library_detail': ('LibraryResource', {'slug': 'slug'}),
+    'library_detail': ('LibraryResource', {'slug': 'slug'}),
+    'admission_detail': ('AdmissionInfo', {'slug': 'slug'}),
+    'question_paper_detail': ('QuestionPaper', {'slug': 'slug'}),
+    'question_paper_download': ('QuestionPaper', {'slug': 'slug'}),
+    'question_paper_update': ('QuestionPaper', {'slug': 'slug'}),
+    'question_paper_quick_edit': ('QuestionPaper', {'slug': 'slug'}),
+    'question_paper_delete': ('QuestionPaper', {'slug': 'slug'}),
+    'question_paper_toggle_status': ('QuestionPaper', {'slug': 'slug'}),
+    'question_paper_toggle_featured': ('QuestionPaper', {'slug': 'slug'}),
+    'result_detail': ('ExamResult', {'slug': 'slug'}),
+    'exam_timetable_edit': ('ExamTimetable', {'timetable_id': 'pk'}),
+    'exam_timetable_week_manage': ('ExamTimetable', {'timetable_id': 'pk'}),
+    'exam_timetable_exam_manage': ('ExamTimetableWeek', {'week_id': 'pk'}),
+    'alumni_detail': ('AlumniProfile', {'slug': 'slug'}),
+    'alumni_profile_detail': ('AlumniProfile', {'slug': 'slug'}),
+    'iqac_report_download': ('IQACReport', {'slug': 'slug'}),
+    'event_detail': ('Event', {'slug': 'slug'}),
+    'program_detail': ('Program', {'slug': 'slug'}),
+    'program_detail_public': ('Program', {'slug': 'slug'}),
+    'program_update': ('Program', {'slug': 'slug'}),
+    'program_quick_edit': ('Program', {'slug': 'slug'}),
+    'program_delete': ('Program', {'slug': 'slug'}),
+    'program_toggle_status': ('Program', {'slug': 'slug'}),
+    'program_toggle_featured': ('Program', {'slug': 'slug'}),
+    'notice_detail': ('Notice', {'slug': 'slug'}),
+    'notice_attachment': ('Notice', {'slug': 'slug'}),
+    'download_file': ('DownloadFile', {'pk': 'pk'}),
+    'social_initiative_detail': ('SocialInitiative', {'slug': 'slug'}),
+    'gallery_detail': ('Gallery', {'slug': 'slug'}),
+    'elearning_detail': ('ELearningCourse', {'slug': 'slug'}),
+    'page_detail': ('Page', {'slug': 'slug'}),
+}
+
+# Parameterised URLs whose arguments are not objects
+URL_KWARGS = {
+    'navbar_stylesheet': {'digest': 'current'},
+}
+
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SAVEPOINT_RE = re.compile(r'"s\d+_x\d+"')
+_IN_LIST_RE = re.compile(r'IN \((?:\?, )*\?\)')
+
+
+def _field_value(model, field, index):
+    """A valid value for a required field of the index-th seeded row"""
+    if field.choices:
+        choices = [value for value, _ in field.flatchoices]
+        return choices[index % len(choices)]
+    if isinstance(field, (models.ForeignKey, models.OneToOneField)):
+        related = field.related_model
+        if isinstance(field, models.OneToOneField):
+            return _create(related, index)
+        rows = list(related._default_manager.order_by('pk')[:LARGE_SCALE])
+        # Spread children over several parents so per-parent queries show up
+        return rows[index % len(rows)] if rows else _create(related, index)
+    name = f"{model.__name__} {index}"
+    if isinstance(field, models.SlugField):
+        return f"{model.__name__.lower()}-{index}"
+    if isinstance(field, models.EmailField):
+        return f"seed{index}@example.com"
+    if isinstance(field, models.URLField):
+        return f"https://example.com/{model.__name__.lower()}/{index}/"
+    if isinstance(field, models.FileField):
+        return _placeholder_file(field, f"seed/{model.__name__.lower()}-{index}")
+    if isinstance(field, (models.CharField, models.TextField)):
+        value = name if not field.unique else f"{name} {uuid.uuid4().hex[:8]}"
+        return value[:field.max_length] if field.max_length else value
+    if isinstance(field, models.BooleanField):
+        return True
+    if isinstance(field, models.DecimalField):
+        return decimal.Decimal(1)
+    if isinstance(field, models.FloatField):
+        return 1.0
+    if isinstance(field, (models.IntegerField, models.DurationField)):
+        return index + 1 if isinstance(field, models.IntegerField) else datetime.timedelta(hours=1)
+    if isinstance(field, models.DateTimeField):
+        return timezone.now() - datetime.timedelta(days=index)
+    if isinstance(field, models.DateField):
+        return timezone.localdate() - datetime.timedelta(days=index)
+    if isinstance(field, models.TimeField):
+        return datetime.time(9, 0)
+    if isinstance(field, models.UUIDField):
+        return uuid.uuid4()
+    if isinstance(field, models.JSONField):
+        return {}
+    return None
+
+
+_placeholder_content = {}
+
+
+def _placeholder_file(field, stem):
+    """Name of a real file in MEDIA_ROOT, an image for image fields and a PDF otherwise"""
+    kind = 'jpg' if isinstance(field, models.ImageField) else 'pdf'
+    name = f"{stem}.{kind}"
+    if not default_storage.exists(name):
+        if kind not in _placeholder_content:
+            _placeholder_content[kind] = _placeholder_image(_rng(0, 'tests')) if kind == 'jpg' else _placeholder_pdf(0)
+        default_storage.save(name, ContentFile(_placeholder_content[kind]))
+    return name
+
+
+def _build(model, index):
+    values = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key or getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            continue
+        required = not (field.has_default() or field.null or field.blank)
+        if required or field.unique or isinstance(field, models.SlugField):
+            value = _field_value(model, field, index)
+            if value is not None:
+                values[field.name] = value
+    return model(**values)
+
+
+def _create(model, index):
+    instance = _build(model, index)
+    instance.save()
+    return instance
+
+
+def seed_dataset(scale):
+    """Top up every model of the app to scale rows; returns "Model: error" for those that could not be seeded"""
+    failed = []
+    for model in apps.get_app_config('college_website').get_models():
+        if model._meta.proxy:
+            continue
+        existing = model._default_manager.count()
+        # A unique field with choices allows one row per choice
+        limit = min((len(field.flatchoices) for field in model._meta.concrete_fields if field.unique and field.choices), default=scale)
+        try:
+            with transaction.atomic():
+                instances = [_build(model, index) for index in range(existing, min(scale, limit))]
+                if model._meta.parents:
+                    for instance in instances:
+                        instance.save()
+                else:
+                    model._default_manager.bulk_create(instances)
+        except Exception as exc:
+            failed.append(f"{model.__name__}: {exc!r}")
+    return failed
+
+
+def iter_named_urls(patterns=None, converters=()):
+    """(url name, kwarg names) for every named URL of the app"""
+    for pattern in app_urls.urlpatterns if patterns is None else patterns:
+        names = (*converters, *pattern.pattern.converters)
+        if isinstance(pattern, URLResolver):
+            yield from iter_named_urls(pattern.url_patterns, names)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield pattern.name, names
+
+
+def _url_kwargs(name):
+    if name in URL_KWARGS:
+        return URL_KWARGS[name]
+    model_name, lookups = URL_OBJECTS[name]
+    model = apps.get_model('college_website', model_name)
+    row = model._default_manager.order_by('pk').values(*lookups.values()).first()
+    if row is None:
+        return None
+    return {kwarg: row[lookup] for kwarg, lookup in lookups.items()}
+
+
+def _fingerprint(sql):
+    """The statement with literals, IN lists and savepoint names folded"""
+    sql = _LITERAL_RE.sub('?', _SAVEPOINT_RE.sub('"savepoint"', sql))
+    return _IN_LIST_RE.sub('IN (...)', sql)
+
+
+def _grown(before, after):
+    """Statements run more often in after; ones first seen there are data-dependent, not per-row"""
+    return {sql: count for sql, count in after.items() if count > before[sql] > 0}
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    COUNTER_FLUSH_INTERVAL=3600,
+    PAGE_CACHE_TIMEOUT=1,
+)
+class QueryBudgetTests(TestCase):
+    """Every named URL runs a fixed number of queries, within its committed budget
+
+    The app is crawled anonymously and as staff against a small and a large
+    seeded dataset with a cold cache. A view whose query count grows with the
+    number of rows has an N+1 query; the statements it repeats more often are
+    listed in the failure.
+    """
+
+    AUDIENCES = ('anonymous', 'staff')
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Seeded file fields point at real files here
+        media_root = cls.enterClassContext(tempfile.TemporaryDirectory())
+        cls.enterClassContext(override_settings(MEDIA_ROOT=media_root))
+
+    def setUp(self):
+        self.staff = get_user_model().objects.create_user('budget-staff', is_staff=True)
+        # Server errors are reported with the other failures
+        self.client.raise_request_exception = False
+
+    def tearDown(self):
+        # View counts are buffered for an hour; write them while the test
+        # database still exists rather than from the atexit flush
+        flush_counters()
+
+    def crawl(self, audience):
+        self.client.logout()
+        if audience == 'staff':
+            self.client.force_login(self.staff)
+        results = {}
+        urls = dict(iter_named_urls())
+        for name, kwarg_names in sorted(urls.items()):
+            kwargs = _url_kwargs(name) if kwarg_names else {}
+            if kwargs is None:
+                results[name] = None
+                continue
+            path = reverse(f'college_website:{name}', kwargs=kwargs)
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(path)
+                if getattr(response, 'streaming', False):
+                    b''.join(response.streaming_content)
+            results[name] = {
+                'path': path,
+                'status': response.status_code,
+                'error': response.exc_info[1] if response.exc_info else None,
+                'statements': Counter(_fingerprint(query['sql']) for query in queries.captured_queries),
+            }
+        return results
+
+    def test_query_counts_do_not_grow_and_stay_within_budget(self):
+        for name, kwarg_names in iter_named_urls():
+            if kwarg_names:
+                self.assertTrue(
+                    name in URL_OBJECTS or name in URL_KWARGS,
+                    f"Add {name} to URL_OBJECTS or URL_KWARGS so its URL can be reversed",
+                )
+
+        self.assertFalse(seed_dataset(SMALL_SCALE), 'Models that could not be seeded')
+        small = {audience: self.crawl(audience) for audience in self.AUDIENCES}
+        self.assertFalse(seed_dataset(LARGE_SCALE), 'Models that could not be seeded')
+        large = {audience: self.crawl(audience) for audience in self.AUDIENCES}
+
+        counts = {
+            audience: {name: sum(result['statements'].values()) for name, result in results.items() if result is not None}
+            for audience, results in large.items()
+        }
+        missing = {
+            name
+            for results in large.values()
+            for name, result in results.items()
+            if result is not None and isinstance(result['error'], TemplateDoesNotExist)
+        }
+        if os.environ.get('UPDATE_QUERY_BUDGETS'):
+            QUERY_BUDGETS_PATH.write_text(json.dumps(
+                {'budgets': counts, 'missing_templates': sorted(missing)},
+                indent=2, sort_keys=True,
+            ) + '\n')
+        committed = json.loads(QUERY_BUDGETS_PATH.read_text())
+        missing_templates = set(committed['missing_templates'])
+
+        failures = []
+        for audience, results in large.items():
+            budgets = committed['budgets'].get(audience, {})
+            for name, result in sorted(results.items()):
+                label = f"{name} ({audience})"
+                if result is None:
+                    failures.append(f"{label}: no seeded object to reverse the URL with")
+                    continue
+                if result['status'] >= 500:
+                    if name not in missing_templates or not isinstance(result['error'], TemplateDoesNotExist):
+                        failures.append(f"{label} {result['path']}: status {result['status']} ({result['error']!r})")
+                    continue
+                before = small[audience][name]['statements'] if small[audience][name] else Counter()
+                grown = _grown(before, result['statements'])
+                count = counts[audience][name]
+                if grown:
+                    listing = '\n'.join(
+                        f"    {before[sql]} -> {n}: {sql}" for sql, n in sorted(grown.items(), key=lambda item: -item[1])
+                    )
+                    failures.append(
+                        f"{label} {result['path']}: {sum(before.values())} queries with {SMALL_SCALE} rows per model, "
+                        f"{count} with {LARGE_SCALE}\n{listing}"
+                    )
+                if name not in budgets:
+                    failures.append(f"{label}: no budget in {QUERY_BUDGETS_PATH.name} ({count} queries)")
+                elif count > budgets[name]:
+                    failures.append(f"{label} {result['path']}: {count} queries, budget {budgets[name]}")
+
+        self.assertFalse(failures, 'Query budget violations:\n' + '\n'.join(failures))
+
+
+class SQLiteCacheTests(SimpleTestCase):
+    """Two SQLiteCache instances on one file stand in for two workers"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.location = Path(directory.name) / 'cache.sqlite3'
+        self.first = self.worker()
+        self.second = self.worker()
+
+    def worker(self, **options):
+        options = {'L1_SYNC_INTERVAL': 0, **options}
+        return SQLiteCache(self.location, {'OPTIONS': options})
+
+    def test_add_is_atomic(self):
+        workers = [self.worker() for _ in range(8)]
+        with ThreadPoolExecutor(len(workers)) as pool:
+            added = list(pool.map(lambda worker: worker.add('lock', worker._origin), workers))
+        self.assertEqual(added.count(True), 1)
+        self.assertEqual(self.first.get('lock'), workers[added.index(True)]._origin)
+
+    def test_incr_is_atomic(self):
+        self.first.set('count', 0)
+        workers = [self.worker() for _ in range(4)]
+        with ThreadPoolExecutor(len(workers)) as pool:
+            list(pool.map(lambda worker: [worker.incr('count') for _ in range(25)], workers))
+        self.assertEqual(self.second.get('count'), 100)
+        with self.assertRaises(ValueError):
+            self.first.incr('missing')
+
+    def test_writes_reach_other_workers_lru(self):
+        self.first.set('key', 'old')
+        self.assertEqual(self.second.get('key'), 'old')
+        self.assertIn(self.second.make_key('key'), self.second._l1)
+
+        self.first.set('key', 'new')
+        self.assertEqual(self.second.get('key'), 'new')
+        self.first.delete('key')
+        self.assertIsNone(self.second.get('key'))
+        self.first.set('key', 'again')
+        self.assertEqual(self.second.get('key'), 'again')
+        self.first.clear()
+        self.assertIsNone(self.second.get('key'))
+
+    def test_pruned_log_clears_lru(self):
+        self.first.set('key', 'old')
+        self.assertEqual(self.second.get('key'), 'old')
+        self.first.set('key', 'new')
+        self.first.set('other', 'value')
+        # As if _maintain had pruned the entry for key before second synced
+        conn = self.first._connection()
+        conn.execute('DELETE FROM cache_invalidations WHERE seq < (SELECT MAX(seq) FROM cache_invalidations)')
+        self.assertEqual(self.second.get('key'), 'new')
+
+    def test_culled_keys_leave_other_workers_lru(self):
+        culling = self.worker(MAX_ENTRIES=2, CULL_FREQUENCY=2)
+        for key in ('a', 'b', 'c', 'd'):
+            culling.set(key, key)
+        self.assertEqual(self.second.get_many(['a', 'b', 'c', 'd']), {key: key for key in 'abcd'})
+        culling._maintain()
+        self.assertEqual(self.second.get_many(['a', 'b', 'c', 'd']), {'c': 'c', 'd': 'd'})
+
+        culling = self.worker(MAX_ENTRIES=1, CULL_FREQUENCY=0)
+        self.assertEqual(self.second.get_many(['c', 'd']), {'c': 'c', 'd': 'd'})
+        culling._maintain()
+        self.assertEqual(self.second.get_many(['c', 'd']), {})
+
+
+class ServeFileTests(SimpleTestCase):
+    """Validators, byte ranges and download counting in downloads.serve_file"""
+
+    content = b'0123456789'
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.storage = FileSystemStorage(location=directory.name)
+        self.storage.save('paper.pdf', ContentFile(self.content))
+        self.factory = RequestFactory()
+        self.downloads = 0
+
+    def serve(self, method='get', **headers):
+        request = getattr(self.factory, method)('/download/', headers=headers)
+        return serve_file(request, 'paper.pdf', self.storage, on_download=self.count)
+
+    def count(self):
+        self.downloads += 1
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range('bytes=2-5', 10), (2, 5))
+        self.assertEqual(parse_range('bytes=2-', 10), (2, 9))
+        self.assertEqual(parse_range('bytes=2-50', 10), (2, 9))
+        self.assertEqual(parse_range('bytes=-3', 10), (7, 9))
+        self.assertEqual(parse_range('bytes=-30', 10), (0, 9))
+        self.assertEqual(parse_range('bytes=10-', 10), 'unsatisfiable')
+        self.assertEqual(parse_range('bytes=-0', 10), 'unsatisfiable')
+        for ignored in ('bytes=5-2', 'bytes=-', 'bytes=0-1,4-5', 'items=0-1'):
+            self.assertIsNone(parse_range(ignored, 10), ignored)
+
+    def test_full_download(self):
+        response = self.serve()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('attachment', response['Content-Disposition'])
+        self.assertTrue(response['ETag'] and response['Last-Modified'])
+        self.assertEqual(self.downloads, 1)
+
+    def test_ranges(self):
+        response = self.serve(Range='bytes=2-5')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), b'2345')
+        self.assertEqual(response['Content-Range'], 'bytes 2-5/10')
+        self.assertEqual(response['Content-Length'], '4')
+
+        response = self.serve(Range='bytes=-3')
+        self.assertEqual(b''.join(response.streaming_content), b'789')
+        self.assertEqual(response['Content-Range'], 'bytes 7-9/10')
+
+        response = self.serve(Range='bytes=10-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */10')
+        # Resuming part way through is not a new download
+        self.assertEqual(self.downloads, 0)
+
+        self.serve(Range='bytes=0-3')
+        self.assertEqual(self.downloads, 1)
+
+    def test_if_range(self):
+        etag = self.serve(method='head')['ETag']
+        response = self.serve(Range='bytes=2-5', **{'If-Range': etag})
+        self.assertEqual(response.status_code, 206)
+        response = self.serve(Range='bytes=2-5', **{'If-Range': '"stale"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+
+    def test_conditional_requests(self):
+        response = self.serve()
+        etag, modified = response['ETag'], response['Last-Modified']
+        self.assertEqual(self.serve(**{'If-None-Match': etag}).status_code, 304)
+        self.assertEqual(self.serve(**{'If-Modified-Since': modified}).status_code, 304)
+        self.assertEqual(self.serve(**{'If-Match': '"stale"'}).status_code, 412)
+        self.assertEqual(self.serve(**{'If-Match': etag}).status_code, 200)
+        self.assertEqual(self.downloads, 2)
+
+    def test_only_get_is_counted(self):
+        self.assertEqual(self.serve(method='head').status_code, 200)
+        self.serve(method='post')
+        self.assertEqual(self.downloads, 0)
+
+    @override_settings(DOWNLOAD_OFFLOAD='x-accel-redirect', DOWNLOAD_ACCEL_REDIRECT_PREFIX='/protected/')
+    def test_offload(self):
+        response = self.serve(Range='bytes=2-5')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected/paper.pdf')
+        self.assertEqual(response.content, b'')
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class PageCacheTests(TestCase):
+    """When cache_anonymous_page serves a stored copy and when it renders"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.renders = 0
+        self.notice = Notice.objects.create(title='Exam schedule', content='Dates', category='exam')
+
+    def view(self, request, csrf=False, add_message=False):
+        self.renders += 1
+        if csrf:
+            get_token(request)
+        if add_message:
+            messages.info(request, 'Saved')
+        return HttpResponse(', '.join(Notice.objects.values_list('title', flat=True)))
+
+    def get(self, user=None, pending_message=False, **options):
+        request = self.factory.get('/notices/')
+        request.user = user or AnonymousUser()
+        request._messages = CookieStorage(request)
+        if pending_message:
+            messages.info(request, 'Welcome back')
+        return cache_anonymous_page()(self.view)(request, **options)
+
+    def test_anonymous_page_is_served_from_cache(self):
+        self.assertEqual(self.get().content, b'Exam schedule')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get().content, b'Exam schedule')
+        self.assertEqual(self.renders, 1)
+
+    def test_saving_a_read_model_invalidates(self):
+        self.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            QuestionPaper.objects.create(title='Unrelated', subject='english', semester='1', degree_type='ba', academic_year='2024-2025')
+        self.get()
+        self.assertEqual(self.renders, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.notice.title = 'Revised exam schedule'
+            self.notice.save()
+        self.assertEqual(self.get().content, b'Revised exam schedule')
+        self.assertEqual(self.renders, 2)
+
+    def test_logged_in_user_bypasses(self):
+        self.get()
+        self.get(user=get_user_model()(username='staff'))
+        self.assertEqual(self.renders, 2)
+
+    def test_pending_messages_bypass(self):
+        self.get()
+        self.get(pending_message=True)
+        self.assertEqual(self.renders, 2)
+
+    def test_pages_not_stored(self):
+        for options in ({'csrf': True}, {'add_message': True}):
+            self.get(**options)
+            self.get(**options)
+        self.assertEqual(self.renders, 4)
+        self.get()
+        self.get()
+        self.assertEqual(self.renders, 5)
+
+
+class MenuItemTreeTests(TestCase):
+    """Materialized tree_path and depth maintained by MenuItem.save"""
+
+    def setUp(self):
+        self.menu = Menu.objects.create(title='Main')
+        self.root = self.item('Root')
+        self.child = self.item('Child', self.root)
+        self.grandchild = self.item('Grandchild', self.child)
+        self.other = self.item('Other')
+
+    def item(self, title, parent=None):
+        return MenuItem.objects.create(menu=self.menu, title=title, parent=parent)
+
+    def path(self, *items):
+        return ''.join(MenuItem.path_segment(item.pk) for item in items)
+
+    def test_paths_and_depths(self):
+        self.assertEqual(self.root.tree_path, self.path(self.root))
+        self.assertEqual(self.grandchild.tree_path, self.path(self.root, self.child, self.grandchild))
+        self.assertEqual([self.root.depth, self.child.depth, self.grandchild.depth], [0, 1, 2])
+        self.assertEqual(self.grandchild.ancestor_ids, [self.root.pk, self.child.pk])
+
+    def test_ancestors_and_descendants(self):
+        self.assertEqual(list(self.grandchild.get_ancestors()), [self.root, self.child])
+        self.assertEqual(list(self.grandchild.get_ancestors(include_self=True)), [self.root, self.child, self.grandchild])
+        self.assertEqual(list(self.root.get_descendants()), [self.child, self.grandchild])
+        self.assertEqual(list(self.root.get_descendants(include_self=True)), [self.root, self.child, self.grandchild])
+        self.assertTrue(self.grandchild.is_descendant_of(self.root))
+        self.assertFalse(self.root.is_descendant_of(self.grandchild))
+        self.assertFalse(self.root.is_descendant_of(self.root))
+        self.assertEqual(self.grandchild.get_full_path(), 'root/child/grandchild')
+
+    def test_move_rewrites_subtree(self):
+        self.child.parent = self.other
+        self.child.save()
+        self.grandchild.refresh_from_db()
+        self.assertEqual(self.grandchild.tree_path, self.path(self.other, self.child, self.grandchild))
+        self.assertEqual(self.grandchild.depth, 2)
+        self.assertEqual(list(self.root.get_descendants()), [])
+
+        self.child.parent = None
+        self.child.save()
+        self.grandchild.refresh_from_db()
+        self.assertEqual(self.grandchild.tree_path, self.path(self.child, self.grandchild))
+        self.assertEqual(self.grandchild.depth, 1)
+
+    def test_move_under_own_subtree_is_rejected(self):
+        for parent in (self.root, self.grandchild):
+            self.root.parent = parent
+            with self.assertRaises(ValidationError):
+                self.root.full_clean()
+            with self.assertRaises(ValidationError):
+                self.root.save()
+            self.root.refresh_from_db()
+            self.assertIsNone(self.root.parent_id)
+            self.assertEqual(self.root.tree_path, self.path(self.root))
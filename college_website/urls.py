@@ -1,6 +1,7 @@
 from django.urls import path, include
 from . import views
 from . import navbar_views
+from . import metrics_views
 
 app_name = 'college_website'
 
@@ -11,14 +12,11 @@ urlpatterns = [
     # Menu Test (for debugging)
     path('menu-test/', views.menu_test_view, name='menu_test'),
     
-<<<<<<< HEAD
     # Navbar Configuration
     path('admin/navbar-config/', navbar_views.navbar_config_view, name='navbar_config'),
     path('admin/navbar-config/reset/', navbar_views.navbar_config_reset, name='navbar_config_reset'),
     path('admin/navbar-preview/', navbar_views.navbar_preview, name='navbar_preview'),
     
-=======
->>>>>>> a11168e (Fix)
     # Home Section
     path('home/', include([
         path('', views.home_view, name='home_index'),
@@ -138,6 +136,7 @@ urlpatterns = [
     path('iqac/', include([
         path('', views.iqac_view, name='iqac'),
         path('reports/', views.iqac_reports_view, name='iqac_reports'),
+        path('reports/<slug:slug>/download/', views.iqac_report_download_view, name='iqac_report_download'),
         path('naac/', views.naac_view, name='naac'),
         path('nirf/', views.nirf_view, name='nirf'),
         path('accreditation/', views.accreditation_view, name='accreditation'),
@@ -210,6 +209,8 @@ urlpatterns = [
     path('programs/<slug:slug>/', views.ProgramDetailView.as_view(), name='program_detail'),
     path('notices/', views.NoticesListView.as_view(), name='notices_list'),
     path('notices/<slug:slug>/', views.NoticeDetailView.as_view(), name='notice_detail'),
+    path('notices/<slug:slug>/attachment/', views.notice_attachment_view, name='notice_attachment'),
+    path('downloads/<int:pk>/', views.download_file_view, name='download_file'),
     path('social-impact/', views.SocialImpactView.as_view(), name='social_impact'),
     path('social-impact/<slug:slug>/', views.SocialInitiativeDetailView.as_view(), name='social_initiative_detail'),
     path('student-corner/', views.student_corner_view, name='student_corner'),
@@ -217,6 +218,7 @@ urlpatterns = [
     path('gallery/<slug:slug>/', views.GalleryDetailView.as_view(), name='gallery_detail'),
     path('achievements/', views.achievements_view, name='achievements'),
     path('search/', views.search_view, name='search'),
+    path('search/autocomplete/', views.search_autocomplete_view, name='search_autocomplete'),
     path('e-learning/', views.ELearningListView.as_view(), name='elearning'),
     path('e-learning/<slug:slug>/', views.ELearningDetailView.as_view(), name='elearning_detail'),
     path('placements/', views.PlacementsListView.as_view(), name='placements'),
@@ -228,6 +230,7 @@ urlpatterns = [
     path('navigation-demo/', views.navigation_demo_view, name='navigation_demo'),
     path('test-nav/', views.test_navigation_view, name='test_navigation'),
     path('simple-nav-test/', views.simple_nav_test_view, name='simple_nav_test'),
+    path('navbar/styles.<str:digest>.css', navbar_views.navbar_stylesheet, name='navbar_stylesheet'),
     
     # Hero Banner Management
     path('hero-banner/', views.hero_banner_management, name='hero_banner_management'),
@@ -235,6 +238,9 @@ urlpatterns = [
     # Hero Banner Management
     path('hero-banner/', views.hero_banner_management, name='hero_banner_management'),
     
+    # Per-view latency and query metrics for staff
+    path('staff/request-metrics/', metrics_views.request_metrics_view, name='request_metrics'),
+    
     # Dynamic CMS Pages (must be last to avoid conflicts)
     path('p/<slug:slug>/', views.DynamicPageView.as_view(), name='page_detail'),
 ]
@@ -1,10 +1,15 @@
+import hashlib
+import json
 
 from django.shortcuts import render, get_object_or_404, redirect
 from django.core.paginator import Paginator
 from django.contrib import messages
-from django.db.models import Q
-from django.http import Http404
+from django.db.models import Count, Prefetch, Q
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.views.decorators.http import require_safe
+from django.core.cache import cache
 from django.views.generic import ListView, DetailView
+from django.utils.decorators import method_decorator
 from django.utils import timezone
 from django.core.mail import send_mail
 from django.conf import settings
@@ -14,46 +19,50 @@ from .models import (
     CollegeInfo, Program, Event, Notice, SocialInitiative,
     StudentTestimonial, ImportantLink, ContactMessage, Page,
     Menu, MenuItem, BlockRichText, BlockImageGallery, BlockVideoEmbed,
-    BlockDownloadList, BlockTableHTML, BlockForm, Gallery, GalleryPhoto,
+    BlockDownloadList, DownloadFile, BlockTableHTML, BlockForm, Gallery, GalleryPhoto,
     AdmissionInfo, ExamResult, LibraryResource, ELearningCourse, QuestionPaper,
     PlacementRecord, AlumniProfile, DirectorMessage, PrincipalMessage,
     IQACInfo, IQACReport, NAACInfo, NIRFInfo, AccreditationInfo, 
-    IQACFeedback, QualityInitiative, SideMenu, SideMenuItem, Department,
+    IQACFeedback, QualityInitiative, SideMenu, SideMenuItem, Department, Faculty,
     HeroBanner, ExamTimetable, ExamTimetableWeek, ExamTimetableExam, RevaluationInfo, ExamRulesInfo, ResearchCenterInfo,
     PublicationInfo, Publication, PatentsProjectsInfo, Patent, ResearchProject, IndustryCollaboration,
-<<<<<<< HEAD
-    ConsultancyInfo, ConsultancyService, ConsultancyExpertise, ConsultancySuccessStory,
-    HeroCarouselSlide, HeroCarouselSettings
-)
-from .forms import ContactForm, SearchForm, ExamTimetableBulkForm, ExamTimetableWeekForm, ExamTimetableExamForm, ProgramForm, ProgramCreateForm, ProgramUpdateForm, ProgramQuickEditForm, ExamTimetableForm
-=======
     ConsultancyInfo, ConsultancyService, ConsultancyExpertise, ConsultancySuccessStory
 )
-from .forms import ContactForm, ProgramForm
->>>>>>> a11168e (Fix)
+from .forms import ContactForm, SearchForm, ExamTimetableBulkForm, ExamTimetableWeekForm, ExamTimetableExamForm, ProgramForm, ProgramCreateForm, ProgramUpdateForm, ProgramQuickEditForm, ExamTimetableForm
+from .site_chrome import get_site_chrome
+from .side_menus import get_side_menu_matcher
+from .search import SearchResults
+from .autocomplete import normalize_prefix, get_prefix_index, DEFAULT_LIMIT, MAX_LIMIT
+from .downloads import serve_file, serve_field_file
+from .counters import increment
+from .page_cache import cache_anonymous_page
+from .scheduled_content import get_live_slider_images
+from .publishing import get_publishing_window
+from .conditional_get import conditional_detail
 
 
 def get_college_info():
     """Helper function to get active college info"""
-    return CollegeInfo.objects.filter(is_active=True).first()
+    return get_site_chrome().college_info
 
 
 def get_side_menus_for_request(request):
     """Helper function to get active side menus for the current request"""
-    side_menus = []
-    all_menus = SideMenu.objects.filter(is_active=True).order_by('-priority')
-    
-    for menu in all_menus:
-        if menu.matches_request(request):
-            side_menus.append(menu)
+    return get_side_menu_matcher().match(request)
+
+
+class ViewCountMixin:
+    """Count a view of the object each time a detail page is rendered"""
     
-    return side_menus
+    def get_object(self, queryset=None):
+        obj = super().get_object(queryset)
+        increment(obj, 'view_count')
+        return obj
 
 
+@cache_anonymous_page()
 def home_view(request):
     """Homepage view"""
-    from .models import SliderImage
-    
     college_info = get_college_info()
     recent_notices = Notice.objects.filter(is_active=True)[:5]
     recent_events = Event.objects.filter(is_active=True)[:5]
@@ -64,26 +73,12 @@ def home_view(request):
     director_message = DirectorMessage.objects.filter(is_active=True, show_on_homepage=True).first()
     principal_message = PrincipalMessage.objects.filter(is_active=True, show_on_homepage=True).first()
 
-<<<<<<< HEAD
-    # Get active hero banner
-    active_hero_banner = HeroBanner.objects.filter(is_active=True).first()
-=======
     # Get all active hero banners for carousel
     active_hero_banners = HeroBanner.objects.filter(is_active=True).order_by('order', '-created_at')
->>>>>>> a11168e (Fix)
     
-    # Get slider images
-    slider_images = SliderImage.objects.filter(is_active=True).order_by('ordering')
+    # Get slider images that are live on their schedule
+    slider_images = get_live_slider_images()
 
-<<<<<<< HEAD
-    # Get hero carousel data
-    hero_carousel_settings = HeroCarouselSettings.get_settings()
-    hero_carousel_slides = HeroCarouselSlide.objects.filter(
-        is_active=True
-    ).order_by('display_order', 'created_at')
-
-=======
->>>>>>> a11168e (Fix)
     # News & Announcements - Only "general" announcements
     recent_announcements = Notice.objects.filter(
         is_active=True, category="general"
@@ -98,15 +93,8 @@ def home_view(request):
         'director_message': director_message,
         'principal_message': principal_message,
         'recent_announcements': recent_announcements,
-<<<<<<< HEAD
-        'active_hero_banner': active_hero_banner,
-        'slider_images': slider_images,
-        'hero_carousel_settings': hero_carousel_settings,
-        'hero_carousel_slides': hero_carousel_slides,
-=======
         'active_hero_banners': active_hero_banners,
         'slider_images': slider_images,
->>>>>>> a11168e (Fix)
     }
     return render(request, 'college_website/home.html', context)
 
@@ -120,6 +108,7 @@ def menu_test_view(request):
     return render(request, 'college_website/menu_test.html', context)
 
 
+@cache_anonymous_page()
 def about_view(request):
     """About page view"""
     college_info = get_college_info()
@@ -193,7 +182,8 @@ class ProgramsListView(ListView):
         return context
 
 
-class ProgramDetailView(DetailView):
+@method_decorator(conditional_detail(Program.objects.filter(is_active=True), {'slug': 'slug'}, count_views=True), name='dispatch')
+class ProgramDetailView(ViewCountMixin, DetailView):
     """Program detail view"""
     model = Program
     template_name = 'college_website/program_detail.html'
@@ -226,7 +216,11 @@ class EventsListView(ListView):
         return context
 
 
-class EventDetailView(DetailView):
+@method_decorator(
+    conditional_detail(Event.objects.filter(is_active=True), {'slug': 'slug'}, related=['images'], count_views=True),
+    name='dispatch',
+)
+class EventDetailView(ViewCountMixin, DetailView):
     """Event detail view"""
     model = Event
     template_name = 'college_website/event_detail.html'
@@ -259,7 +253,8 @@ class NoticesListView(ListView):
         return context
 
 
-class NoticeDetailView(DetailView):
+@method_decorator(conditional_detail(Notice.objects.filter(is_active=True), {'slug': 'slug'}, count_views=True), name='dispatch')
+class NoticeDetailView(ViewCountMixin, DetailView):
     """Notice detail view"""
     model = Notice
     template_name = 'college_website/notice_detail.html'
@@ -271,6 +266,12 @@ class NoticeDetailView(DetailView):
         return Notice.objects.filter(is_active=True)
 
 
+def notice_attachment_view(request, slug):
+    """Serve a notice's attachment"""
+    notice = get_object_or_404(Notice, slug=slug, is_active=True)
+    return serve_field_file(request, notice.attachment, as_attachment=False)
+
+
 class SocialImpactView(ListView):
     """Social initiatives view"""
     model = SocialInitiative
@@ -377,6 +378,7 @@ def statutory_approvals_view(request):
     context = {'college_info': college_info}
     return render(request, 'college_website/statutory_approvals.html', context)
 
+@cache_anonymous_page()
 def infrastructure_view(request):
     """Infrastructure view with dynamic content"""
     from .models import (
@@ -463,6 +465,7 @@ def code_of_conduct_policy_view(request):
     return render(request, 'college_website/code_of_conduct_policy.html', context)
 
 # Academics Section Views
+@cache_anonymous_page()
 def academics_view(request):
     """Academics main view with comprehensive data"""
     college_info = get_college_info()
@@ -521,16 +524,15 @@ def academic_faculties_view(request):
     
     # Get all active faculty members grouped by department
     faculty_by_department = {}
-    departments = Department.objects.filter(is_active=True).prefetch_related('faculty_members')
+    departments = Department.objects.filter(is_active=True).prefetch_related(Prefetch(
+        'faculty_members',
+        queryset=Faculty.objects.filter(is_active=True, show_on_website=True).order_by('designation_order', 'name'),
+        to_attr='website_faculty',
+    ))
     
     for dept in departments:
-        faculty_members = dept.faculty_members.filter(
-            is_active=True, 
-            show_on_website=True
-        ).order_by('designation_order', 'name')
-        
-        if faculty_members.exists():
-            faculty_by_department[dept] = faculty_members
+        if dept.website_faculty:
+            faculty_by_department[dept] = dept.website_faculty
     
     context = {
         'college_info': college_info,
@@ -546,16 +548,15 @@ def non_academic_faculties_view(request):
     
     # Get all active non-academic staff grouped by department
     staff_by_department = {}
-    departments = Department.objects.filter(is_active=True).prefetch_related('non_academic_staff')
+    departments = Department.objects.filter(is_active=True).prefetch_related(Prefetch(
+        'non_academic_staff',
+        queryset=NonAcademicStaff.objects.filter(is_active=True, show_on_website=True).order_by('designation_order', 'name'),
+        to_attr='website_staff',
+    ))
     
     for dept in departments:
-        staff_members = dept.non_academic_staff.filter(
-            is_active=True, 
-            show_on_website=True
-        ).order_by('designation_order', 'name')
-        
-        if staff_members.exists():
-            staff_by_department[dept] = staff_members
+        if dept.website_staff:
+            staff_by_department[dept] = dept.website_staff
     
     context = {
         'college_info': college_info,
@@ -563,6 +564,11 @@ def non_academic_faculties_view(request):
     }
     return render(request, 'college_website/non_academic_faculties.html', context)
 
+@conditional_detail(
+    Faculty.objects.filter(is_active=True, show_on_website=True),
+    {'dept_slug': 'department__slug', 'slug': 'slug'},
+    related=['department', 'department__faculty_members'],
+)
 def faculty_detail_view(request, dept_slug, slug):
     """Individual faculty member detail view"""
     from .models import Faculty, Department
@@ -795,215 +801,41 @@ def academic_calendar_view(request):
 
 def academic_calendar_pdf_view(request, year):
     """Download PDF for academic calendar by year - either uploaded file or generated from data"""
-    from django.http import HttpResponse, Http404, FileResponse
-    from django.shortcuts import get_object_or_404
-    from .models import AcademicCalendar, AcademicEvent
+    from .models import AcademicCalendar
     
     # Get the academic calendar for the specified year
     calendar = get_object_or_404(AcademicCalendar, academic_year=year, is_published=True)
     
     # If there's an uploaded PDF file, serve it directly
     if calendar.pdf_file:
-        # Increment download count
-        calendar.increment_download_count()
-        
-        # Serve the uploaded PDF file
-        response = FileResponse(
-            calendar.pdf_file.open('rb'),
+        return serve_field_file(
+            request,
+            calendar.pdf_file,
+            filename=f"academic_calendar_{year}.pdf",
             content_type='application/pdf',
-            filename=f"academic_calendar_{year}.pdf"
+            on_download=calendar.increment_download_count,
         )
-        response['Content-Disposition'] = f'attachment; filename="academic_calendar_{year}.pdf"'
-        return response
-    
-    # If no uploaded PDF, generate one from the data
-    return generate_academic_calendar_pdf(calendar)
-
-
-def generate_academic_calendar_pdf(calendar):
-    """Generate PDF for academic calendar from model data"""
-    from django.http import HttpResponse
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-    import io
-    from .models import AcademicEvent
-    
-    college_info = get_college_info()
-    
-    # Get events for this calendar
-    events = AcademicEvent.objects.filter(
-        calendar=calendar, 
-        is_published=True
-    ).order_by('start_date', 'ordering')
-    
-    # Create response object
-    response = HttpResponse(content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="academic_calendar_{calendar.academic_year}.pdf"'
-    
-    # Create PDF buffer
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        textColor=colors.darkblue
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        spaceAfter=12,
-        textColor=colors.darkblue
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=14,
-        spaceAfter=8,
-        textColor=colors.darkgreen
-    )
     
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=6
+    # If no uploaded PDF, serve the one generated from the data
+    return generate_academic_calendar_pdf(calendar, request)
+
+
+def generate_academic_calendar_pdf(calendar, request):
+    """Serve the cached PDF generated from the calendar's events
+
+    The file is rendered by calendar_pdf.py when missing; its version stamp
+    doubles as the ETag.
+    """
+    from .calendar_pdf import get_calendar_pdf
+
+    pdf = get_calendar_pdf(calendar)
+    return serve_file(
+        request,
+        pdf.name,
+        filename=f"academic_calendar_{calendar.academic_year}.pdf",
+        content_type='application/pdf',
+        etag=pdf.etag,
     )
-    
-    # Build PDF content
-    story = []
-    
-    # Title
-    story.append(Paragraph(calendar.title, title_style))
-    story.append(Paragraph(f"{college_info.name}", styles['Heading2']))
-    story.append(Paragraph(f"Academic Year: {calendar.academic_year}", styles['Heading3']))
-    if calendar.description:
-        story.append(Paragraph(calendar.description, normal_style))
-    story.append(Spacer(1, 20))
-    
-    # Group events by semester
-    first_semester_events = events.filter(semester__in=['first', 'both'])
-    second_semester_events = events.filter(semester__in=['second', 'both'])
-    
-    # First Semester
-    if first_semester_events.exists():
-        story.append(Paragraph("First Semester (July - December)", heading_style))
-        story.append(Spacer(1, 10))
-        
-        # Group events by month
-        months = {}
-        for event in first_semester_events:
-            month_key = event.start_date.strftime('%B %Y')
-            if month_key not in months:
-                months[month_key] = []
-            months[month_key].append(event)
-        
-        for month, month_events in months.items():
-            story.append(Paragraph(month, subheading_style))
-            
-            # Create table for events
-            table_data = [['Date', 'Event', 'Type']]
-            for event in month_events:
-                date_str = event.start_date.strftime('%d %b')
-                if event.end_date and event.end_date != event.start_date:
-                    date_str += f" - {event.end_date.strftime('%d %b')}"
-                table_data.append([date_str, event.title, event.get_event_type_display()])
-            
-            table = Table(table_data, colWidths=[1*inch, 3.5*inch, 1*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            story.append(table)
-            story.append(Spacer(1, 10))
-    
-    story.append(PageBreak())
-    
-    # Second Semester
-    if second_semester_events.exists():
-        story.append(Paragraph("Second Semester (January - June)", heading_style))
-        story.append(Spacer(1, 10))
-        
-        # Group events by month
-        months = {}
-        for event in second_semester_events:
-            month_key = event.start_date.strftime('%B %Y')
-            if month_key not in months:
-                months[month_key] = []
-            months[month_key].append(event)
-        
-        for month, month_events in months.items():
-            story.append(Paragraph(month, subheading_style))
-            
-            # Create table for events
-            table_data = [['Date', 'Event', 'Type']]
-            for event in month_events:
-                date_str = event.start_date.strftime('%d %b')
-                if event.end_date and event.end_date != event.start_date:
-                    date_str += f" - {event.end_date.strftime('%d %b')}"
-                table_data.append([date_str, event.title, event.get_event_type_display()])
-            
-            table = Table(table_data, colWidths=[1*inch, 3.5*inch, 1*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            story.append(table)
-            story.append(Spacer(1, 10))
-    
-    # Important Notes
-    story.append(PageBreak())
-    story.append(Paragraph("Important Notes", heading_style))
-    story.append(Spacer(1, 10))
-    
-    notes = [
-        "• All dates are subject to change. Please check with the administration for updates.",
-        "• Examination schedules will be published separately before each semester.",
-        "• Holiday dates may vary based on government notifications.",
-        "• For any queries regarding the academic calendar, contact the academic office.",
-        f"• Contact: {college_info.phone} | Email: {college_info.email}"
-    ]
-    
-    for note in notes:
-        story.append(Paragraph(note, normal_style))
-    
-    # Build PDF
-    doc.build(story)
-    
-    # Get PDF content
-    pdf_content = buffer.getvalue()
-    buffer.close()
-    
-    response.write(pdf_content)
-    return response
 
 
 
@@ -1167,7 +999,10 @@ def question_papers_view(request):
         )
     
     # Get available filter options
-    available_subjects = QuestionPaper.get_available_subjects()
+    subject_labels = dict(QuestionPaper.SUBJECT_CHOICES)
+    available_subjects = [
+        (subject, subject_labels.get(subject, subject)) for subject in QuestionPaper.get_available_subjects()
+    ]
     available_semesters = QuestionPaper.get_available_semesters()
     available_years = QuestionPaper.get_available_years()
     
@@ -1461,6 +1296,7 @@ def innovation_incubation_view(request):
     context = {'college_info': college_info}
     return render(request, 'college_website/innovation_incubation.html', context)
 
+@cache_anonymous_page()
 def consultancy_view(request):
     """Consultancy view with dynamic content"""
     college_info = get_college_info()
@@ -1581,7 +1417,9 @@ def exam_timetable_manage(request):
         return redirect('college_website:exam_timetable')
     
     college_info = get_college_info()
-    timetables = ExamTimetable.objects.all().order_by('-academic_year', 'semester')
+    timetables = ExamTimetable.objects.annotate(
+        week_count=Count('weeks', filter=Q(weeks__is_active=True)),
+    ).order_by('-academic_year', 'semester')
     
     if request.method == 'POST':
         bulk_form = ExamTimetableBulkForm(request.POST)
@@ -1747,7 +1585,6 @@ def sports_cultural_view(request):
 def nss_ncc_clubs_view(request):
     """NSS, NCC & Clubs view with dynamic content"""
     from .models import NSSNCCClub, NSSNCCNotice, NSSNCCGallery, NSSNCCAchievement
-    from django.utils import timezone
     
     college_info = get_college_info()
     
@@ -1759,11 +1596,9 @@ def nss_ncc_clubs_view(request):
     
     # Get recent notices (not expired) - get featured notices before slicing
     notices_base = NSSNCCNotice.objects.filter(
+        get_publishing_window(NSSNCCNotice).live_q(timezone.now()),
         is_active=True,
-        publish_date__lte=timezone.now()
-    ).exclude(
-        expiry_date__lt=timezone.now()
-    ).order_by('-publish_date', '-created_at')
+    ).select_related('related_club').order_by('-publish_date', '-created_at')
     
     # Get featured notices (before slicing)
     featured_notices = notices_base.filter(is_featured=True)[:5]
@@ -1772,7 +1607,7 @@ def nss_ncc_clubs_view(request):
     notices = notices_base[:10]
     
     # Get gallery images
-    gallery_images = NSSNCCGallery.objects.filter(is_active=True).order_by('display_order', '-created_at')[:12]
+    gallery_images = NSSNCCGallery.objects.filter(is_active=True).select_related('related_club').order_by('display_order', '-created_at')[:12]
     
     # Get recent achievements
     achievements = NSSNCCAchievement.objects.filter(is_active=True).order_by('-achievement_date', 'display_order')[:6]
@@ -1792,18 +1627,15 @@ def nss_ncc_clubs_view(request):
 def nss_ncc_notices_view(request):
     """View all NSS-NCC notices"""
     from .models import NSSNCCNotice, NSSNCCClub
-    from django.utils import timezone
     from django.core.paginator import Paginator
     
     college_info = get_college_info()
     
     # Get all active notices (not expired)
     notices = NSSNCCNotice.objects.filter(
+        get_publishing_window(NSSNCCNotice).live_q(timezone.now()),
         is_active=True,
-        publish_date__lte=timezone.now()
-    ).exclude(
-        expiry_date__lt=timezone.now()
-    ).order_by('-publish_date', '-created_at')
+    ).select_related('related_club').order_by('-publish_date', '-created_at')
     
     # Get all active clubs for filtering
     clubs = NSSNCCClub.objects.filter(is_active=True).order_by('name')
@@ -1911,6 +1743,7 @@ def alumni_view(request):
     return render(request, 'college_website/alumni.html', context)
 
 # IQAC Section Views
+@cache_anonymous_page()
 def iqac_view(request):
     """IQAC main view with comprehensive information"""
     college_info = get_college_info()
@@ -2008,6 +1841,18 @@ def iqac_reports_view(request):
     }
     return render(request, 'college_website/iqac_reports.html', context)
 
+
+def iqac_report_download_view(request, slug):
+    """Serve a published IQAC report"""
+    report = get_object_or_404(IQACReport, slug=slug, is_published=True)
+    return serve_field_file(
+        request,
+        report.report_file,
+        as_attachment=False,
+        on_download=report.increment_download_count,
+    )
+
+
 def naac_view(request):
     """NAAC accreditation view with detailed information"""
     college_info = get_college_info()
@@ -2380,7 +2225,13 @@ def gallery_view(request):
     return render(request, 'college_website/gallery.html', context)
 
 
-class GalleryDetailView(DetailView):
+@method_decorator(
+    conditional_detail(
+        Gallery.objects.filter(is_active=True), {'slug': 'slug'}, related=['photos'], models=[Gallery], count_views=True,
+    ),
+    name='dispatch',
+)
+class GalleryDetailView(ViewCountMixin, DetailView):
     """Individual gallery detail view with photos"""
     model = Gallery
     template_name = 'college_website/gallery_detail.html'
@@ -2403,7 +2254,7 @@ class GalleryDetailView(DetailView):
         related_galleries = Gallery.objects.filter(
             is_active=True, 
             category=gallery.category
-        ).exclude(id=gallery.id)[:4]
+        ).exclude(id=gallery.id).prefetch_related('photos')[:4]
         context['related_galleries'] = related_galleries
         
         return context
@@ -2418,6 +2269,16 @@ def achievements_view(request):
     return render(request, 'college_website/achievements.html', context)
 
 
+@method_decorator(
+    conditional_detail(
+        Page.objects.filter(is_active=True), {'slug': 'slug'},
+        related=[
+            'rich_text_blocks', 'gallery_blocks', 'gallery_blocks__images', 'video_blocks',
+            'download_blocks', 'download_blocks__files', 'table_blocks', 'form_blocks',
+        ],
+    ),
+    name='dispatch',
+)
 class DynamicPageView(DetailView):
     """Dynamic CMS page view"""
     model = Page
@@ -2463,6 +2324,17 @@ class DynamicPageView(DetailView):
         return context
 
 
+def download_file_view(request, pk):
+    """Serve a file from a page's download block"""
+    download = get_object_or_404(
+        DownloadFile,
+        pk=pk,
+        download_list__is_active=True,
+        download_list__page__is_active=True,
+    )
+    return serve_field_file(request, download.file)
+
+
 def search_view(request):
     """Search functionality"""
     form = SearchForm(request.GET or None)
@@ -2472,75 +2344,14 @@ def search_view(request):
     
     if form.is_valid():
         query = form.cleaned_data['q']
-        category = form.cleaned_data.get('category', 'all')
+        category = form.cleaned_data.get('category') or 'all'
         
         if query:
-            # Search in different models based on category
-            if category == 'all' or category == 'notice':
-                notices = Notice.objects.filter(
-                    Q(title__icontains=query) | Q(content__icontains=query),
-                    is_active=True
-                )
-                for notice in notices:
-                    results.append({
-                        'type': 'notice',
-                        'title': notice.title,
-                        'content': notice.content[:200] + '...' if len(notice.content) > 200 else notice.content,
-                        'url': notice.get_absolute_url(),
-                        'date': notice.publish_date,
-                    })
-            
-            if category == 'all' or category == 'event':
-                events = Event.objects.filter(
-                    Q(title__icontains=query) | Q(description__icontains=query),
-                    is_active=True
-                )
-                for event in events:
-                    results.append({
-                        'type': 'event',
-                        'title': event.title,
-                        'content': event.description[:200] + '...' if len(event.description) > 200 else event.description,
-                        'url': event.get_absolute_url(),
-                        'date': event.date,
-                    })
-            
-            if category == 'all' or category == 'program':
-                programs = Program.objects.filter(
-                    Q(name__icontains=query) | Q(description__icontains=query),
-                    is_active=True
-                )
-                for program in programs:
-                    results.append({
-                        'type': 'program',
-                        'title': program.name,
-                        'content': program.description[:200] + '...' if len(program.description) > 200 else program.description,
-                        'url': program.get_absolute_url(),
-                        'date': program.created_at,
-                    })
-            
-            if category == 'all' or category == 'page':
-                pages = Page.objects.filter(
-                    Q(title__icontains=query) | Q(meta_description__icontains=query),
-                    is_active=True
-                )
-                for page in pages:
-                    results.append({
-                        'type': 'page',
-                        'title': page.title,
-                        'content': page.meta_description or 'Page content...',
-                        'url': page.get_absolute_url(),
-                        'date': page.created_at,
-                    })
-            
-            total_count = len(results)
-            
-            # Sort results by date (newest first)
-            results.sort(key=lambda x: x['date'], reverse=True)
-            
-            # Paginate results
-            paginator = Paginator(results, 10)
-            page_number = request.GET.get('page')
-            results = paginator.get_page(page_number)
+            # Ranked hits come straight from the full-text index, one page at a time
+            hits = SearchResults(query, doc_type=None if category == 'all' else category)
+            paginator = Paginator(hits, 10)
+            results = paginator.get_page(request.GET.get('page'))
+            total_count = paginator.count
     
     context = {
         'form': form,
@@ -2551,6 +2362,42 @@ def search_view(request):
     return render(request, 'college_website/search.html', context)
 
 
+# Serialized suggestion lists, keyed by index version, limit and normalized prefix
+AUTOCOMPLETE_RESPONSE_KEY = 'autocomplete:{version}:{limit}:{digest}'
+AUTOCOMPLETE_CACHE_CONTROL = 'public, max-age=300'
+AUTOCOMPLETE_CACHE_TIMEOUT = 300
+
+
+@require_safe
+def search_autocomplete_view(request):
+    """JSON typeahead suggestions for the navbar search box"""
+    prefix = normalize_prefix(request.GET.get('q', ''))
+    try:
+        limit = max(1, min(int(request.GET.get('limit', DEFAULT_LIMIT)), MAX_LIMIT))
+    except ValueError:
+        limit = DEFAULT_LIMIT
+    
+    index, version = get_prefix_index()
+    # Prefixes may contain spaces, which cache keys must not
+    digest = hashlib.md5(prefix.encode()).hexdigest()
+    etag = f'"{version[:12]}-{limit}-{digest[:12]}"'
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+    else:
+        cache_key = AUTOCOMPLETE_RESPONSE_KEY.format(version=version, limit=limit, digest=digest)
+        body = cache.get(cache_key)
+        if body is None:
+            body = json.dumps({
+                'query': prefix,
+                'suggestions': [suggestion.as_dict() for suggestion in index.lookup(prefix, limit)],
+            })
+            cache.set(cache_key, body, timeout=AUTOCOMPLETE_CACHE_TIMEOUT)
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    response['Cache-Control'] = AUTOCOMPLETE_CACHE_CONTROL
+    return response
+
+
 def test_navbar_view(request):
     """Test view to check navbar"""
     return render(request, 'test_navbar.html')
@@ -2860,18 +2707,27 @@ class DepartmentListView(ListView):
         context = super().get_context_data(**kwargs)
         discipline = self.request.GET.get('discipline')
         
+        # Counts are passed uncalled so the template only runs them when the
+        # cached fragment has to be rebuilt
         context.update({
             'current_discipline': discipline,
             'discipline_choices': Department.DISCIPLINE_CHOICES,
-            'total_departments': Department.objects.filter(is_active=True).count(),
-            'science_count': Department.objects.filter(is_active=True, discipline='science').count(),
-            'arts_count': Department.objects.filter(is_active=True, discipline='arts').count(),
-            'commerce_count': Department.objects.filter(is_active=True, discipline='commerce').count(),
+            'total_departments': Department.objects.filter(is_active=True).count,
+            'science_count': Department.objects.filter(is_active=True, discipline='science').count,
+            'arts_count': Department.objects.filter(is_active=True, discipline='arts').count,
+            'commerce_count': Department.objects.filter(is_active=True, discipline='commerce').count,
             'featured_departments': Department.objects.filter(is_active=True, is_featured=True)[:3],
         })
         return context
 
 
+@method_decorator(
+    conditional_detail(
+        Department.objects.filter(is_active=True), {'slug': 'slug'},
+        related=['faculty_members', 'department_events'], models=[Department, Program],
+    ),
+    name='dispatch',
+)
 class DepartmentDetailView(DetailView):
     """Detail view for individual department"""
     model = Department
@@ -2883,7 +2739,7 @@ class DepartmentDetailView(DetailView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        department = self.get_object()
+        department = self.object
         
         # Get related programs
         related_programs = department.get_programs()
@@ -3135,6 +2991,8 @@ def program_detail_view(request, slug):
         messages.error(request, 'Program not found or not available.')
         return redirect('college_website:programs')
     
+    increment(program, 'view_count')
+    
     # Get related programs
     related_programs = Program.objects.filter(
         is_active=True,
@@ -3358,20 +3216,15 @@ def question_paper_download_view(request, slug):
     try:
         question_paper = QuestionPaper.objects.get(slug=slug, is_active=True)
         
-        # Increment download count
-        question_paper.increment_download_count()
-        
-        # Return file response
-        from django.http import FileResponse
-        return FileResponse(
+        return serve_field_file(
+            request,
             question_paper.question_paper_file,
-            as_attachment=True,
-            filename=f"{question_paper.title}.pdf"
+            filename=f"{question_paper.title}.pdf",
+            on_download=question_paper.increment_download_count,
         )
     except QuestionPaper.DoesNotExist:
         messages.error(request, 'Question paper not found.')
         return redirect('college_website:question_papers')
-<<<<<<< HEAD
 
 
 def navigation_demo_view(request):
@@ -3393,5 +3246,3 @@ def test_navigation_view(request):
 def simple_nav_test_view(request):
     """Ultra-simple navigation test page"""
     return render(request, 'simple_nav_test.html')
-=======
->>>>>>> a11168e (Fix)
@@ -0,0 +1,132 @@
+/**
+ * Search autocomplete
+ * Typeahead suggestions for search inputs carrying data-autocomplete-url
+ */
+
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('input[data-autocomplete-url]').forEach(initializeAutocomplete);
+});
+
+const AUTOCOMPLETE_MIN_LENGTH = 2;
+const AUTOCOMPLETE_DELAY = 150;
+
+/**
+ * Match the server-side normalization so the browser cache sees one URL per prefix
+ */
+function normalizeAutocompletePrefix(value) {
+    return value.normalize('NFKD')
+        .replace(/[\u0300-\u036f]/g, '')
+        .toLowerCase()
+        .replace(/[^\p{L}\p{N}_]+/gu, ' ')
+        .trim()
+        .slice(0, 50);
+}
+
+function initializeAutocomplete(input) {
+    const url = input.dataset.autocompleteUrl;
+    const menu = document.createElement('ul');
+    menu.className = 'dropdown-menu search-autocomplete-menu';
+    menu.setAttribute('role', 'listbox');
+    menu.style.width = '100%';
+    input.setAttribute('autocomplete', 'off');
+    input.parentNode.style.position = 'relative';
+    input.parentNode.appendChild(menu);
+
+    let timer = null;
+    let controller = null;
+    let activeIndex = -1;
+
+    function hide() {
+        menu.classList.remove('show');
+        menu.innerHTML = '';
+        activeIndex = -1;
+    }
+
+    function render(suggestions) {
+        menu.innerHTML = '';
+        activeIndex = -1;
+        if (!suggestions.length) {
+            hide();
+            return;
+        }
+        suggestions.forEach(function(suggestion) {
+            const item = document.createElement('li');
+            const link = document.createElement('a');
+            link.className = 'dropdown-item d-flex justify-content-between align-items-center';
+            link.href = suggestion.url;
+            link.setAttribute('role', 'option');
+
+            const title = document.createElement('span');
+            title.className = 'text-truncate me-2';
+            title.textContent = suggestion.title;
+            const label = document.createElement('small');
+            label.className = 'text-muted';
+            label.textContent = suggestion.label;
+
+            link.appendChild(title);
+            link.appendChild(label);
+            item.appendChild(link);
+            menu.appendChild(item);
+        });
+        menu.classList.add('show');
+    }
+
+    function fetchSuggestions() {
+        const prefix = normalizeAutocompletePrefix(input.value);
+        if (prefix.length < AUTOCOMPLETE_MIN_LENGTH) {
+            hide();
+            return;
+        }
+        if (controller) {
+            controller.abort();
+        }
+        controller = new AbortController();
+        fetch(url + '?q=' + encodeURIComponent(prefix), {signal: controller.signal})
+            .then(function(response) { return response.ok ? response.json() : {suggestions: []}; })
+            .then(function(data) {
+                if (normalizeAutocompletePrefix(input.value) === data.query) {
+                    render(data.suggestions);
+                }
+            })
+            .catch(function() {});
+    }
+
+    function highlight(index) {
+        const links = menu.querySelectorAll('.dropdown-item');
+        if (!links.length) {
+            return;
+        }
+        activeIndex = (index + links.length) % links.length;
+        links.forEach(function(link, position) {
+            link.classList.toggle('active', position === activeIndex);
+        });
+    }
+
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        timer = setTimeout(fetchSuggestions, AUTOCOMPLETE_DELAY);
+    });
+
+    input.addEventListener('keydown', function(event) {
+        if (!menu.classList.contains('show')) {
+            return;
+        }
+        if (event.key === 'ArrowDown') {
+            event.preventDefault();
+            highlight(activeIndex + 1);
+        } else if (event.key === 'ArrowUp') {
+            event.preventDefault();
+            highlight(activeIndex - 1);
+        } else if (event.key === 'Enter' && activeIndex >= 0) {
+            event.preventDefault();
+            window.location.href = menu.querySelectorAll('.dropdown-item')[activeIndex].href;
+        } else if (event.key === 'Escape') {
+            hide();
+        }
+    });
+
+    input.addEventListener('blur', function() {
+        // Let clicks on a suggestion land before the menu disappears
+        setTimeout(hide, 200);
+    });
+}